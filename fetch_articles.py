@@ -18,6 +18,7 @@ import time
 import json
 import pprint as _pprint
 import argparse
+import atexit
 import pathlib
 import random
 from typing import List, Dict, Optional
@@ -32,6 +33,8 @@ from email.header import Header
 import xml.etree.ElementTree as ET
 from urllib.parse import urljoin
 import logging
+import threading
+import hashlib
 from types import SimpleNamespace
 
 try:
@@ -107,6 +110,11 @@ GEMINI_MAX_DELAY = 1200.0        # 既定 120.0 → 1200.0
 # 翻訳のバッチサイズ（瞬間負荷を下げる）
 TRANSLATION_BATCH_SIZE = 2      # 既定 3 → 2
 
+# 要約の複数記事まとめ（JSON配列で1リクエスト）。本文長から見積もったトークン予算内で詰める
+SUMMARY_BATCH_ENABLED = os.getenv("SUMMARY_BATCH", "1") == "1"
+SUMMARY_BATCH_MAX_ITEMS = int(os.getenv("SUMMARY_BATCH_MAX_ITEMS", "5"))
+SUMMARY_BATCH_TOKEN_BUDGET = int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", "12000"))  # 記事入力分（共通ルールは除く）
+
 # 乱数ジッター付き指数バックオフ
 def _exp_backoff_sleep(attempt: int, base_delay: float, max_delay: float) -> float:
     """
@@ -222,7 +230,13 @@ def _usage_from_resp(resp):
         ud["cache_creation_input_token_count"] = get(
             "cache_creation_input_token_count", 0
         )
-        ud["cache_read_input_token_count"] = get("cache_read_input_token_count", 0)
+        # Gemini の明示キャッシュ（cached_content）命中分は cached_content_token_count で返る
+        ud["cache_read_input_token_count"] = get(
+            "cache_read_input_token_count", get("cached_content_token_count", 0)
+        ) or 0
+        ud["uncached_prompt_token_count"] = max(
+            0, int(ud.get("prompt_token_count") or 0) - int(ud["cache_read_input_token_count"] or 0)
+        )
     return ud
 
 
@@ -237,13 +251,14 @@ def _log_gemini_usage(resp, *, tag: str = "gen", model: str = ""):
             **u,
         }
         print(
-            "📊 TOKENS[{tag}] in={in_} out={out} total={tot} (cache create/read={cc}/{cr})".format(
+            "📊 TOKENS[{tag}] in={in_} (cached/uncached={cr}/{un}) out={out} total={tot} (cache create={cc})".format(
                 tag=tag,
                 in_=rec.get("prompt_token_count", 0),
+                cr=rec.get("cache_read_input_token_count", 0),
+                un=rec.get("uncached_prompt_token_count", rec.get("prompt_token_count", 0)),
                 out=rec.get("candidates_token_count", 0),
                 tot=rec.get("total_token_count", 0),
                 cc=rec.get("cache_creation_input_token_count", 0),
-                cr=rec.get("cache_read_input_token_count", 0),
             )
         )
         try:
@@ -376,6 +391,727 @@ _FREE_TIER_CHECK_ENABLED = str(os.getenv("GEMINI_FREE_TIER_CHECK", "1")).lower()
 _FREE_TIER_MON = _FreeTierWatch() if _FREE_TIER_CHECK_ENABLED else None
 
 
+# === クォータスケジューラ（API キー × モデルごとの RPM / 入力TPM / Requests per Day） ===
+# 固定の「1件ごと0.6秒 / バッチごと60秒」待ちの代わりに、直近60秒の実績から
+# 次の1件を送ってよい時刻をちょうど計算して、その分だけ待つ。
+# - 送信前に入力トークンの見積りで枠を予約し、応答後に _usage_from_resp の実績で置き換える
+# - 上限は GEMINI_FREE_RPM / GEMINI_FREE_TPM / GEMINI_FREE_RPD（_FreeTierWatch と同じ）。
+#   モデル別は GEMINI_FREE_RPM_GEMINI_2_5_FLASH_LITE のように末尾にモデル名を付けて上書き
+# - Requests per Day の当日件数は .llm_cache/gemini_quota_days.json に保存し、
+#   同じ MMT 日の collect / collect-to-sheet / build-bundle の実行をまたいで数える
+# - GEMINI_SCHEDULER=0 で無効化（従来の固定スリープに戻る）
+GEMINI_SCHEDULER_ENABLED = str(os.getenv("GEMINI_SCHEDULER", "1")).lower() not in ("0", "false", "off")
+GEMINI_QUOTA_STATE_PATH = os.getenv("GEMINI_QUOTA_STATE_PATH") or os.path.join(
+    os.getenv("LLM_CACHE_DIR", ".llm_cache"), "gemini_quota_days.json"
+)
+
+
+def _model_quota_limit(name: str, model: str, default: int) -> int:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", model or "").strip("_").upper()
+    raw = (os.getenv(f"{name}_{slug}") if slug else None) or os.getenv(name)
+    try:
+        return max(1, int(raw)) if raw else default
+    except ValueError:
+        return default
+
+
+_MYANMAR_CHAR_RE = re.compile(r"[\u1000-\u109F\uAA60-\uAA7F\uA9E0-\uA9FF]")
+_LATIN_CHAR_RE = re.compile(r"[A-Za-z]")
+_JAPANESE_CHAR_RE = re.compile(r"[\u3000-\u30FF\u3400-\u4DBF\u4E00-\u9FFF\uFF00-\uFFEF]")
+_SCRIPT_CHARS_PER_TOKEN = {"myanmar": 2.0, "latin": 4.0, "mixed": 3.0}
+
+
+def dominant_script(s: str) -> str:
+    """"myanmar" / "latin" / "mixed"（6割以上を占める文字種で判定）"""
+    s = s or ""
+    total = len(s)
+    if total == 0:
+        return "mixed"
+    if len(_MYANMAR_CHAR_RE.findall(s)) / total >= 0.6:
+        return "myanmar"
+    if len(_LATIN_CHAR_RE.findall(s)) / total >= 0.6:
+        return "latin"
+    return "mixed"
+
+
+def estimate_prompt_tokens(s: str, *, usage_tag: Optional[str] = None) -> int:
+    """英語 or ビルマ語（ミャンマー文字）前提の**ざっくり**見積り。
+    - English 優勢: 4 chars ≒ 1 token
+    - Myanmar 優勢: 2 chars ≒ 1 token
+    - 混在/その他: 3 chars ≒ 1 token（安全側）
+    usage_tag（プロンプト全文を送る呼び出し）を渡すと、実際の prompt_token_count で学習した
+    プロンプト種別ごとの補正係数を掛ける（_TOKEN_CALIBRATOR）。
+    """
+    return max(0, int(_estimate_tokens_exact(s, usage_tag=usage_tag)))
+
+
+def _estimate_tokens_exact(s: str, *, usage_tag: Optional[str] = None) -> float:
+    if not s:
+        return 0.0
+    raw = len(s) / _SCRIPT_CHARS_PER_TOKEN[dominant_script(s)]
+    if usage_tag is None:
+        return raw
+    return raw * _TOKEN_CALIBRATOR.factor(_TOKEN_CALIBRATOR.kind(s, usage_tag))
+
+
+class _TokenCalibrator:
+    """
+    プロンプト種別ごとに「実測 prompt_token_count / 文字数ベース見積り」の比を指数移動平均で持つ。
+    .llm_cache（Actions のキャッシュで持ち越し）に保存して、次回以降の見積りに使う。
+
+    プロンプト全文は日本語のルール文が大半なので、文字種で判定するとどれも "mixed" になる。
+    そこで係数は「usage_tag / 記事部分（日本語を除いた残り）の文字種」で分ける
+    （例: "summary-batch/latin", "fulltext/myanmar"）。
+    """
+
+    ALPHA = 0.1
+    MIN_FACTOR, MAX_FACTOR = 0.25, 4.0
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._factors = None
+        self._dirty = False
+
+    def _load(self):
+        if self._factors is not None:
+            return
+        self._factors = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for k, v in (json.load(f) or {}).items():
+                    # 旧形式（文字種だけのキー）は全文の日本語で歪んでいるので読み捨てる
+                    if "/" in k and isinstance(v, dict):
+                        self._factors[k] = {"factor": float(v.get("factor", 1.0)), "n": int(v.get("n", 0))}
+        except Exception:
+            pass
+
+    @staticmethod
+    def kind(text: str, usage_tag: str) -> str:
+        """係数のキー: usage_tag と、日本語（ルール文）を除いた記事部分の文字種"""
+        return f"{usage_tag or 'generic'}/{dominant_script(_JAPANESE_CHAR_RE.sub('', text or ''))}"
+
+    def factor(self, kind: str) -> float:
+        with self._lock:
+            self._load()
+            return self._factors.get(kind, {}).get("factor", 1.0)
+
+    def observe(self, text: str, actual_tokens: int, *, usage_tag: str = "generic"):
+        """送ったプロンプト全文と、レスポンスの prompt_token_count で係数を更新。"""
+        if not text or not actual_tokens:
+            return
+        raw = _estimate_tokens_exact(text)
+        if raw <= 0:
+            return
+        kind = self.kind(text, usage_tag)
+        ratio = min(self.MAX_FACTOR, max(self.MIN_FACTOR, actual_tokens / raw))
+        with self._lock:
+            self._load()
+            st = self._factors.setdefault(kind, {"factor": 1.0, "n": 0})
+            # 最初の数件は単純平均、以降は EMA
+            alpha = max(self.ALPHA, 1.0 / (st["n"] + 1))
+            st["factor"] = st["factor"] * (1 - alpha) + ratio * alpha
+            st["n"] += 1
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty or self._factors is None:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(self._factors, f, ensure_ascii=False, indent=1)
+                os.replace(tmp, self.path)
+                self._dirty = False
+                print("[token-calib] " + " ".join(
+                    f"{k}={v['factor']:.2f}(n={v['n']})" for k, v in self._factors.items()
+                ))
+            except Exception as e:
+                print(f"[token-calib] save failed: {e}")
+
+
+_TOKEN_CALIBRATOR = _TokenCalibrator(
+    os.getenv("TOKEN_CALIBRATION_PATH")
+    or os.path.join(os.getenv("LLM_CACHE_DIR", ".llm_cache"), "token_calibration.json")
+)
+atexit.register(_TOKEN_CALIBRATOR.save)
+
+
+class _QuotaScheduler:
+    """
+    (API キー, モデル) ごとのレーンに直近60秒の [送信時刻, 入力トークン] を持つ。
+    - RPM: 窓内の件数が上限なら、古い1件が窓から抜けるまで待つ
+    - 入力TPM: 窓内合計＋今回の見積りが上限を超えるなら、超過分が抜けるまで待つ
+    - Requests per Day: MMT 日付で数え、上限に達したら待たずに例外（呼び出し側のフォールバックへ）。
+      当日件数は state_path に保存し、別プロセス（同じ日の次の実行）でも引き継ぐ
+    """
+
+    WINDOW_SEC = 60.0
+
+    def __init__(self, state_path: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._lanes = {}
+        self.state_path = state_path
+
+    @staticmethod
+    def _state_id(key: str, model: str) -> str:
+        return f"{key}|{model}"
+
+    def _read_state(self) -> dict:
+        if not self.state_path:
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception:
+            return {}
+
+    def _persisted_count(self, key: str, model: str, day: str) -> int:
+        rec = self._read_state().get(self._state_id(key, model)) or {}
+        return int(rec.get("count") or 0) if rec.get("day") == day else 0
+
+    def _persist(self, key: str, model: str, day: str, count: int):
+        """当日件数を保存（他プロセスが先に進めていれば大きい方を残す。前日以前は捨てる）"""
+        if not self.state_path:
+            return
+        sid = self._state_id(key, model)
+        state = {k: v for k, v in self._read_state().items() if isinstance(v, dict) and v.get("day") == day}
+        prev = int((state.get(sid) or {}).get("count") or 0)
+        state[sid] = {"day": day, "count": max(prev, count)}
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            tmp = f"{self.state_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.state_path)
+        except Exception as e:
+            print(f"[scheduler] quota state save failed: {e}")
+
+    def _lane(self, key: str, model: str) -> dict:
+        lane = self._lanes.get((key, model))
+        if lane is None:
+            lane = {
+                "events": deque(),
+                "day": None,
+                "day_count": 0,
+                "rpm": _model_quota_limit("GEMINI_FREE_RPM", model, 10),
+                "tpm": _model_quota_limit("GEMINI_FREE_TPM", model, 250_000),
+                "rpd": _model_quota_limit("GEMINI_FREE_RPD", model, 250),
+            }
+            self._lanes[(key, model)] = lane
+        return lane
+
+    def _wait_for(self, lane: dict, now: float, tokens: int) -> float:
+        ev = lane["events"]
+        while ev and ev[0][0] <= now - self.WINDOW_SEC:
+            ev.popleft()
+        wait = 0.0
+        if len(ev) >= lane["rpm"]:
+            wait = ev[len(ev) - lane["rpm"]][0] + self.WINDOW_SEC - now
+        over = sum(e[1] for e in ev) + tokens - lane["tpm"]
+        if ev and over > 0:
+            # 古い順に窓から抜けていき、合計が上限に収まる時刻まで
+            release_at = ev[-1][0]
+            for ts, tok in ev:
+                over -= tok
+                if over <= 0:
+                    release_at = ts
+                    break
+            wait = max(wait, release_at + self.WINDOW_SEC - now)
+        return max(0.0, wait)
+
+    def acquire(self, key: str, model: str, tokens: int, *, tag: str = "") -> list:
+        """枠が空くまで待って予約する。戻り値のチケットは settle() に渡す。"""
+        tokens = int(tokens or 0)
+        while True:
+            with self._lock:
+                lane = self._lane(key, model)
+                now = time.time()
+                today = datetime.now(timezone(timedelta(hours=6, minutes=30))).date().isoformat()
+                if lane["day"] != today:
+                    lane["day"] = today
+                    lane["day_count"] = self._persisted_count(key, model, today)
+                if lane["day_count"] >= lane["rpd"]:
+                    raise RuntimeError(
+                        f"requests per day quota reached by scheduler "
+                        f"({lane['day_count']}/{lane['rpd']}) model={model} tag={tag}"
+                    )
+                wait = self._wait_for(lane, now, tokens)
+                if wait <= 0:
+                    ticket = [now, tokens]
+                    lane["events"].append(ticket)
+                    lane["day_count"] += 1
+                    self._persist(key, model, today, lane["day_count"])
+                    return ticket
+            print(f"🕒 [scheduler] waiting {wait:.1f}s model={model} tag={tag} key={key[:8]}")
+            time.sleep(wait)
+
+    def settle(self, ticket: list, usage: Optional[dict] = None, *, failed: bool = False):
+        """予約した見積りを実績（usage の prompt_token_count）で置き換える。"""
+        with self._lock:
+            if failed:
+                ticket[1] = 0
+            elif usage:
+                actual = int(usage.get("prompt_token_count") or 0)
+                if actual:
+                    ticket[1] = actual
+
+
+_GEMINI_SCHEDULER = _QuotaScheduler(GEMINI_QUOTA_STATE_PATH) if GEMINI_SCHEDULER_ENABLED else None
+
+
+def gemini_key_id(api_key: str) -> str:
+    """API キーのレーン識別子（キー全体の SHA-1。Gemini キーは先頭 "AIzaSy" が共通なので前方一致では分けない）"""
+    return hashlib.sha1((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _client_quota_key(client) -> str:
+    api_key = getattr(getattr(client, "_api_client", None), "api_key", None)
+    return gemini_key_id(api_key) if api_key else f"client-{id(client):x}"
+
+
+def _fixed_pace_sleep(seconds: float, message: str = ""):
+    """スケジューラ無効時だけ従来の固定スリープを入れる。"""
+    if _GEMINI_SCHEDULER is not None or seconds <= 0:
+        return
+    if message:
+        print(message)
+    time.sleep(seconds)
+
+
+# === LLM 応答キャッシュ（内容アドレス） ===
+# 1日4回の collect と build-bundle で、処理済み記事に同じプロンプトを何度も送っていたので、
+# (プロバイダ, モデル, プロンプト, 生成設定) のハッシュをキーに応答テキストと usage を保存して使い回す。
+# - <LLM_CACHE_DIR>/<xx>/<sha256>.json に1件1ファイル（書き込みは tmp → rename）
+# - LLM_CACHE_MAX_AGE 秒より古いものと、合計 LLM_CACHE_MAX_MB を超えた古い順を削除
+# - usage_tag ごとに hit / miss / stored を数えて終了時に表示
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") != "0"
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llm_cache")
+LLM_CACHE_MAX_AGE = int(os.getenv("LLM_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_MB = int(os.getenv("LLM_CACHE_MAX_MB", "200"))
+
+# call_gemini_with_retries の生成設定（キャッシュキーにも含める）
+GEMINI_GENERATION_CONFIG = {"temperature": 0.1, "top_p": 0.8, "top_k": 20}
+
+
+class _LlmResponseCache:
+    def __init__(self, root, max_age=LLM_CACHE_MAX_AGE, max_bytes=LLM_CACHE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.stats = defaultdict(lambda: {"hit": 0, "miss": 0, "stored": 0, "forgotten": 0})
+        self._lock = threading.Lock()
+        self._evicted = False
+
+    @staticmethod
+    def key(provider, model, prompt, config=None):
+        import hashlib
+
+        raw = json.dumps(
+            {"provider": provider, "model": model, "prompt": prompt, "config": config or {}},
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ".json")
+
+    def _bump(self, tag, field):
+        with self._lock:
+            self.stats[tag or "generic"][field] += 1
+
+    def get(self, key, *, tag="generic"):
+        self._evict_once()
+        p = self._path(key)
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                rec = json.load(f)
+            if rec.get("key") != key or not rec.get("text"):
+                raise ValueError("mismatch")
+            if self.max_age and time.time() - float(rec.get("stored_at") or 0) > self.max_age:
+                raise ValueError("expired")
+        except Exception:
+            self._bump(tag, "miss")
+            return None
+        self._bump(tag, "hit")
+        return rec
+
+    def forget(self, key, *, tag="generic"):
+        """呼び出し側の検証に通らなかった応答を消す（次回の実行で取り直す）。"""
+        try:
+            os.remove(self._path(key))
+            self._bump(tag, "forgotten")
+        except OSError:
+            pass
+
+    def put(self, key, text, *, tag="generic", model="", provider="gemini", usage=None):
+        text = unicodedata.normalize("NFC", text or "").strip()
+        if not text:
+            return
+        p = self._path(key)
+        rec = {
+            "key": key,
+            "provider": provider,
+            "model": model,
+            "tag": tag,
+            "text": text,
+            "usage": usage or {},
+            "stored_at": time.time(),
+        }
+        try:
+            os.makedirs(os.path.dirname(p), exist_ok=True)
+            tmp = f"{p}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(rec, f, ensure_ascii=False)
+            os.replace(tmp, p)
+            self._bump(tag, "stored")
+        except Exception as e:
+            print(f"[llm-cache] store failed tag={tag}: {e}")
+
+    def _evict_once(self):
+        if self._evicted:
+            return
+        with self._lock:
+            if self._evicted:
+                return
+            self._evicted = True
+        self.evict()
+
+    # 削除対象は <xx>/<sha256>.json の応答ファイルと、その書きかけ .tmp だけ。
+    # 同じディレクトリ直下の状態ファイル（gemini_quota_days.json / token_calibration.json）には触らない
+    _ENTRY_DIR_RE = re.compile(r"^[0-9a-f]{2}$")
+    _ENTRY_RE = re.compile(r"^[0-9a-f]{64}\.json$")
+    _ENTRY_TMP_RE = re.compile(r"^[0-9a-f]{64}\.json\..+\.tmp$")
+    # 書き込み中の .tmp を消さないよう、これより古いものだけを書きかけの残骸とみなす
+    STALE_TMP_SEC = 3600
+
+    def evict(self):
+        """期限切れ → 容量超過（古い順）の順に削除する。"""
+        files = []
+        now = time.time()
+        removed = 0
+        try:
+            subdirs = [d for d in os.listdir(self.root) if self._ENTRY_DIR_RE.match(d)]
+        except OSError:
+            subdirs = []
+        for sub in subdirs:
+            dirpath = os.path.join(self.root, sub)
+            try:
+                names = os.listdir(dirpath)
+            except OSError:
+                continue
+            for name in names:
+                is_tmp = bool(self._ENTRY_TMP_RE.match(name))
+                if not is_tmp and not self._ENTRY_RE.match(name):
+                    continue
+                p = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    continue
+                if is_tmp:
+                    if now - st.st_mtime > self.STALE_TMP_SEC:
+                        try:
+                            os.remove(p)
+                            removed += 1
+                        except OSError:
+                            pass
+                    continue
+                if self.max_age and now - st.st_mtime > self.max_age:
+                    try:
+                        os.remove(p)
+                        removed += 1
+                    except OSError:
+                        pass
+                    continue
+                files.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in files)
+        if self.max_bytes and total > self.max_bytes:
+            for _mtime, size, p in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(p)
+                    total -= size
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            print(f"[llm-cache] evicted {removed} entries (kept {total / 1024 / 1024:.1f}MB)")
+
+    def summary(self):
+        with self._lock:
+            return {tag: dict(v) for tag, v in self.stats.items()}
+
+
+_LLM_CACHE = None
+
+
+def get_llm_cache():
+    """プロセス共有の _LlmResponseCache（LLM_CACHE_ENABLED=0 なら None）。"""
+    global _LLM_CACHE
+    if not LLM_CACHE_ENABLED:
+        return None
+    if _LLM_CACHE is None:
+        import atexit
+
+        _LLM_CACHE = _LlmResponseCache(LLM_CACHE_DIR)
+        atexit.register(_log_llm_cache_stats)
+    return _LLM_CACHE
+
+
+def llm_cache_stats():
+    """usage_tag ごとの {"hit", "miss", "stored"}"""
+    return _LLM_CACHE.summary() if _LLM_CACHE is not None else {}
+
+
+def _log_llm_cache_stats():
+    for tag, st in sorted(llm_cache_stats().items()):
+        print(
+            f"[llm-cache] tag={tag} hit={st['hit']} miss={st['miss']} "
+            f"stored={st['stored']} forgotten={st['forgotten']}"
+        )
+
+
+def _cache_text_ok(validate, text) -> bool:
+    """validate（呼び出し側の検証。None なら常に OK）に通るか。例外は NG 扱い。"""
+    if validate is None:
+        return True
+    try:
+        return bool(validate(text or ""))
+    except Exception:
+        return False
+
+
+def _cache_lookup(cache, cache_key, *, tag, validate=None):
+    """キャッシュ命中を返す。検証に通らない応答は消して None（＝取り直し）。"""
+    rec = cache.get(cache_key, tag=tag)
+    if rec is None:
+        return None
+    if not _cache_text_ok(validate, rec.get("text")):
+        print(f"[llm-cache] cached response failed validation; dropped tag={tag}")
+        cache.forget(cache_key, tag=tag)
+        return None
+    return rec
+
+
+def _cached_llm_response(rec):
+    """キャッシュ1件を resp.text / usage_metadata を持つオブジェクトにして返す。"""
+    return SimpleNamespace(
+        text=rec.get("text") or "",
+        usage_metadata=rec.get("usage") or {},
+        from_cache=True,
+    )
+
+
+# ===== Gemini 明示コンテキストキャッシュ（共通ルール等の固定プリアンブル） =====
+# 毎回そのまま送っている数千トークンの固定ルール文を caches.create で一度だけ登録し、
+# 以降は cached_content のハンドルで参照する。作成できない（無料枠・最小トークン未満・SDK差異など）
+# 場合はインラインのまま送る。GEMINI_CONTEXT_CACHE=local はAPIを使わないローカル代替（検証用）。
+GEMINI_CONTEXT_CACHE_MODE = (os.getenv("GEMINI_CONTEXT_CACHE", "1") or "0").strip().lower()
+GEMINI_CONTEXT_CACHE_TTL = int(os.getenv("GEMINI_CONTEXT_CACHE_TTL_SEC", "3600"))
+GEMINI_CONTEXT_CACHE_MIN_TOKENS = int(os.getenv("GEMINI_CONTEXT_CACHE_MIN_TOKENS", "1024"))
+
+
+class _LocalContextCacheBackend:
+    """caches.create のローカル代替。ハンドルを払い出すだけで、本文は呼び出し時にインライン展開する。"""
+
+    def __init__(self):
+        self._texts = {}
+        self._lock = threading.Lock()
+
+    def create(self, client, model: str, text: str, ttl_sec: int) -> str:
+        name = "local/" + hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            self._texts[name] = text
+        return name
+
+    def resolve(self, name: str) -> str | None:
+        with self._lock:
+            return self._texts.get(name)
+
+
+class _GeminiContextCacheBackend:
+    """google-genai の client.caches.create を使う本番バックエンド。"""
+
+    def create(self, client, model: str, text: str, ttl_sec: int) -> str:
+        cached = client.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                contents=[text],
+                ttl=f"{int(ttl_sec)}s",
+                display_name="mnd-preamble",
+            ),
+        )
+        return cached.name
+
+    def resolve(self, name: str) -> str | None:
+        return None
+
+
+class _GeminiContextCache:
+    """
+    (APIキー, モデル, プリアンブル) → cached_content ハンドル。
+    - 期限切れ直前は作り直す
+    - 作成に失敗した (APIキー, モデル) は以後このプロセスではインライン送信に固定
+    """
+
+    def __init__(self, backend, ttl_sec: int = GEMINI_CONTEXT_CACHE_TTL, min_tokens: int = GEMINI_CONTEXT_CACHE_MIN_TOKENS):
+        self.backend = backend
+        self.ttl_sec = ttl_sec
+        self.min_tokens = min_tokens
+        self._handles = {}   # (key, model, sha) -> (name, expires_at)
+        self._disabled = set()  # (key, model)
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "inline": 0, "failed": 0}
+
+    def handle(self, client, model: str, text: str) -> str | None:
+        if not text or estimate_prompt_tokens(text) < self.min_tokens:
+            return None
+        lane = (_client_quota_key(client), model)
+        sha = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            if lane in self._disabled:
+                self.stats["inline"] += 1
+                return None
+            hit = self._handles.get(lane + (sha,))
+            if hit and hit[1] - 60 > now:
+                self.stats["reused"] += 1
+                return hit[0]
+        try:
+            name = self.backend.create(client, model, text, self.ttl_sec)
+        except Exception as e:
+            with self._lock:
+                self._disabled.add(lane)
+                self.stats["failed"] += 1
+            print(f"[ctx-cache] create failed; sending preamble inline from now on (model={model}): {str(e)[:200]}")
+            return None
+        with self._lock:
+            self._handles[lane + (sha,)] = (name, now + self.ttl_sec)
+            self.stats["created"] += 1
+        print(f"[ctx-cache] created {name} model={model} ~{estimate_prompt_tokens(text)} tokens ttl={self.ttl_sec}s")
+        return name
+
+    def invalidate(self, name: str):
+        with self._lock:
+            for k, (n, _exp) in list(self._handles.items()):
+                if n == name:
+                    self._handles.pop(k, None)
+
+    def resolve(self, name: str) -> str | None:
+        return self.backend.resolve(name)
+
+
+def _new_context_cache():
+    if GEMINI_CONTEXT_CACHE_MODE in ("0", "false", "off", ""):
+        return None
+    if GEMINI_CONTEXT_CACHE_MODE == "local":
+        return _GeminiContextCache(_LocalContextCacheBackend())
+    return _GeminiContextCache(_GeminiContextCacheBackend())
+
+
+_CONTEXT_CACHE = _new_context_cache()
+
+
+def context_cache_stats():
+    """{"created","reused","inline","failed"}（無効時は {}）"""
+    return dict(_CONTEXT_CACHE.stats) if _CONTEXT_CACHE is not None else {}
+
+
+def _split_cacheable_prefix(prompt: str, cacheable_prefix: str):
+    """prompt が cacheable_prefix で始まるなら (prefix, 残り)、そうでなければ ("", prompt)。"""
+    if cacheable_prefix and prompt.startswith(cacheable_prefix):
+        return cacheable_prefix, prompt[len(cacheable_prefix):]
+    return "", prompt
+
+
+# ===== 長い LLM 段階のチェックポイント（途中で落ちても再実行で続きから） =====
+# bundle ディレクトリに JSONL の追記ジャーナルを置き、1件終わるごとに
+# (段階, 記事キー, 入力ハッシュ) → 結果 を書く。再実行時は一致する記事をスキップする。
+# 入力（本文・プロンプト規則）が変わればハッシュが変わるので、古い結果は使われない。
+CHECKPOINT_ENABLED = os.getenv("LLM_CHECKPOINT", "1") == "1"
+
+
+class _CheckpointJournal:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._done = {}
+        self.restored = 0
+        self._torn_tail = False  # 前回が書きかけで終わっていたら次の追記は改行から
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._torn_tail = not line.endswith("\n")
+                    try:
+                        rec = json.loads(line)
+                        self._done[(rec["stage"], rec["key"], rec["hash"])] = rec.get("result")
+                    except Exception:
+                        continue  # 書きかけの最終行などは無視
+        except FileNotFoundError:
+            pass
+        if self._done:
+            print(f"[checkpoint] loaded {len(self._done)} finished item(s) from {path}")
+
+    @staticmethod
+    def digest(*parts) -> str:
+        h = hashlib.sha256()
+        for p in parts:
+            h.update(str(p or "").encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()[:24]
+
+    def get(self, stage: str, key: str, digest: str):
+        """(見つかったか, 結果)"""
+        with self._lock:
+            k = (stage, key, digest)
+            if k not in self._done:
+                return False, None
+            self.restored += 1
+            return True, self._done[k]
+
+    def put(self, stage: str, key: str, digest: str, result):
+        rec = {"stage": stage, "key": key, "hash": digest, "result": result,
+               "ts": datetime.utcnow().isoformat(timespec="seconds") + "Z"}
+        line = json.dumps(rec, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._done[(stage, key, digest)] = result
+            if self._torn_tail:
+                line = "\n" + line
+                self._torn_tail = False
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                print(f"[checkpoint] write failed: {e}")
+
+
+_CHECKPOINT = None
+
+
+def open_checkpoint_journal(bundle_dir: str, day) -> "_CheckpointJournal | None":
+    """その日（MMT）のジャーナルを開いて以後の要約・全文翻訳で使う。LLM_CHECKPOINT=0 なら None。"""
+    global _CHECKPOINT
+    _CHECKPOINT = (
+        _CheckpointJournal(os.path.join(bundle_dir, ".checkpoint", f"journal-{day}.jsonl"))
+        if CHECKPOINT_ENABLED else None
+    )
+    return _CHECKPOINT
+
+
+def _is_cached_content_error(e: Exception) -> bool:
+    msg = (str(e) or "").lower()
+    return "cached" in msg and ("not found" in msg or "expired" in msg or "invalid" in msg or "permission" in msg)
+
+
 def call_gemini_with_retries(
     client,
     prompt: str,
@@ -384,6 +1120,8 @@ def call_gemini_with_retries(
     base_delay: float = GEMINI_BASE_DELAY,
     max_delay: float = GEMINI_MAX_DELAY,
     usage_tag: str = "generic",
+    cacheable_prefix: str = "",
+    validate=None,
 ):
     """
     Gemini 呼び出しの共通リトライラッパー。
@@ -392,7 +1130,18 @@ def call_gemini_with_retries(
     - 429/レート系は待機して再試行（Gemini Free の瞬間上限に当たることが多い）
     - Free tier の「generate_content_free_tier_requests」系 429 は即諦める
     - それ以外の恒久的エラーは即時 raise
+    - prompt が cacheable_prefix（固定ルール文）で始まる場合は、その部分を明示コンテキストキャッシュで送る
+    - validate(text) を渡すと、それに通った応答だけ LLM 応答キャッシュに保存する
+      （壊れた JSON・未翻訳などを次回の実行で再生しない。命中時も検証し、NG なら取り直す）
     """
+    cache = get_llm_cache()
+    cache_key = cache.key("gemini", model, prompt, GEMINI_GENERATION_CONFIG) if cache else None
+    if cache:
+        rec = _cache_lookup(cache, cache_key, tag=usage_tag, validate=validate)
+        if rec is not None:
+            logging.info(f"[gemini-call] cache hit model={model} usage_tag={usage_tag}")
+            return _cached_llm_response(rec)
+
     last_exc = None
     consecutive_503 = 0  # 503 の連発検出用
 
@@ -403,31 +1152,85 @@ def call_gemini_with_retries(
         cooldown_default = 60.0
 
     for attempt in range(max_retries):
+        # クォータが空くまで待って枠を予約（Requests per Day 到達時はここで例外）
+        ticket = (
+            _GEMINI_SCHEDULER.acquire(
+                _client_quota_key(client),
+                model,
+                estimate_prompt_tokens(prompt, usage_tag=usage_tag),
+                tag=usage_tag,
+            )
+            if _GEMINI_SCHEDULER is not None
+            else None
+        )
         try:
             logging.info(
                 f"[gemini-call] model={model} usage_tag={usage_tag} "
                 f"client_api_key_prefix={getattr(client, '_key_prefix', '')}"
             )
-            # 実際の呼び出し（既存コードの呼び方に合わせて調整）
-            resp = client.models.generate_content(
-                model=model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    temperature=0.1,
-                    top_p=0.8,
-                    top_k=20,
-                ),
-            )
+            # 固定プリアンブルはキャッシュハンドルで参照（作れなければインライン）
+            prefix, rest = _split_cacheable_prefix(prompt, cacheable_prefix)
+            handle = _CONTEXT_CACHE.handle(client, model, prefix) if (prefix and _CONTEXT_CACHE) else None
+            local_text = _CONTEXT_CACHE.resolve(handle) if handle else None
+            if handle and local_text is None:
+                try:
+                    resp = client.models.generate_content(
+                        model=model,
+                        contents=rest,
+                        config=types.GenerateContentConfig(**GEMINI_GENERATION_CONFIG, cached_content=handle),
+                    )
+                except Exception as ce:
+                    if not _is_cached_content_error(ce):
+                        raise
+                    # 期限切れ等：ハンドルを捨ててこの回はインラインで送り直す
+                    _CONTEXT_CACHE.invalidate(handle)
+                    resp = client.models.generate_content(
+                        model=model,
+                        contents=prompt,
+                        config=types.GenerateContentConfig(**GEMINI_GENERATION_CONFIG),
+                    )
+            else:
+                # 実際の呼び出し（既存コードの呼び方に合わせて調整）
+                resp = client.models.generate_content(
+                    model=model,
+                    contents=(local_text + rest) if local_text is not None else prompt,
+                    config=types.GenerateContentConfig(**GEMINI_GENERATION_CONFIG),
+                )
 
             # 成功したので 503 カウンタはリセット
             consecutive_503 = 0
 
+            if ticket is not None:
+                _GEMINI_SCHEDULER.settle(ticket, _usage_from_resp(resp))
+
+            if cache and _cache_text_ok(validate, getattr(resp, "text", "")):
+                try:
+                    cache.put(
+                        cache_key,
+                        getattr(resp, "text", "") or "",
+                        tag=usage_tag,
+                        model=model,
+                        usage=_usage_from_resp(resp),
+                    )
+                except Exception:
+                    pass
+
             # 使用量ログ
             try:
                 _log_gemini_usage(resp, tag=(usage_tag or "gen"), model=model)
             except Exception:
                 pass
 
+            # 見積り係数の学習（送ったプロンプト全文 vs 実測の prompt_token_count、プロンプト種別ごと）
+            try:
+                _TOKEN_CALIBRATOR.observe(
+                    prompt,
+                    int((_usage_from_resp(resp) or {}).get("prompt_token_count") or 0),
+                    usage_tag=usage_tag,
+                )
+            except Exception:
+                pass
+
             # Free tier 監視（MMT日次 / RPM / 入力TPM）
             try:
                 if _FREE_TIER_MON:
@@ -446,6 +1249,8 @@ def call_gemini_with_retries(
         except Exception as e:
             msg = str(e)
             last_exc = e
+            if ticket is not None:
+                _GEMINI_SCHEDULER.settle(ticket, failed=True)
 
             # 🔴 free tier quota exceeded は即諦める
             if _is_free_tier_quota_error(e):
@@ -537,6 +1342,8 @@ def call_llm_with_fallback(
     max_delay: float = GEMINI_MAX_DELAY,
     usage_tag: str = "generic",
     openai_model: str = "gpt-5.4-mini",
+    cacheable_prefix: str = "",
+    validate=None,
 ):
     """
     まず Gemini（既存リトライ込み）を実行。
@@ -552,6 +1359,8 @@ def call_llm_with_fallback(
             base_delay=base_delay,
             max_delay=max_delay,
             usage_tag=usage_tag,
+            cacheable_prefix=cacheable_prefix,
+            validate=validate,
         )
     except Exception as e:
         if not _should_fallback_to_openai(e):
@@ -563,6 +1372,14 @@ def call_llm_with_fallback(
                 "so fallback to GPT-5 mini cannot run."
             ) from e
 
+        cache = get_llm_cache()
+        cache_key = cache.key("openai", openai_model, prompt) if cache else None
+        if cache:
+            rec = _cache_lookup(cache, cache_key, tag=usage_tag, validate=validate)
+            if rec is not None:
+                logging.info(f"[fallback] cache hit model={openai_model} usage_tag={usage_tag}")
+                return _cached_llm_response(rec)
+
         logging.warning(f"[fallback] Gemini failed; switching to OpenAI model={openai_model}. reason={e}")
         txt = openai_call_with_retry_(
             _OPENAI_CLIENT,
@@ -572,6 +1389,8 @@ def call_llm_with_fallback(
             max_tries=2,      # Gemini→GPTフォールバック時のGPT側リトライ回数
             sleep_sec=10.0,   # 安全側（必要なら 3〜10秒で調整）
         )
+        if cache and _cache_text_ok(validate, txt):
+            cache.put(cache_key, txt or "", tag=usage_tag, model=openai_model, provider="openai")
         return SimpleNamespace(text=(txt or ""))
 
 def openai_call_with_retry_(
@@ -612,6 +1431,143 @@ def openai_call_with_retry_(
 # Irrawaddy英語記事が3500文字くらいある
 BODY_MAX_CHARS = 3500
 
+# ===== LLM 送信前の本文コンパクション =====
+# 文字数カットだけだとビルマ語は英語の倍近いトークンになるので、文字種ごとのトークン予算で
+# 文境界に沿って切る。あわせて共有ボタン文言・署名・「Related Posts」以降などの定型行を落とす。
+BODY_TOKEN_BUDGET = {
+    "latin": int(os.getenv("BODY_TOKEN_BUDGET_LATIN", "900")),
+    "myanmar": int(os.getenv("BODY_TOKEN_BUDGET_MYANMAR", "1600")),
+    "mixed": int(os.getenv("BODY_TOKEN_BUDGET_MIXED", "1200")),
+}
+# 同じ媒体の何記事以上に出てくる行を「その媒体の定型文」とみなすか
+SOURCE_BOILERPLATE_MIN_ARTICLES = int(os.getenv("SOURCE_BOILERPLATE_MIN_ARTICLES", "3"))
+
+BOILERPLATE_LINE_PATTERNS = [
+    # Captions / media labels (English)
+    r"^(?:Photo|Image|Video|Graphic|Map|Caption)[:：\)]",
+    r"^\((?:Photo|Image|Video|Graphic|Map)\)\s*$",
+    # Credits / sources (English)
+    r"^(?:Credit|Credits|Source|Sources|Via|Courtesy of)[:：]",
+    # Editorial / translation notes (English)
+    r"^(?:With reporting by|Reported by|Reporting by|Edited by|Compiled by|Translation|Translator|Translated by).*$",
+    # Bylines / share prompts / newsletter prompts
+    r"^By\s+[A-Z][\w.'-]*(?:\s+[A-Z][\w.'-]*){0,4}\s*$",
+    r"^(?:Share|Share this|Share on|Tweet|Follow us|Follow Us|Subscribe|Sign up|Click here|Read more|Read also|Also read|Advertisement)\b.{0,60}$",
+
+    # Captions / labels (Burmese)
+    r"^(?:ဓာတ်ပုံ|ရုပ်ပုံ)[:：]",            # photo / image
+    # Sources / credits (Burmese)
+    r"^(?:ရင်းမြစ်)[:：]",                 # source
+    # Editorial / translation notes (Burmese)
+    r"^(?:ဘာသာပြန်|ဘာသာပြန်သူ|တည်းဖြတ်)[:：]",
+
+    # Outlet-only line (English outlet names)
+    r"^(?:BBC Burmese|DVB|Myanmar Now|The Irrawaddy|Khit Thit Media|Mizzima|RFA Burmese|VOA Burmese|Eleven Media|Frontier Myanmar|Reuters|AP|Associated Press|AFP|SCMP)\s*$",
+    # 3個以上のハッシュタグ行（タグ雲）
+    r'^(?:[#＃][^\s#]+(?:\s+|$)){3,}$',
+    # WPコメント欄の定型文・コメント誘導
+    r'^(?:Save my name, email, and website.*)$',
+    r'^(?:Leave a comment|Post a Comment|Your email address will not be published).*$',
+    # 単独 "PDF" 行
+    r'^(?:PDF)\s*$',
+    # 記号だけの行
+    r'^[\s\-/–—•·|\\\(\)\[\]{}“”"\'«»。、．…／]+$',
+    # "##..." で始まるタグ群の行
+    r'^(?:##.*)$',
+]
+BOILERPLATE_LINE_RES = [re.compile(p, re.IGNORECASE) for p in BOILERPLATE_LINE_PATTERNS]
+# この行以降は関連記事リンク等なので本文ごと打ち切る
+_TAIL_CUT_RE = re.compile(
+    r"^(?:Related(?:\s+(?:Posts?|Articles?|News|Stories))?|More (?:from|on|stories)|You may also like|Read More Stories|ဆက်စပ်သတင်း(?:များ)?)\s*[:：]?\s*$",
+    re.IGNORECASE,
+)
+# 1文 = 文末記号（英語系は後ろが空白/行末のときだけ）までと、直後の空白
+_SENTENCE_RE = re.compile(r".+?(?:[.!?。]+(?=\s|$)|။|$)\s*", re.S)
+
+_SOURCE_BOILERPLATE: dict = {}
+
+
+def _compact_lines(body: str) -> list[str]:
+    lines = []
+    for ln in (body or "").splitlines():
+        ln = unicodedata.normalize("NFC", ln)
+        ln = re.sub(r"\s+", " ", ln).strip()
+        if ln:
+            lines.append(ln)
+    return lines
+
+
+def learn_source_boilerplate(items) -> dict:
+    """
+    同一媒体の複数記事に繰り返し出る行（フッター・購読案内など）を媒体ごとに集める。
+    items: [{"source","body"}, ...]。結果は compact_body_for_llm が参照する。
+    """
+    counts: dict = {}
+    for it in items or []:
+        src = (it.get("source") or "").strip()
+        if not src:
+            continue
+        for ln in set(_compact_lines(it.get("body") or "")):
+            # 短すぎる行（数字だけ等）と長い本文段落は対象外
+            if 8 <= len(ln) <= 200:
+                counts.setdefault(src, {}).setdefault(ln, 0)
+                counts[src][ln] += 1
+    learned = {
+        src: {ln for ln, n in c.items() if n >= SOURCE_BOILERPLATE_MIN_ARTICLES}
+        for src, c in counts.items()
+    }
+    for src, lines in learned.items():
+        if lines:
+            _SOURCE_BOILERPLATE.setdefault(src, set()).update(lines)
+            print(f"[compact] learned {len(lines)} boilerplate line(s) for {src}")
+    return learned
+
+
+def trim_to_token_budget(text: str, max_tokens: int) -> str:
+    """文（. ! ? ။ 。）の境界で max_tokens 以内に収める。1文目から超える場合はその文を文字数で切る。"""
+    if estimate_prompt_tokens(text) <= max_tokens:
+        return text
+    paras = []
+    used = 0
+    for para in (text or "").split("\n"):
+        taken = []
+        for m in _SENTENCE_RE.finditer(para):
+            sent = m.group(0)
+            cost = _estimate_tokens_exact(sent)
+            if used + cost > max_tokens:
+                if not paras and not taken:
+                    return sent[: max(1, int(len(sent) * max_tokens / max(1, cost)))].rstrip()
+                if taken:
+                    paras.append("".join(taken).rstrip())
+                return "\n".join(paras)
+            taken.append(sent)
+            used += cost
+        if taken:
+            paras.append("".join(taken).rstrip())
+    return "\n".join(paras)
+
+
+def compact_body_for_llm(body: str, *, source: str = "", max_tokens: int | None = None) -> str:
+    """
+    LLM に渡す前の本文整形。
+    - NFC・空白の圧縮・空行除去
+    - 定型行（BOILERPLATE_LINE_RES）と、その媒体で学習済みの繰り返し行を除去
+    - 「Related Posts」等の見出し以降は打ち切り
+    - 文字種ごとのトークン予算（BODY_TOKEN_BUDGET）で文境界カット
+    """
+    learned = _SOURCE_BOILERPLATE.get((source or "").strip()) or set()
+    kept = []
+    for ln in _compact_lines(body):
+        if _TAIL_CUT_RE.match(ln) and kept:
+            break
+        if ln in learned or any(p.search(ln) for p in BOILERPLATE_LINE_RES):
+            continue
+        kept.append(ln)
+    text = "\n".join(kept)
+    if max_tokens is None:
+        max_tokens = BODY_TOKEN_BUDGET.get(dominant_script(text), BODY_TOKEN_BUDGET["mixed"])
+    return trim_to_token_budget(text, max_tokens)
+
 # ミャンマー標準時 (UTC+6:30)
 MMT = timezone(timedelta(hours=6, minutes=30))
 
@@ -713,10 +1669,6 @@ AYEYARWADY_KEYWORDS = [
 ]
 AYEYARWADY_KEYWORDS = [unicodedata.normalize("NFC", kw) for kw in AYEYARWADY_KEYWORDS]
 
-def is_ayeyarwady_hit(title: str, body: str) -> bool:
-    """タイトル/本文にエーヤワディ系キーワードが含まれるか"""
-    return any(kw in title or kw in body for kw in AYEYARWADY_KEYWORDS)
-
 # 「チャット」語のバリエーションを通貨語として拾う
 CURRENCY_WORD = r"(?:မြန်မာ(?:့)?(?:နိုင်ငံ)?\s*)?(?:ငွေ\s*)?ကျပ်(?:ငွေ)?"
 
@@ -762,14 +1714,96 @@ class _OrPattern:
 KYAT_PATTERN = _OrPattern(_KYAT_NUM_FIRST, _KYAT_CCY_FIRST)
 
 
+# === キーワードエンジン（NEWS / AYEYARWADY / 通貨を1パスで判定） ===
+# import 時に全キーワードから Aho–Corasick オートマトンを1回だけ作り、title / body を
+# それぞれ1回走査して「どのキーワード集合が当たったか」を返す。
+# pyahocorasick が無い環境では、キーワードごとの部分文字列検索（C実装）で代用する。
+# 通貨は CURRENCY_WORD の必須部分「ကျပ်」をアンカーとして拾い、
+# アンカーがあったテキストだけ KYAT_PATTERN で確認する。
+try:
+    import ahocorasick as _ahocorasick
+except Exception:
+    _ahocorasick = None
+
+KEYWORD_SET_NEWS = "news"
+KEYWORD_SET_AYEYARWADY = "ayeyarwady"
+KEYWORD_SET_MYANMAR = "myanmar"  # Mizzima 追加カテゴリの「မြန်မာ」必須判定用
+KEYWORD_SET_KYAT = "kyat"
+
+_KYAT_ANCHOR = "ကျပ်"
+_KYAT_ANCHOR_SET = "_kyat_anchor"
+
+
+class _KeywordEngine:
+    """{集合名: キーワードリスト} から1回だけ組み立てる多パターン照合器"""
+
+    def __init__(self, keyword_sets: Dict[str, List[str]]):
+        labels: Dict[str, set] = {}
+        for name, kws in keyword_sets.items():
+            for kw in kws:
+                if kw:
+                    labels.setdefault(kw, set()).add(name)
+        self._labels = {kw: frozenset(names) for kw, names in labels.items()}
+        self._all = frozenset(keyword_sets)
+        self._automaton = None
+        if _ahocorasick is not None:
+            automaton = _ahocorasick.Automaton()
+            for kw in self._labels:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def scan(self, text: str) -> frozenset:
+        if not text:
+            return frozenset()
+        found = set()
+        if self._automaton is not None:
+            matches = (kw for _end, kw in self._automaton.iter(text))
+        else:
+            matches = (kw for kw in self._labels if kw in text)
+        for kw in matches:
+            found |= self._labels[kw]
+            if len(found) == len(self._all):
+                break
+        return frozenset(found)
+
+
+_KEYWORD_ENGINE = _KeywordEngine(
+    {
+        KEYWORD_SET_NEWS: NEWS_KEYWORDS,
+        KEYWORD_SET_AYEYARWADY: AYEYARWADY_KEYWORDS,
+        KEYWORD_SET_MYANMAR: [unicodedata.normalize("NFC", "မြန်မာ")],
+        _KYAT_ANCHOR_SET: [_KYAT_ANCHOR],
+    }
+)
+
+
+def keyword_hits(title: str, body: str) -> frozenset:
+    """
+    タイトル/本文を1回ずつ走査し、当たったキーワード集合名を返す。
+    news / ayeyarwady / myanmar / kyat（通貨表現）
+    """
+    hits = set()
+    for text in (title or "", body or ""):
+        found = _KEYWORD_ENGINE.scan(text)
+        if _KYAT_ANCHOR_SET in found:
+            found = found - {_KYAT_ANCHOR_SET}
+            # 通貨「ကျပ်」だけは正規表現で判定
+            if KEYWORD_SET_KYAT not in hits and KYAT_PATTERN.search(text):
+                hits.add(KEYWORD_SET_KYAT)
+        hits |= found
+    return frozenset(hits)
+
+
+def is_ayeyarwady_hit(title: str, body: str) -> bool:
+    """タイトル/本文にエーヤワディ系キーワードが含まれるか"""
+    return KEYWORD_SET_AYEYARWADY in keyword_hits(title, body)
+
+
 def any_keyword_hit(title: str, body: str) -> bool:
-    # 通常のキーワード一致
-    if any(kw in title or kw in body for kw in NEWS_KEYWORDS):
-        return True
-    # 通貨「ကျပ်」だけは正規表現で判定
-    if KYAT_PATTERN.search(title) or KYAT_PATTERN.search(body):
-        return True
-    return False
+    # 通常のキーワード一致 / 通貨「ကျပ်」
+    hits = keyword_hits(title, body)
+    return KEYWORD_SET_NEWS in hits or KEYWORD_SET_KYAT in hits
 
 
 
@@ -779,11 +1813,513 @@ def clean_html_content(html: str) -> str:
     return "".join(c for c in html if unicodedata.category(c)[0] != "C")
 
 
-# 本文が取得できるまで「requestsでリトライする」
-def fetch_with_retry(url, retries=3, wait_seconds=2):
+# === 共有 HTTP エンジン（asyncio + httpx：接続プール / HTTP/2 / 同時実行制御） ===
+# - 専用スレッドでイベントループを1つ回し、httpx.AsyncClient を使い回す（ホストごとに keep-alive）
+# - h2 が入っていれば HTTP/2、無ければ HTTP/1.1
+# - 全体 / ホスト単位のセマフォで同時接続数を制限
+# - 同期ラッパ http_get / http_get_many で既存の呼び出し側はそのまま使える
+# httpx が無い環境では、プール付きの requests.Session 1本にフォールバックする。
+HTTP_ENGINE_MAX_CONCURRENCY = int(os.getenv("HTTP_ENGINE_MAX_CONCURRENCY", "32"))
+HTTP_ENGINE_PER_HOST = int(os.getenv("HTTP_ENGINE_PER_HOST", "6"))
+HTTP_ENGINE_HTTP2 = os.getenv("HTTP_ENGINE_HTTP2", "1") != "0"
+
+try:
+    import h2  # noqa: F401  (httpx の HTTP/2 に必要)
+    _H2_AVAILABLE = True
+except Exception:
+    _H2_AVAILABLE = False
+
+
+def _response_like(status_code, content=b"", text=None, url="", headers=None, http_version="", encoding=None):
+    """requests.Response と同じ属性名（status_code / content / text / url / headers / encoding）で返す。"""
+    from requests.structures import CaseInsensitiveDict
+
+    content = content or b""
+    if text is None:
+        try:
+            text = content.decode(encoding or "utf-8", "replace")
+        except LookupError:
+            text = content.decode("utf-8", "replace")
+    r = SimpleNamespace(
+        status_code=int(status_code),
+        content=content,
+        text=text,
+        url=str(url or ""),
+        headers=CaseInsensitiveDict(dict(headers or {})),
+        http_version=http_version,
+        encoding=encoding,
+    )
+    r.ok = r.status_code < 400
+    r.raise_for_status = lambda: _raise_for_status(r)
+    r.json = lambda: json.loads(r.text)
+    return r
+
+
+class _AsyncHttpEngine:
+    def __init__(self, max_concurrency=HTTP_ENGINE_MAX_CONCURRENCY, per_host=HTTP_ENGINE_PER_HOST, http2=HTTP_ENGINE_HTTP2):
+        import asyncio
+
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.per_host = max(1, int(per_host))
+        self.http2 = bool(http2 and _H2_AVAILABLE)
+        self._client = None
+        self._global_sem = None
+        self._host_sems = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="http-engine", daemon=True
+        )
+        self._thread.start()
+
+    async def _ensure_client(self):
+        import asyncio
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                    keepalive_expiry=30.0,
+                ),
+            )
+            self._global_sem = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    def _host_sem(self, url):
+        import asyncio
+
+        host = (urlparse(url).netloc or "").lower()
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host)
+            self._host_sems[host] = sem
+        return sem
+
+    async def fetch(self, url, *, timeout=15, headers=None, allow_redirects=True):
+        client = await self._ensure_client()
+        async with self._global_sem:
+            async with self._host_sem(url):
+                r = await client.get(
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    follow_redirects=allow_redirects,
+                )
+                content = await r.aread()
+                return _response_like(
+                    r.status_code,
+                    content,
+                    text=r.text,
+                    url=r.url,
+                    headers=r.headers,
+                    http_version=r.http_version,
+                    encoding=r.encoding,
+                )
+
+    async def fetch_many(self, urls, **kwargs):
+        import asyncio
+
+        return await asyncio.gather(
+            *(self.fetch(u, **kwargs) for u in urls), return_exceptions=True
+        )
+
+    def run(self, coro):
+        import asyncio
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self):
+        try:
+            if self._client is not None:
+                self.run(self._client.aclose())
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+_HTTP_ENGINE = None
+_HTTP_SESSION = None
+_HTTP_ENGINE_LOCK = threading.Lock()
+
+
+def get_http_engine():
+    """プロセス共有の _AsyncHttpEngine を返す（httpx が無ければ None）。"""
+    global _HTTP_ENGINE
+    if httpx is None:
+        return None
+    if _HTTP_ENGINE is None:
+        with _HTTP_ENGINE_LOCK:
+            if _HTTP_ENGINE is None:
+                import atexit
+
+                _HTTP_ENGINE = _AsyncHttpEngine()
+                atexit.register(_HTTP_ENGINE.close)
+    return _HTTP_ENGINE
+
+
+def shared_http_session():
+    """
+    プロセス共有のプール付き requests.Session。
+    cloudscraper など requests.Session を要求する呼び出し側向け（毎回 Session() を作らない）。
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_ENGINE_LOCK:
+            if _HTTP_SESSION is None:
+                from requests.adapters import HTTPAdapter
+
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_ENGINE_MAX_CONCURRENCY,
+                    pool_maxsize=HTTP_ENGINE_MAX_CONCURRENCY,
+                    max_retries=0,
+                )
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _HTTP_SESSION = s
+    return _HTTP_SESSION
+
+
+# === 永続 HTTP キャッシュ（ETag / Last-Modified による条件付き GET） ===
+# cron 間で同じ一覧ページ・記事ページを取り直さないよう、本文と検証子をディスクに保存する。
+# - TTL 内ならネットワークに出ずキャッシュを返す
+# - TTL 切れなら If-None-Match / If-Modified-Since を付けて再検証し、304 ならキャッシュを返す
+# - TTL は URL 種別ごと（一覧/RSS は短く、記事ページは長く）
+# - 保存は呼び出し側が validate（その種類のページの目印があるか）を渡した時だけ（opt-in）
+# - HTTP_CACHE_MAX_AGE 秒より古いものと、合計 HTTP_CACHE_MAX_MB を超えた古い順を削除
+# GitHub Actions では HTTP_CACHE_DIR を actions/cache で持ち回る。
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") != "0"
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", ".http_cache")
+HTTP_CACHE_TTL_LIST = int(os.getenv("HTTP_CACHE_TTL_LIST", "600"))  # 一覧/RSS: 10分
+HTTP_CACHE_TTL_ARTICLE = int(os.getenv("HTTP_CACHE_TTL_ARTICLE", str(7 * 24 * 3600)))  # 記事: 7日
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", str(14 * 24 * 3600)))
+HTTP_CACHE_MAX_MB = int(os.getenv("HTTP_CACHE_MAX_MB", "300"))
+
+_HTTP_CACHE_LIST_RE = re.compile(
+    r"(/category/|/categories/|/tag/|/page/\d+|[?&]page=|/feed/?$|/rss|\.xml$|/wp-json/|/search)",
+    re.I,
+)
+
+
+def http_cache_ttl(url):
+    """URL 種別ごとの TTL（秒）。トップ/一覧/RSS は短く、それ以外（記事）は長く。"""
+    try:
+        p = urlparse(url)
+        path = p.path or "/"
+        target = path + ("?" + p.query if p.query else "")
+    except Exception:
+        return HTTP_CACHE_TTL_LIST
+    if path in ("", "/") or _HTTP_CACHE_LIST_RE.search(target):
+        return HTTP_CACHE_TTL_LIST
+    return HTTP_CACHE_TTL_ARTICLE
+
+
+class _HttpDiskCache:
+    """URL の sha1 をキーに <dir>/<xx>/<sha1>.json（メタ）と .bin（本文）を保存する。"""
+
+    def __init__(self, root, max_age=HTTP_CACHE_MAX_AGE, max_bytes=HTTP_CACHE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.stats = {"fresh": 0, "revalidated": 0, "miss": 0, "stored": 0}
+        self._lock = threading.Lock()
+        self._evicted = False
+
+    def _paths(self, url):
+        import hashlib
+
+        h = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        d = os.path.join(self.root, h[:2])
+        return d, os.path.join(d, h + ".json"), os.path.join(d, h + ".bin")
+
+    def _bump(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def load(self, url):
+        self._evict_once()
+        _, meta_p, body_p = self._paths(url)
+        try:
+            with open(meta_p, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_p, "rb") as f:
+                body = f.read()
+        except Exception:
+            return None, b""
+        if meta.get("url") != url:
+            return None, b""
+        return meta, body
+
+    def _write_meta(self, meta_p, meta):
+        tmp = f"{meta_p}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, meta_p)
+
+    def store(self, url, resp):
+        content = getattr(resp, "content", None) or b""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        headers = getattr(resp, "headers", None) or {}
+        encoding = getattr(resp, "encoding", None) or ""
+        d, meta_p, body_p = self._paths(url)
+        try:
+            os.makedirs(d, exist_ok=True)
+            tmp = f"{body_p}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(content)
+            os.replace(tmp, body_p)
+            self._write_meta(meta_p, {
+                "url": url,
+                "final_url": str(getattr(resp, "url", "") or url),
+                "etag": headers.get("ETag") or headers.get("etag") or "",
+                "last_modified": headers.get("Last-Modified") or headers.get("last-modified") or "",
+                "content_type": headers.get("Content-Type") or headers.get("content-type") or "",
+                "encoding": encoding,
+                "stored_at": time.time(),
+            })
+            self._bump("stored")
+        except Exception as e:
+            print(f"[http-cache] store failed {url}: {e}")
+
+    def touch(self, url, meta):
+        _, meta_p, _ = self._paths(url)
+        try:
+            meta = dict(meta)
+            meta["stored_at"] = time.time()
+            self._write_meta(meta_p, meta)
+        except Exception:
+            pass
+
+    def _evict_once(self):
+        if self._evicted:
+            return
+        with self._lock:
+            if self._evicted:
+                return
+            self._evicted = True
+        self.evict()
+
+    # 削除対象は <xx>/<sha1>.json|.bin のエントリと、その書きかけ .tmp だけ。
+    # 同じディレクトリ直下の fetch_router.json 等には触らない
+    _ENTRY_DIR_RE = re.compile(r"^[0-9a-f]{2}$")
+    _ENTRY_RE = re.compile(r"^([0-9a-f]{40})\.(json|bin)$")
+    _ENTRY_TMP_RE = re.compile(r"^[0-9a-f]{40}\.(json|bin)\..+\.tmp$")
+    # 書き込み中の .tmp を消さないよう、これより古いものだけを書きかけの残骸とみなす
+    STALE_TMP_SEC = 3600
+
+    def evict(self):
+        """期限切れ → 容量超過（古い順）の順に、メタと本文を組で削除する。"""
+        entries = {}  # (dir, sha1) -> {"mtime": メタの mtime, "size": 合計, "paths": [...]}
+        now = time.time()
+        removed = 0
+        try:
+            subdirs = [d for d in os.listdir(self.root) if self._ENTRY_DIR_RE.match(d)]
+        except OSError:
+            subdirs = []
+        for sub in subdirs:
+            dirpath = os.path.join(self.root, sub)
+            try:
+                names = os.listdir(dirpath)
+            except OSError:
+                continue
+            for name in names:
+                p = os.path.join(dirpath, name)
+                if self._ENTRY_TMP_RE.match(name):
+                    try:
+                        if now - os.stat(p).st_mtime > self.STALE_TMP_SEC:
+                            os.remove(p)
+                    except OSError:
+                        pass
+                    continue
+                m = self._ENTRY_RE.match(name)
+                if not m:
+                    continue
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    continue
+                e = entries.setdefault((dirpath, m.group(1)), {"mtime": 0.0, "size": 0, "paths": []})
+                e["size"] += st.st_size
+                e["paths"].append(p)
+                # 再検証（touch）でメタだけ書き直すので、鮮度はメタの mtime で見る
+                if m.group(2) == "json":
+                    e["mtime"] = st.st_mtime
+
+        def _drop(e):
+            nonlocal removed
+            for p in e["paths"]:
+                try:
+                    os.remove(p)
+                except OSError:
+                    pass
+            removed += 1
+
+        kept = []
+        for e in entries.values():
+            if self.max_age and now - e["mtime"] > self.max_age:
+                _drop(e)
+            else:
+                kept.append(e)
+        total = sum(e["size"] for e in kept)
+        if self.max_bytes and total > self.max_bytes:
+            for e in sorted(kept, key=lambda e: e["mtime"]):
+                if total <= self.max_bytes:
+                    break
+                _drop(e)
+                total -= e["size"]
+        if removed:
+            print(f"[http-cache] evicted {removed} entries (kept {total / 1024 / 1024:.1f}MB)")
+
+
+_HTTP_DISK_CACHE = None
+
+
+def get_http_cache():
+    global _HTTP_DISK_CACHE
+    if not HTTP_CACHE_ENABLED:
+        return None
+    if _HTTP_DISK_CACHE is None:
+        with _HTTP_ENGINE_LOCK:
+            if _HTTP_DISK_CACHE is None:
+                _HTTP_DISK_CACHE = _HttpDiskCache(HTTP_CACHE_DIR)
+    return _HTTP_DISK_CACHE
+
+
+def http_cache_fetch(url, fetcher, *, validate, ttl=None):
+    """
+    fetcher(extra_headers: dict) -> Response 互換 を条件付き GET 付きで呼ぶ。
+    - TTL 内: fetcher を呼ばずキャッシュを返す
+    - TTL 切れ: 検証子を extra_headers に入れて呼び、304 ならキャッシュを返す
+    - 200 かつ本文あり、かつ validate(resp) が真の時だけ保存する（validate は必須）
+      （Cloudflare のチャレンジページ等を長期キャッシュしないため）
+    返り値には from_cache 属性（True/False）が付く。
+    """
+    cache = get_http_cache()
+    if cache is None:
+        return fetcher({})
+
+    ttl = http_cache_ttl(url) if ttl is None else ttl
+    meta, body = cache.load(url)
+
+    def _cached_response():
+        r = _response_like(
+            200,
+            body,
+            url=meta.get("final_url") or url,
+            headers={"Content-Type": meta.get("content_type") or ""},
+            encoding=meta.get("encoding") or None,
+        )
+        r.from_cache = True
+        return r
+
+    if meta is not None and body and time.time() - float(meta.get("stored_at") or 0) < ttl:
+        cache._bump("fresh")
+        return _cached_response()
+
+    cond = {}
+    if meta is not None and body:
+        if meta.get("etag"):
+            cond["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            cond["If-Modified-Since"] = meta["last_modified"]
+
+    r = fetcher(cond)
+    status = int(getattr(r, "status_code", 0) or 0)
+    if status == 304 and meta is not None and body:
+        cache._bump("revalidated")
+        cache.touch(url, meta)
+        return _cached_response()
+
+    cache._bump("miss")
+    if status == 200 and (getattr(r, "content", None) or getattr(r, "text", "")):
+        try:
+            ok = bool(validate(r))
+        except Exception:
+            ok = False
+        if ok:
+            cache.store(url, r)
+    try:
+        r.from_cache = False
+    except Exception:
+        pass
+    return r
+
+
+def http_cache_marker_validator(marker: str):
+    """http_cache_fetch の validate 用：本文に marker（一覧ページの目印）を含む応答だけ保存する。"""
+    needle = marker.encode("utf-8")
+
+    def _ok(r) -> bool:
+        body = getattr(r, "content", None) or getattr(r, "text", "") or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8", "ignore")
+        return needle in body
+
+    return _ok
+
+
+# 記事ページ用：各 collector が日付判定に使う article:published_time を含む応答だけ保存する
+HTTP_CACHE_ARTICLE_VALIDATOR = http_cache_marker_validator("article:published_time")
+
+
+def http_cache_stats():
+    cache = get_http_cache()
+    return dict(cache.stats) if cache is not None else {}
+
+
+def http_get(url, *, timeout=15, headers=None, allow_redirects=True, cache_validate=None, cache_ttl=None):
+    """
+    共有エンジン経由の GET（同期）。戻り値は requests.Response 互換の属性を持つ。
+    接続エラー等は例外として送出する（requests.get と同じ扱い）。
+    cache_validate を渡した時だけ永続 HTTP キャッシュ（条件付き GET）を通し、
+    それが真を返す応答だけを保存する（チャレンジページ等を何日も返さないため）。
+    """
+    def _fetch(extra_headers=None):
+        h = dict(headers or {})
+        h.update(extra_headers or {})
+        engine = get_http_engine()
+        if engine is None:
+            return shared_http_session().get(
+                url, headers=h or None, timeout=timeout, allow_redirects=allow_redirects
+            )
+        return engine.run(
+            engine.fetch(url, timeout=timeout, headers=h or None, allow_redirects=allow_redirects)
+        )
+
+    if cache_validate is not None:
+        return http_cache_fetch(url, _fetch, ttl=cache_ttl, validate=cache_validate)
+    return _fetch()
+
+
+def http_get_many(urls, *, timeout=15, headers=None):
+    """複数URLをまとめて並列取得（入力順。失敗した要素は例外オブジェクト）。"""
+    urls = list(urls)
+    engine = get_http_engine()
+    if engine is None:
+        out = []
+        for u in urls:
+            try:
+                out.append(http_get(u, timeout=timeout, headers=headers))
+            except Exception as e:
+                out.append(e)
+        return out
+    return engine.run(engine.fetch_many(urls, timeout=timeout, headers=headers))
+
+
+def _raise_for_status(r, url=""):
+    status = int(getattr(r, "status_code", 0) or 0)
+    if status >= 400:
+        raise requests.HTTPError(f"{status} Error for url: {url or getattr(r, 'url', '')}")
+
+
+# 本文が取得できるまで「requestsでリトライする」
+def fetch_with_retry(url, retries=3, wait_seconds=2, cache_validate=None):
     for attempt in range(retries):
         try:
-            res = requests.get(url, timeout=10)
+            res = http_get(url, timeout=10, cache_validate=cache_validate)
             if res.status_code == 200 and res.text.strip():
                 return res
         except Exception as e:
@@ -792,6 +2328,58 @@ def fetch_with_retry(url, retries=3, wait_seconds=2):
     raise Exception(f"Failed to fetch {url} after {retries} attempts.")
 
 
+# === 記事ページ取得のファンアウト（collector 共通） ===
+# 候補URLの記事取得を小さなスレッドプールで並列化し、結果は入力順で返す。
+# FETCH_FANOUT_WORKERS=1 で従来どおりの直列実行。
+FETCH_FANOUT_WORKERS = int(os.getenv("FETCH_FANOUT_WORKERS", "8"))
+FETCH_FANOUT_PER_DOMAIN = int(os.getenv("FETCH_FANOUT_PER_DOMAIN", "4"))
+
+_FANOUT_DOMAIN_SEMS: dict = {}
+_FANOUT_DOMAIN_LOCK = threading.Lock()
+
+
+def _fanout_domain_sem(url: str, per_domain: int):
+    try:
+        host = (urlparse(str(url)).netloc or "").lower()
+    except Exception:
+        host = ""
+    key = (host, per_domain)
+    with _FANOUT_DOMAIN_LOCK:
+        sem = _FANOUT_DOMAIN_SEMS.get(key)
+        if sem is None:
+            sem = threading.BoundedSemaphore(max(1, per_domain))
+            _FANOUT_DOMAIN_SEMS[key] = sem
+        return sem
+
+
+def fanout_ordered(items, worker, *, max_workers=None, per_domain=None, label="fanout"):
+    """
+    items の各要素（通常は記事URL）に worker を並列適用し、入力順のリストで返す。
+    - 同時実行数は max_workers（既定 FETCH_FANOUT_WORKERS）
+    - 同一ドメインへの同時接続は per_domain（既定 FETCH_FANOUT_PER_DOMAIN）まで
+    - worker の例外はログを出して None 扱い（直列ループの try/except continue と同じ）
+    """
+    items = list(items)
+    workers = FETCH_FANOUT_WORKERS if max_workers is None else max_workers
+    per_domain = FETCH_FANOUT_PER_DOMAIN if per_domain is None else per_domain
+    workers = max(1, min(int(workers or 1), len(items) or 1))
+
+    def _run(item):
+        try:
+            with _fanout_domain_sem(item, per_domain):
+                return worker(item)
+        except Exception as e:
+            print(f"[{label}] fail {item}: {e}")
+            return None
+
+    if workers == 1:
+        return [_run(it) for it in items]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=label) as ex:
+        return list(ex.map(_run, items))
+
+
 # 本文が空なら「一定秒数待って再取得」
 def extract_paragraphs_with_wait(soup_article, retries=2, wait_seconds=2):
     for attempt in range(retries + 1):
@@ -930,7 +2518,6 @@ def _ensure_meta_dates(url_to_meta: dict, date_mmt_iso: str):
     url_to_meta: { url: {"source":..., "date": str|None, ...}, ... }
     date_mmt_iso: "YYYY-MM-DD"（ダイジェスト対象日/MMT）
     """
-    from bs4 import BeautifulSoup
     from datetime import datetime, timezone, timedelta
     MMT = timezone(timedelta(hours=6, minutes=30))
 
@@ -941,8 +2528,8 @@ def _ensure_meta_dates(url_to_meta: dict, date_mmt_iso: str):
     fixed = 0
     for u in missing:
         try:
-            resp = fetch_once_requests(u, timeout=10)
-            soup = BeautifulSoup(resp, "html.parser")
+            resp = fetch_once_requests(u, timeout=10, cache_validate=HTTP_CACHE_ARTICLE_VALIDATOR)
+            soup = make_soup(resp)
             meta = soup.find("meta", attrs={"property": "article:published_time"})
             iso = meta.get("content").strip() if meta and meta.get("content") else None
             if iso:
@@ -958,14 +2545,97 @@ def _ensure_meta_dates(url_to_meta: dict, date_mmt_iso: str):
     print(f"[info] meta date backfilled: {fixed} fetched, {len(missing)-fixed} filled with digest date")
 
 # === requests を使うシンプルな fetch_once（1回） ===
-def fetch_once_requests(url, timeout=15):
-    r = requests.get(url, timeout=timeout)
-    r.raise_for_status()
+def fetch_once_requests(url, timeout=15, cache_validate=None):
+    r = http_get(url, timeout=timeout, cache_validate=cache_validate)
+    _raise_for_status(r, url)
     # 文字化け回避のため bytes を返す（デコードは BeautifulSoup に任せる）
     return r.content
 
 
 # === 再フェッチ付き・本文取得ユーティリティ ===
+# === HTML パース層（全 extractor 共通） ===
+# bytes は先に文字コードを1回だけ決めて decode してから渡す（パーサ側の推測 → 再パースをしない）。
+# ツリービルダーは既定（HTML_PARSER=auto）で lxml。ただし lxml は閉じていない <p> の扱いが
+# html.parser と違い本文が変わるので、</p> が足りない文書だけ html.parser でパースする
+# （test_fetch_articles.py のコーパス比較テストで、それ以外の抽出結果が変わらないことを確認済み）。
+# HTML_PARSER=html.parser / lxml で固定もできる。lxml が入っていなければ html.parser。
+HTML_PARSER = os.getenv("HTML_PARSER", "auto")
+
+try:
+    import lxml  # noqa: F401
+    _LXML_AVAILABLE = True
+except Exception:
+    _LXML_AVAILABLE = False
+
+_P_OPEN_RE = re.compile(r"<p[\s>]", re.I)
+_P_CLOSE_RE = re.compile(r"</p\s*>", re.I)
+
+_META_CHARSET_RE = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_\-:.]+)""", re.I
+)
+# 誤宣言が多い latin-1 系。UTF-8 として読めるならそちらを採用する
+_LATIN1_FAMILY = ("iso8859-1", "latin-1", "cp1252")
+
+
+def detect_html_encoding(data: bytes, declared: Optional[str] = None) -> str:
+    """
+    HTML bytes の文字コードを判定する（BOM → 宣言 → UTF-8 → windows-1252 の順）。
+    declared は HTTP ヘッダ等で分かっている場合のみ。無ければ <meta charset> を見る。
+    """
+    import codecs
+
+    if data.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+
+    def _utf8_ok() -> bool:
+        try:
+            data.decode("utf-8")
+            return True
+        except UnicodeDecodeError:
+            return False
+
+    if not declared:
+        m = _META_CHARSET_RE.search(data[:4096])
+        declared = m.group(1).decode("ascii", "ignore") if m else None
+    if declared:
+        try:
+            name = codecs.lookup(declared.strip()).name
+        except LookupError:
+            name = None
+        if name in _LATIN1_FAMILY:
+            return "utf-8" if _utf8_ok() else "windows-1252"
+        if name:
+            return name
+
+    return "utf-8" if _utf8_ok() else "windows-1252"
+
+
+def choose_html_parser(html: str) -> str:
+    """HTML_PARSER=auto の時のパーサ：閉じていない <p> がある文書だけ html.parser、それ以外は lxml。"""
+    if HTML_PARSER != "auto":
+        return HTML_PARSER
+    if not _LXML_AVAILABLE:
+        return "html.parser"
+    if len(_P_OPEN_RE.findall(html)) > len(_P_CLOSE_RE.findall(html)):
+        return "html.parser"
+    return "lxml"
+
+
+def make_soup(html, *, declared_encoding: Optional[str] = None, parser: Optional[str] = None):
+    """
+    HTML(bytes/str) を1回だけパースして BeautifulSoup を返す。
+    - bytes は detect_html_encoding で判定した文字コードで decode してからパース
+    - パーサは parser 指定 → choose_html_parser（既定は lxml、閉じていない <p> のある文書は html.parser）
+    """
+    if isinstance(html, (bytes, bytearray)):
+        data = bytes(html)
+        html = data.decode(detect_html_encoding(data, declared_encoding), errors="replace")
+    html = html or ""
+    return BeautifulSoup(html, parser or choose_html_parser(html))
+
+
 def get_body_with_refetch(
     url, fetcher, extractor, retries=3, wait_seconds=2, quiet=False
 ):
@@ -977,13 +2647,8 @@ def get_body_with_refetch(
     for attempt in range(retries + 1):
         try:
             html = fetcher(url)
-            # bytes/str どちらでも BeautifulSoup に渡せる
-            soup = BeautifulSoup(html, "html.parser")
-
-            # 誤って latin-1 系で解釈された場合は UTF-8 で再解釈して保険をかける
-            enc = (getattr(soup, "original_encoding", None) or "").lower()
-            if enc in ("iso-8859-1", "latin-1", "windows-1252"):
-                soup = BeautifulSoup(html, "html.parser", from_encoding="utf-8")
+            # bytes/str どちらでも可。latin-1 系の誤宣言は make_soup 側で UTF-8 を優先する
+            soup = make_soup(html)
 
             body = extractor(soup)
             if body:
@@ -1002,13 +2667,176 @@ def get_body_with_refetch(
     return ""
 
 
+# === フェッチ戦略ルーター（ドメイン × 手段 ごとの成功率 / レイテンシを学習） ===
+# curl_cffi → cloudscraper → requests（さらに Unlocker / Browser）の固定ラダーだと、
+# ブロック期間中は毎回すべての失敗とバックオフを払うことになる。
+# - (ドメイン, 手段) ごとに試行数 / 成功数 / レイテンシ(EWMA) / 連続失敗数を記録
+# - 成功率（ラプラス平滑）→ レイテンシの順で並べ替え、当たりやすい手段から試す
+# - 連続失敗が閾値を超えた手段はサーキットブレーカーで一定時間スキップ
+# - 状態は JSON に保存して次回 cron に持ち越す（.http_cache と一緒にキャッシュされる）
+FETCH_ROUTER_ENABLED = os.getenv("FETCH_ROUTER_ENABLED", "1") != "0"
+FETCH_ROUTER_STATE = os.getenv(
+    "FETCH_ROUTER_STATE", os.path.join(HTTP_CACHE_DIR, "fetch_router.json")
+)
+FETCH_ROUTER_BREAKER_FAILS = int(os.getenv("FETCH_ROUTER_BREAKER_FAILS", "3"))
+FETCH_ROUTER_BREAKER_COOLDOWN = int(os.getenv("FETCH_ROUTER_BREAKER_COOLDOWN", "1800"))
+FETCH_ROUTER_MIN_ATTEMPTS = int(os.getenv("FETCH_ROUTER_MIN_ATTEMPTS", "3"))
+FETCH_ROUTER_EWMA_ALPHA = 0.3
+
+
+def _router_domain(url):
+    try:
+        host = (urlparse(url).netloc or "").lower()
+    except Exception:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class _FetchStrategyRouter:
+    def __init__(self, path=FETCH_ROUTER_STATE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._dirty = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if isinstance(raw, dict):
+                self._stats = {k: v for k, v in raw.items() if isinstance(v, dict)}
+        except Exception:
+            self._stats = {}
+
+    def _entry(self, domain, tier):
+        key = f"{domain}|{tier}"
+        e = self._stats.get(key)
+        if e is None:
+            e = {"attempts": 0, "successes": 0, "latency": 0.0, "consecutive_failures": 0, "open_until": 0.0}
+            self._stats[key] = e
+        return e
+
+    def is_open(self, url, tier):
+        """ブレーカーが開いている（=当面スキップすべき）なら True。"""
+        if not FETCH_ROUTER_ENABLED:
+            return False
+        with self._lock:
+            e = self._stats.get(f"{_router_domain(url)}|{tier}")
+            return bool(e) and float(e.get("open_until") or 0) > time.time()
+
+    def order(self, url, tiers):
+        """
+        tiers（既定の優先順）を、このドメインで当たりやすい順に並べ替えて返す。
+        ブレーカーが開いている手段は外す（全部開いていれば既定順のまま全部返す）。
+        実績が少ない間は既定順を崩さない。
+        """
+        tiers = list(tiers)
+        if not FETCH_ROUTER_ENABLED:
+            return tiers
+        domain = _router_domain(url)
+        now = time.time()
+        with self._lock:
+            entries = {t: self._stats.get(f"{domain}|{t}") or {} for t in tiers}
+        usable = [t for t in tiers if float(entries[t].get("open_until") or 0) <= now]
+        if not usable:
+            return tiers
+
+        def _score(t):
+            e = entries[t]
+            attempts = int(e.get("attempts") or 0)
+            if attempts < FETCH_ROUTER_MIN_ATTEMPTS:
+                return (-0.5, 0.0)  # 実績不足は成功率 0.5 扱い（同点は既定順＝安定ソート）
+            rate = (int(e.get("successes") or 0) + 1) / (attempts + 2)
+            return (-round(rate, 1), float(e.get("latency") or 0.0))
+
+        return sorted(usable, key=_score)
+
+    def record(self, url, tier, ok, latency):
+        if not FETCH_ROUTER_ENABLED:
+            return
+        domain = _router_domain(url)
+        with self._lock:
+            e = self._entry(domain, tier)
+            e["attempts"] = int(e["attempts"]) + 1
+            prev = float(e.get("latency") or 0.0)
+            e["latency"] = latency if not prev else (
+                FETCH_ROUTER_EWMA_ALPHA * latency + (1 - FETCH_ROUTER_EWMA_ALPHA) * prev
+            )
+            if ok:
+                e["successes"] = int(e["successes"]) + 1
+                e["consecutive_failures"] = 0
+                e["open_until"] = 0.0
+            else:
+                e["consecutive_failures"] = int(e["consecutive_failures"]) + 1
+                if e["consecutive_failures"] >= FETCH_ROUTER_BREAKER_FAILS:
+                    e["open_until"] = time.time() + FETCH_ROUTER_BREAKER_COOLDOWN
+                    print(
+                        f"[router] breaker open domain={domain} tier={tier} "
+                        f"fails={e['consecutive_failures']} cooldown={FETCH_ROUTER_BREAKER_COOLDOWN}s"
+                    )
+            self._dirty = True
+
+    def snapshot(self):
+        with self._lock:
+            return {k: dict(v) for k, v in self._stats.items()}
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {k: dict(v) for k, v in self._stats.items()}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"[router] save failed: {e}")
+
+
+_FETCH_ROUTER = None
+
+
+def fetch_router():
+    global _FETCH_ROUTER
+    if _FETCH_ROUTER is None:
+        with _HTTP_ENGINE_LOCK:
+            if _FETCH_ROUTER is None:
+                import atexit
+
+                _FETCH_ROUTER = _FetchStrategyRouter()
+                atexit.register(_FETCH_ROUTER.save)
+    return _FETCH_ROUTER
+
+
+def run_routed_tiers(url, tiers, *, is_ok=None):
+    """
+    tiers: [(name, fn)]（既定の優先順）。fn() は結果 or None を返す。
+    ルーターの順に試し、None 以外が返ったらそれを返す（従来どおり 403 応答も「結果」として返る）。
+    is_ok(result) で成功判定（既定: status_code が 200/304）。
+    """
+    router = fetch_router()
+    fns = dict(tiers)
+    if is_ok is None:
+        def is_ok(res):
+            return getattr(res, "status_code", None) in (200, 304)
+    for name in router.order(url, [n for n, _ in tiers]):
+        t0 = time.time()
+        res = fns[name]()
+        router.record(url, name, ok=(res is not None and is_ok(res)), latency=time.time() - t0)
+        if res is not None:
+            return res
+    return None
+
+
 # === Irrawaddy専用 ===
 # 本文が取得できるまで「requestsでリトライする」
-def fetch_with_retry_irrawaddy(url, retries=3, wait_seconds=2, session=None):
+def fetch_with_retry_irrawaddy(url, retries=3, wait_seconds=2, session=None, extra_headers=None):
     """
     Irrawaddy 専用フェッチャ（単発トライ版）。
     - curl_cffi で1回 → 失敗なら cloudscraper で1回 → 失敗なら requests で1回。
     - 追加のリトライや /amp への再試行は実施しない。
+    - extra_headers（条件付き GET の検証子など）を渡した場合、304 はそのまま返す。
     """
     import os
     import random
@@ -1033,6 +2861,8 @@ def fetch_with_retry_irrawaddy(url, retries=3, wait_seconds=2, session=None):
         "Referer": "https://www.irrawaddy.com/",
         "Connection": "keep-alive",
     }
+    if extra_headers:
+        HEADERS.update(extra_headers)
 
     def _amp_url(u: str) -> str:
         # https://.../path/ なら https://.../path/amp
@@ -1055,78 +2885,98 @@ def fetch_with_retry_irrawaddy(url, retries=3, wait_seconds=2, session=None):
         return SimpleNamespace(status_code=status_code, text=(text or ""), content=content, url=url)
 
     # --- Try 1: curl_cffi (Chrome 指紋) 単発 ---
-    try:
-        from curl_cffi import requests as cfr  # type: ignore[import-not-found]
-        proxies = {
-            # Irrawaddy専用のプロキシ指定があれば最優先で使う（他サイトには影響しない）
-            "http":  os.getenv("IRRAWADDY_HTTP_PROXY")  or os.getenv("HTTP_PROXY")  or os.getenv("http_proxy"),
-            "https": os.getenv("IRRAWADDY_HTTPS_PROXY") or os.getenv("HTTPS_PROXY") or os.getenv("https_proxy"),
-        }
-        r = cfr.get(
-            url,
-            headers=HEADERS,
-            impersonate="chrome124",
-            timeout=30,
-            allow_redirects=True,
-            proxies={k: v for k, v in proxies.items() if v},
-        )
-        if r.status_code == 200 and (r.text or "").strip():
-            return r
-        if r.status_code == 403:
-            return _as_response_like(403, getattr(r, "text", "") or "")
-    except Exception as e:
-        print(f"[fetch-cffi] EXC: {e} → {url}")
+    def _tier_curl_cffi():
+        try:
+            from curl_cffi import requests as cfr  # type: ignore[import-not-found]
+            proxies = {
+                # Irrawaddy専用のプロキシ指定があれば最優先で使う（他サイトには影響しない）
+                "http":  os.getenv("IRRAWADDY_HTTP_PROXY")  or os.getenv("HTTP_PROXY")  or os.getenv("http_proxy"),
+                "https": os.getenv("IRRAWADDY_HTTPS_PROXY") or os.getenv("HTTPS_PROXY") or os.getenv("https_proxy"),
+            }
+            r = cfr.get(
+                url,
+                headers=HEADERS,
+                impersonate="chrome124",
+                timeout=30,
+                allow_redirects=True,
+                proxies={k: v for k, v in proxies.items() if v},
+            )
+            if r.status_code == 304:
+                return r
+            if r.status_code == 200 and (r.text or "").strip():
+                return r
+            if r.status_code == 403:
+                return _as_response_like(403, getattr(r, "text", "") or "")
+        except Exception as e:
+            print(f"[fetch-cffi] EXC: {e} → {url}")
 
     # --- Try 2: cloudscraper 単発 ---
-    try:
-        import cloudscraper
-        import requests as rq
-        sess = session or rq.Session()
-        scraper = cloudscraper.create_scraper(
-            sess=sess,
-            browser={"browser": "chrome", "platform": "windows", "mobile": False},
-            delay=7,
-        )
-        r = scraper.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
-        if r.status_code == 200 and getattr(r, "text", "").strip():
-            return r
-        if r.status_code == 403:
-            return _as_response_like(403, getattr(r, "text", "") or "")
-    except Exception as e:
-        print(f"[fetch-cs] EXC: {e} → {url}")
+    def _tier_cloudscraper():
+        try:
+            import cloudscraper
+            sess = session or shared_http_session()
+            scraper = cloudscraper.create_scraper(
+                sess=sess,
+                browser={"browser": "chrome", "platform": "windows", "mobile": False},
+                delay=7,
+            )
+            r = scraper.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
+            if r.status_code == 304:
+                return r
+            if r.status_code == 200 and getattr(r, "text", "").strip():
+                return r
+            if r.status_code == 403:
+                return _as_response_like(403, getattr(r, "text", "") or "")
+        except Exception as e:
+            print(f"[fetch-cs] EXC: {e} → {url}")
 
     # --- Try 3: requests 単発（/news/ のときのみ /amp を1回だけ試す） ---
-    try:
-        import requests
-        sess = session or requests.Session()
-        r2 = sess.get(url, headers=HEADERS, timeout=20, allow_redirects=True)
-        print(
-            f"[fetch-rq] final: HTTP {r2.status_code} len={len(getattr(r2,'text',''))} → {url}"
-        )
-        if r2.status_code == 200 and getattr(r2, "text", "").strip():
-            return r2
-        if r2.status_code == 403:
-            return _as_response_like(403, getattr(r2, "text", "") or "")
-        # 403/503 かつ /news/ の記事URLに限り、/amp を“1回だけ”試す
-        if r2.status_code in (403, 503) and "/news/" in url and "/category/" not in url:
-            amp = _amp_url(url)
-            r3 = sess.get(amp, headers=HEADERS, timeout=20, allow_redirects=True)
+    def _tier_requests():
+        try:
+            sess = session or shared_http_session()
+            r2 = sess.get(url, headers=HEADERS, timeout=20, allow_redirects=True)
             print(
-                f"[fetch-rq] amp: HTTP {r3.status_code} len={len(getattr(r3,'text',''))} → {amp}"
+                f"[fetch-rq] final: HTTP {r2.status_code} len={len(getattr(r2,'text',''))} → {url}"
             )
-            if r3.status_code == 200 and getattr(r3, "text", "").strip():
-                return r3
-            if r3.status_code == 403:
-                return _as_response_like(403, getattr(r3, "text", "") or "")
-        try:
-            svr = r2.headers.get("server") or r2.headers.get("Server")
-            ray = r2.headers.get("cf-ray")
-            sucuri = r2.headers.get("x-sucuri-id") or r2.headers.get("x-sucuri-block")
-            print(f"[fetch-rq] headers: server={svr} cf-ray={ray} sucuri={sucuri}")
-        except Exception:
-            pass
-    except Exception as e:
-        print(f"[fetch-rq] EXC final: {e} → {url}")
+            if r2.status_code == 304:
+                return r2
+            if r2.status_code == 200 and getattr(r2, "text", "").strip():
+                return r2
+            if r2.status_code == 403:
+                return _as_response_like(403, getattr(r2, "text", "") or "")
+            # 403/503 かつ /news/ の記事URLに限り、/amp を“1回だけ”試す
+            if r2.status_code in (403, 503) and "/news/" in url and "/category/" not in url:
+                amp = _amp_url(url)
+                r3 = sess.get(amp, headers=HEADERS, timeout=20, allow_redirects=True)
+                print(
+                    f"[fetch-rq] amp: HTTP {r3.status_code} len={len(getattr(r3,'text',''))} → {amp}"
+                )
+                if r3.status_code == 200 and getattr(r3, "text", "").strip():
+                    return r3
+                if r3.status_code == 403:
+                    return _as_response_like(403, getattr(r3, "text", "") or "")
+            try:
+                svr = r2.headers.get("server") or r2.headers.get("Server")
+                ray = r2.headers.get("cf-ray")
+                sucuri = r2.headers.get("x-sucuri-id") or r2.headers.get("x-sucuri-block")
+                print(f"[fetch-rq] headers: server={svr} cf-ray={ray} sucuri={sucuri}")
+            except Exception:
+                pass
+        except Exception as e:
+            print(f"[fetch-rq] EXC final: {e} → {url}")
+
+    # 既定順は curl_cffi → cloudscraper → requests。ドメインごとの実績でルーターが並べ替える。
+    # 403 応答は従来どおり「結果」として即返す（上位で Unlocker 等へエスカレーション）。
+    res = run_routed_tiers(
+        url,
+        [
+            ("curl_cffi", _tier_curl_cffi),
+            ("cloudscraper", _tier_cloudscraper),
+            ("requests", _tier_requests),
+        ],
+    )
+    if res is not None:
+        return res
 
     raise Exception(f"Failed to fetch {url} after {retries} attempts.")
 
@@ -1147,94 +2997,308 @@ if not _logger.handlers:
     _logger.addHandler(h)
 _logger.setLevel(logging.INFO)
 
-def brightdata_browser_stats():
-    """(count, last_urls_list)"""
+_BD_BROWSER_LATENCIES = deque(maxlen=200)  # 1呼び出しごとの所要秒
+_BD_BROWSER_TOTAL_SEC = 0.0
+_BD_BROWSER_FAILS = 0
+
+BD_BROWSER_POOL_SIZE = int(os.getenv("BD_BROWSER_POOL_SIZE", "3"))
+# 同じセッションを使い回すページ数の上限（超えたら接続し直す）
+BD_BROWSER_MAX_PAGES_PER_SESSION = int(os.getenv("BD_BROWSER_MAX_PAGES_PER_SESSION", "20"))
+
+
+def brightdata_browser_stats(*, with_latency: bool = False):
+    """
+    (count, last_urls_list)
+    with_latency=True のときは (count, last_urls_list, latency) を返す。
+    latency: {"calls", "fails", "total_sec", "avg_sec", "p50_sec", "max_sec", "last_sec"}
+    """
     with _BD_LOCK:
-        return _BD_BROWSER_CALLS, list(_BD_BROWSER_URLS)
+        count, urls = _BD_BROWSER_CALLS, list(_BD_BROWSER_URLS)
+        lat = sorted(_BD_BROWSER_LATENCIES)
+        last = _BD_BROWSER_LATENCIES[-1] if _BD_BROWSER_LATENCIES else 0.0
+        total, fails = _BD_BROWSER_TOTAL_SEC, _BD_BROWSER_FAILS
+    if not with_latency:
+        return count, urls
+    latency = {
+        "calls": count,
+        "fails": fails,
+        "total_sec": round(total, 2),
+        "avg_sec": round(sum(lat) / len(lat), 2) if lat else 0.0,
+        "p50_sec": round(lat[len(lat) // 2], 2) if lat else 0.0,
+        "max_sec": round(lat[-1], 2) if lat else 0.0,
+        "last_sec": round(last, 2),
+    }
+    return count, urls, latency
 
-def fetch_html_via_brightdata_browser(url: str, *, timeout_ms: int = 120_000) -> str:
+
+def _bd_browser_record_call(url: str) -> int:
+    global _BD_BROWSER_CALLS
+    with _BD_LOCK:
+        _BD_BROWSER_CALLS += 1
+        _BD_BROWSER_URLS.append(url)
+        return _BD_BROWSER_CALLS
+
+
+def _bd_browser_record_result(url: str, elapsed: float, ok: bool) -> None:
+    global _BD_BROWSER_TOTAL_SEC, _BD_BROWSER_FAILS
+    with _BD_LOCK:
+        _BD_BROWSER_LATENCIES.append(elapsed)
+        _BD_BROWSER_TOTAL_SEC += elapsed
+        if not ok:
+            _BD_BROWSER_FAILS += 1
+
+
+class _BrightDataBrowserPool:
     """
-    Bright Data Browser API (Scraping Browser) 経由でHTMLを取得して返す。
-    - 認証: env BRIGHTDATA_BROWSER_AUTH="USER:PASS"
-    - 接続先: wss://{AUTH}@brd.superproxy.io:9222
+    Bright Data Browser API の接続プール。
+    - 専用スレッドのイベントループ上で Playwright を1回だけ起動
+    - connect_over_cdp 済みのセッションを最大 size 本まで保持して使い回す
+    - 1セッションあたり max_pages ページで接続し直す / 切断・失敗したセッションは捨てる
+    - fetch_many() で複数URLを同じループ上で並列取得（所要秒は URL ごとに計る）
     """
-    import os, asyncio
-    auth = (os.getenv("BRIGHTDATA_BROWSER_AUTH") or "").strip()
-    if not auth:
-        return ""
 
-    try:
+    def __init__(self, auth: str, size: int = BD_BROWSER_POOL_SIZE, max_pages: int = BD_BROWSER_MAX_PAGES_PER_SESSION):
+        import asyncio
+
+        self.endpoint_url = f"wss://{auth}@brd.superproxy.io:9222"
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self._pw = None
+        self._idle = None
+        self._slots = None
+        self._start_lock = None
+        self._uses = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="bd-browser-pool", daemon=True
+        )
+        self._thread.start()
+
+    async def _ensure_started(self):
+        import asyncio
         from playwright.async_api import async_playwright
-    except Exception:
-        # playwright が入ってない環境では何もしない
-        return ""
 
-    # ✅ ここで「BD browser を呼ぶ」ことが確定
-    try:
-        with _BD_LOCK:
-            global _BD_BROWSER_CALLS
-            _BD_BROWSER_CALLS += 1
-            _BD_BROWSER_URLS.append(url)
-            n = _BD_BROWSER_CALLS
-        _logger.info(f"call#{n} url={url}")
-    except Exception:
-        pass
+        if self._pw is not None:
+            return
+        # 最初の fetch が同時に来ても Playwright を1回だけ起動する（await の間に二重起動しない）
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._pw is None:
+                self._idle = []
+                self._slots = asyncio.Semaphore(self.size)
+                self._pw = await async_playwright().start()
+
+    async def _acquire(self):
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                browser = self._idle.pop()
+                if browser.is_connected():
+                    return browser
+                self._uses.pop(id(browser), None)
+            browser = await self._pw.chromium.connect_over_cdp(self.endpoint_url)
+            self._uses[id(browser)] = 0
+            _logger.info(f"session connected (pool={self.size})")
+            return browser
+        except Exception:
+            self._slots.release()
+            raise
+
+    async def _release(self, browser, *, broken: bool):
+        try:
+            uses = self._uses.get(id(browser), 0)
+            if broken or not browser.is_connected() or uses >= self.max_pages:
+                self._uses.pop(id(browser), None)
+                try:
+                    await browser.close()
+                except Exception:
+                    pass
+            else:
+                self._idle.append(browser)
+        finally:
+            self._slots.release()
+
+    async def _fetch(self, url: str, timeout_ms: int) -> str:
+        html, _elapsed = await self._fetch_timed(url, timeout_ms)
+        if isinstance(html, Exception):
+            raise html
+        return html
+
+    async def _fetch_timed(self, url: str, timeout_ms: int):
+        """(HTML か例外, 所要秒)。所要秒はセッション確保後〜ページ取得までで、プールの空き待ちは含めない。"""
+        t0 = None
+        try:
+            await self._ensure_started()
+            browser = await self._acquire()
+            t0 = time.time()
+            return await self._fetch_on(browser, url, timeout_ms), time.time() - t0
+        except Exception as e:
+            return e, (time.time() - t0) if t0 is not None else 0.0
 
-    async def _run() -> str:
-        endpoint_url = f"wss://{auth}@brd.superproxy.io:9222"
-        async with async_playwright() as p:
-            browser = await p.chromium.connect_over_cdp(endpoint_url)
+    async def _fetch_on(self, browser, url: str, timeout_ms: int) -> str:
+        broken = False
+        try:
+            page = await browser.new_page()
             try:
-                page = await browser.new_page()
-                
                 # Cloudflare系は待ちを少し長めに
                 await page.goto(url, timeout=timeout_ms, wait_until="domcontentloaded")
-                # 必要なら networkidle まで待つ（重い場合は domcontentloaded のままでもOK）
-                # await page.wait_for_load_state("networkidle", timeout=timeout_ms)
                 html = await page.content()
                 return (html or "").strip()
             finally:
-                await browser.close()
-
-    try:
-        html = asyncio.run(_run())
-        try:
-            _logger.info(f"result len={len(html or '')} url={url}")
+                try:
+                    await page.close()
+                except Exception:
+                    pass
         except Exception:
-            pass
-        return html
+            broken = True
+            raise
+        finally:
+            self._uses[id(browser)] = self._uses.get(id(browser), 0) + 1
+            await self._release(browser, broken=broken)
 
-    except RuntimeError:
-        # 既に event loop がある環境向け保険（通常GitHub Actionsは不要）
-        try:
-            loop = asyncio.get_event_loop()
-            html = loop.run_until_complete(_run())
+    def fetch(self, url: str, *, timeout_ms: int = 120_000) -> str:
+        import asyncio
+
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, timeout_ms), self._loop).result()
+
+    async def _fetch_many(self, urls, timeout_ms: int):
+        import asyncio
+
+        return await asyncio.gather(*(self._fetch_timed(u, timeout_ms) for u in urls))
+
+    def fetch_many(self, urls, *, timeout_ms: int = 120_000) -> list:
+        """URLのリストを並列取得し、入力順で [(HTML か例外, 所要秒), ...] を返す。"""
+        import asyncio
+
+        return asyncio.run_coroutine_threadsafe(
+            self._fetch_many(list(urls), timeout_ms), self._loop
+        ).result()
+
+    async def _close(self):
+        for browser in list(self._idle or []):
             try:
-                _logger.info(f"result len={len(html or '')} url={url}")
+                await browser.close()
             except Exception:
                 pass
-            return html
-        except Exception as e:
+        self._idle = []
+        if self._pw is not None:
             try:
-                _logger.exception(f"event-loop fallback failed url={url}: {e}")
+                await self._pw.stop()
             except Exception:
                 pass
-            return ""
+            self._pw = None
+
+    def close(self):
+        import asyncio
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(timeout=30)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
 
+_BD_BROWSER_POOL = None
+
+
+def brightdata_browser_pool():
+    """プロセス共有の _BrightDataBrowserPool（認証情報 / playwright が無ければ None）。"""
+    global _BD_BROWSER_POOL
+    auth = (os.getenv("BRIGHTDATA_BROWSER_AUTH") or "").strip()
+    if not auth:
+        return None
+    try:
+        import playwright.async_api  # noqa: F401
+    except Exception:
+        # playwright が入ってない環境では何もしない
+        return None
+    if _BD_BROWSER_POOL is None:
+        with _BD_LOCK:
+            if _BD_BROWSER_POOL is None:
+                import atexit
+
+                _BD_BROWSER_POOL = _BrightDataBrowserPool(auth)
+                atexit.register(_BD_BROWSER_POOL.close)
+    return _BD_BROWSER_POOL
+
+
+def fetch_html_via_brightdata_browser(url: str, *, timeout_ms: int = 120_000) -> str:
+    """
+    Bright Data Browser API (Scraping Browser) 経由でHTMLを取得して返す。
+    - 認証: env BRIGHTDATA_BROWSER_AUTH="USER:PASS"
+    - 接続先: wss://{AUTH}@brd.superproxy.io:9222（接続はプールで使い回す）
+    """
+    pool = brightdata_browser_pool()
+    if pool is None:
+        return ""
+
+    # ✅ ここで「BD browser を呼ぶ」ことが確定
+    n = _bd_browser_record_call(url)
+    _logger.info(f"call#{n} url={url}")
+
+    t0 = time.time()
+    try:
+        html = pool.fetch(url, timeout_ms=timeout_ms)
+        elapsed = time.time() - t0
+        _bd_browser_record_result(url, elapsed, ok=bool(html))
+        _logger.info(f"result len={len(html or '')} sec={elapsed:.1f} url={url}")
+        return html
     except Exception as e:
+        _bd_browser_record_result(url, time.time() - t0, ok=False)
         try:
             _logger.exception(f"fetch failed url={url}: {e}")
         except Exception:
             pass
         return ""
 
+
+def fetch_html_via_brightdata_browser_many(urls, *, timeout_ms: int = 120_000) -> list:
+    """
+    複数URLをプールの接続で並列取得する。戻り値は入力順の [(HTML, 所要秒), ...]（失敗は ""）。
+    所要秒は URL ごとの実測（バッチ全体の壁時計ではない）なので、ルーターの実績にそのまま使える。
+    """
+    urls = list(urls)
+    pool = brightdata_browser_pool()
+    if pool is None or not urls:
+        return [("", 0.0) for _ in urls]
+
+    for u in urls:
+        n = _bd_browser_record_call(u)
+        _logger.info(f"call#{n} url={u} (batch={len(urls)})")
+
+    t0 = time.time()
+    try:
+        results = pool.fetch_many(urls, timeout_ms=timeout_ms)
+    except Exception as e:
+        _logger.exception(f"batch fetch failed n={len(urls)}: {e}")
+        results = [(e, 0.0) for _ in urls]
+
+    out = []
+    for u, (res, elapsed) in zip(urls, results):
+        ok = isinstance(res, str) and bool(res)
+        _bd_browser_record_result(u, elapsed, ok=ok)
+        if not ok and isinstance(res, Exception):
+            _logger.warning(f"fetch failed url={u}: {type(res).__name__}: {res}")
+        out.append((res if ok else "", elapsed))
+    _logger.info(
+        f"batch done n={len(urls)} ok={sum(1 for h, _ in out if h)} sec={time.time() - t0:.1f}"
+    )
+    return out
+
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 BD_UNLOCKER_CONNECT_TIMEOUT = int(os.getenv("BD_UNLOCKER_CONNECT_TIMEOUT", "10"))
 BD_UNLOCKER_READ_TIMEOUT = int(os.getenv("BD_UNLOCKER_READ_TIMEOUT", "60"))
 BD_UNLOCKER_TIMEOUT = (BD_UNLOCKER_CONNECT_TIMEOUT, BD_UNLOCKER_READ_TIMEOUT)
 
-def _new_bd_session():
+BD_UNLOCKER_MAX_WORKERS = int(os.getenv("BD_UNLOCKER_MAX_WORKERS", "8"))
+# Web Unlocker の課金目安（USD / 成功1000リクエスト）。stats の概算コスト用
+BD_UNLOCKER_COST_PER_1K = float(os.getenv("BD_UNLOCKER_COST_PER_1K", "1.5"))
+
+
+def _new_bd_session(*, keep_alive: bool = False):
     s = requests.Session()
     s.headers.update({
         "User-Agent": (
@@ -1246,15 +3310,16 @@ def _new_bd_session():
         "Accept-Language": "en-US,en;q=0.9",
         "Cache-Control": "no-cache",
         "Pragma": "no-cache",
-        "Connection": "close",
     })
+    if not keep_alive:
+        s.headers["Connection"] = "close"
     return s
 
-def fetch_html_via_brightdata_unlocker(url: str, *, timeout=BD_UNLOCKER_TIMEOUT, retry_once: bool = True) -> str:
+
+def _bd_unlocker_proxy_url() -> str:
     zone = (os.getenv("BRIGHTDATA_WEB_UNLOCKER_ZONE") or "").strip()
     password = (os.getenv("BRIGHTDATA_WEB_UNLOCKER_PASSWORD") or "").strip()
     if not zone or not password:
-        print(f"[bd-unlocker] skip missing credentials → {url}")
         return ""
 
     if zone.startswith("brd-customer-"):
@@ -1267,56 +3332,188 @@ def fetch_html_via_brightdata_unlocker(url: str, *, timeout=BD_UNLOCKER_TIMEOUT,
 
     proxy_user_enc = quote(proxy_user, safe="")
     password_enc = quote(password, safe="")
-    proxy_url = f"http://{proxy_user_enc}:{password_enc}@{proxy_host}:{proxy_port}"
+    return f"http://{proxy_user_enc}:{password_enc}@{proxy_host}:{proxy_port}"
 
-    attempts = 2 if retry_once else 1
-    last_exc = None
-    print(f"[bd-unlocker] start attempts={attempts} timeout={timeout} → {url}")
 
-    for attempt in range(1, attempts + 1):
-        sess = _new_bd_session()
-        try:
-            r = sess.get(
-                url,
-                proxies={"http": proxy_url, "https": proxy_url},
-                timeout=timeout,
-                allow_redirects=True,
-                verify=False,
-            )
-            if r.status_code == 200 and (r.text or "").strip():
+class _BrightDataUnlockerClient:
+    """
+    Web Unlocker 用クライアント。
+    - keep-alive の Session を1つ共有し、プロキシ接続（CONNECT トンネル）を使い回す
+    - fetch_many() で複数URLを BD_UNLOCKER_MAX_WORKERS 並列で取得
+    - 実行中のリクエスト数 / 成功数 / 所要秒 / 概算コストを集計
+    """
+
+    def __init__(self, proxy_url: str, max_workers: int = BD_UNLOCKER_MAX_WORKERS):
+        from requests.adapters import HTTPAdapter
+
+        self.proxy_url = proxy_url
+        self.max_workers = max(1, int(max_workers))
+        self._session = _new_bd_session(keep_alive=True)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(8, self.max_workers))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=200)
+        self._stats = {"requests": 0, "ok": 0, "fail": 0, "bytes": 0, "total_sec": 0.0}
+
+    def _record(self, elapsed: float, ok: bool, nbytes: int = 0):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["ok" if ok else "fail"] += 1
+            self._stats["bytes"] += nbytes
+            self._stats["total_sec"] += elapsed
+            self._latencies.append(elapsed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            st = dict(self._stats)
+            lat = sorted(self._latencies)
+        st["total_sec"] = round(st["total_sec"], 2)
+        st["avg_sec"] = round(sum(lat) / len(lat), 2) if lat else 0.0
+        st["p50_sec"] = round(lat[len(lat) // 2], 2) if lat else 0.0
+        st["max_sec"] = round(lat[-1], 2) if lat else 0.0
+        # 課金は成功リクエスト単位
+        st["est_cost_usd"] = round(st["ok"] * BD_UNLOCKER_COST_PER_1K / 1000.0, 4)
+        return st
+
+    def fetch(self, url: str, *, timeout=BD_UNLOCKER_TIMEOUT, retry_once: bool = True) -> str:
+        attempts = 2 if retry_once else 1
+        last_exc = None
+        print(f"[bd-unlocker] start attempts={attempts} timeout={timeout} → {url}")
+
+        for attempt in range(1, attempts + 1):
+            t0 = time.time()
+            try:
+                r = self._session.get(
+                    url,
+                    proxies={"http": self.proxy_url, "https": self.proxy_url},
+                    timeout=timeout,
+                    allow_redirects=True,
+                    verify=False,
+                )
+                ok = r.status_code == 200 and bool((r.text or "").strip())
+                self._record(time.time() - t0, ok, len(r.content or b""))
+                if ok:
+                    print(
+                        f"[bd-unlocker] ok attempt={attempt}/{attempts} "
+                        f"timeout={timeout} len={len(r.text)} sec={time.time() - t0:.1f} → {url}"
+                    )
+                    return r.text
                 print(
-                    f"[bd-unlocker] ok attempt={attempt}/{attempts} "
-                    f"timeout={timeout} len={len(r.text)} → {url}"
+                    f"[bd-unlocker] HTTP {r.status_code} "
+                    f"attempt={attempt}/{attempts} timeout={timeout} "
+                    f"len={len(r.text or '')} → {url}"
+                )
+            except Exception as e:
+                self._record(time.time() - t0, False)
+                last_exc = e
+                print(
+                    f"[bd-unlocker] EXC attempt={attempt}/{attempts} "
+                    f"timeout={timeout}: {e} → {url}"
                 )
-                return r.text
-            print(
-                f"[bd-unlocker] HTTP {r.status_code} "
-                f"attempt={attempt}/{attempts} timeout={timeout} "
-                f"len={len(r.text or '')} → {url}"
-            )
-        except Exception as e:
-            last_exc = e
-            print(
-                f"[bd-unlocker] EXC attempt={attempt}/{attempts} "
-                f"timeout={timeout}: {e} → {url}"
-            )
-        finally:
-            try:
-                sess.close()
-            except Exception:
-                pass
 
-    if last_exc is not None:
-        print(f"[bd-unlocker] exhausted with last error: {last_exc} → {url}")
+        if last_exc is not None:
+            print(f"[bd-unlocker] exhausted with last error: {last_exc} → {url}")
+
+        return ""
+
+    def fetch_many(
+        self, urls, *, timeout=BD_UNLOCKER_TIMEOUT, retry_once: bool = True, max_workers=None,
+        with_latency: bool = False,
+    ) -> list:
+        """
+        複数URLを並列取得し、入力順の HTML 文字列リストで返す（失敗は ""）。
+        with_latency=True なら [(HTML, 所要秒), ...]。所要秒はワーカー内で URL ごとに測る
+        （待ち行列の時間もバッチ全体の壁時計も含まない）。
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        workers = self.max_workers if max_workers is None else max(1, int(max_workers))
+
+        def _timed(u):
+            t_url = time.time()
+            h = self.fetch(u, timeout=timeout, retry_once=retry_once)
+            return h, time.time() - t_url
+
+        t0 = time.time()
+        results = fanout_ordered(
+            urls,
+            _timed,
+            max_workers=workers,
+            per_domain=workers,
+            label="bd-unlocker",
+        )
+        out = [((res[0] or ""), res[1]) if res else ("", 0.0) for res in results]
+        print(
+            f"[bd-unlocker] batch done n={len(urls)} ok={sum(1 for h, _ in out if h)} "
+            f"workers={workers} sec={time.time() - t0:.1f}"
+        )
+        if with_latency:
+            return out
+        return [h for h, _ in out]
 
-    return ""
+
+_BD_UNLOCKER_CLIENT = None
+_BD_UNLOCKER_CLIENT_LOCK = threading.Lock()
+
+
+def brightdata_unlocker_client():
+    """プロセス共有の _BrightDataUnlockerClient（認証情報が無ければ None）。"""
+    global _BD_UNLOCKER_CLIENT
+    proxy_url = _bd_unlocker_proxy_url()
+    if not proxy_url:
+        return None
+    with _BD_UNLOCKER_CLIENT_LOCK:
+        if _BD_UNLOCKER_CLIENT is None or _BD_UNLOCKER_CLIENT.proxy_url != proxy_url:
+            _BD_UNLOCKER_CLIENT = _BrightDataUnlockerClient(proxy_url)
+        return _BD_UNLOCKER_CLIENT
+
+
+def brightdata_unlocker_stats() -> dict:
+    """
+    今回の実行での Web Unlocker 利用状況。
+    {"requests", "ok", "fail", "bytes", "total_sec", "avg_sec", "p50_sec", "max_sec", "est_cost_usd"}
+    """
+    client = _BD_UNLOCKER_CLIENT
+    if client is None:
+        return {}
+    return client.stats()
+
+
+def fetch_html_via_brightdata_unlocker(url: str, *, timeout=BD_UNLOCKER_TIMEOUT, retry_once: bool = True) -> str:
+    client = brightdata_unlocker_client()
+    if client is None:
+        print(f"[bd-unlocker] skip missing credentials → {url}")
+        return ""
+    return client.fetch(url, timeout=timeout, retry_once=retry_once)
+
+
+def fetch_many_via_brightdata_unlocker(
+    urls, *, timeout=BD_UNLOCKER_TIMEOUT, retry_once: bool = True, max_workers=None, with_latency: bool = False,
+) -> list:
+    """
+    Web Unlocker で複数URLをまとめて取得する（戻り値は入力順、失敗は ""）。
+    直列ループで1件ずつ呼ぶ代わりに、回収パスを1回の並列ウェーブで済ませる用途。
+    with_latency=True なら [(HTML, URL ごとの所要秒), ...] を返す（ルーターの実績用）。
+    """
+    urls = list(urls)
+    client = brightdata_unlocker_client()
+    if client is None:
+        if urls:
+            print(f"[bd-unlocker] skip missing credentials → {len(urls)} urls")
+        return [("", 0.0) if with_latency else "" for _ in urls]
+    return client.fetch_many(
+        urls, timeout=timeout, retry_once=retry_once, max_workers=max_workers, with_latency=with_latency
+    )
 
 # === DVB専用 ===
-def fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=None):
+def fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=None, extra_headers=None):
     """
     DVB (https://burmese.dvb.no) 向けの多段フェッチャ。
     1) curl_cffi(Chrome指紋) → 2) cloudscraper → 3) requests の順。
     403/429/503 は指数バックオフ。/post/* では /amp / ?output=amp も試す。
+    extra_headers（条件付き GET の検証子など）を渡した場合、304 はそのまま返す。
     """
     import os
     import time
@@ -1341,6 +3538,8 @@ def fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=None):
         "Referer": f"{BASE}/",
         "Connection": "keep-alive",
     }
+    if extra_headers:
+        HEADERS.update(extra_headers)
 
     def _amp_candidates(u: str):
         u = u.strip()
@@ -1361,98 +3560,117 @@ def fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=None):
             return f"resp_meta_error={type(e).__name__}:{e}"
 
     # --- Try 1: curl_cffi ---
-    try:
-        from curl_cffi import requests as cfr  # type: ignore
-
-        proxies = {
-            "http": os.getenv("HTTP_PROXY") or os.getenv("http_proxy"),
-            "https": os.getenv("HTTPS_PROXY") or os.getenv("https_proxy"),
-        }
-        for attempt in range(retries):
-            r = cfr.get(
-                url,
-                headers=HEADERS,
-                impersonate="chrome124",
-                timeout=30,
-                allow_redirects=True,
-                proxies={k: v for k, v in proxies.items() if v},
-            )
-            if r.status_code == 200 and (r.text or "").strip():
-                return r
-            print(f"[dvb-cffi] {attempt+1}/{retries} {_resp_meta(r)} → {url}")
-            # 記事URLはAMP系も試す
-            if r.status_code in (403, 503) and "/post/" in url:
-                for amp in _amp_candidates(url):
-                    r2 = cfr.get(
-                        amp,
-                        headers=HEADERS,
-                        impersonate="chrome124",
-                        timeout=30,
-                        allow_redirects=True,
-                        proxies={k: v for k, v in proxies.items() if v},
-                    )
-                    if r2.status_code == 200 and (r2.text or "").strip():
-                        return r2
-                    print(f"[dvb-cffi-amp] {attempt+1}/{retries} {_resp_meta(r2)} amp={amp} base={url}")
-            if r.status_code in (403, 429, 503):
-                time.sleep(wait_seconds * (2**attempt) + random.uniform(0, 0.8))
-                continue
-            break
-    except Exception as e:
-        print(f"[dvb-cffi] EXC {type(e).__name__}: {e} → {url}")
+    def _tier_curl_cffi():
+        try:
+            from curl_cffi import requests as cfr  # type: ignore
 
-    # --- Try 2: cloudscraper ---
-    try:
-        import cloudscraper
-        import requests as rq
-
-        sess = session or rq.Session()
-        scraper = cloudscraper.create_scraper(
-            sess=sess,
-            browser={"browser": "chrome", "platform": "windows", "mobile": False},
-            delay=7,
-        )
-        for attempt in range(retries):
-            try:
-                r = scraper.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
-                if r.status_code == 200 and getattr(r, "text", "").strip():
+            proxies = {
+                "http": os.getenv("HTTP_PROXY") or os.getenv("http_proxy"),
+                "https": os.getenv("HTTPS_PROXY") or os.getenv("https_proxy"),
+            }
+            for attempt in range(retries):
+                r = cfr.get(
+                    url,
+                    headers=HEADERS,
+                    impersonate="chrome124",
+                    timeout=30,
+                    allow_redirects=True,
+                    proxies={k: v for k, v in proxies.items() if v},
+                )
+                if r.status_code == 304:
                     return r
-                print(f"[dvb-cs] {attempt+1}/{retries} {_resp_meta(r)} → {url}")
+                if r.status_code == 200 and (r.text or "").strip():
+                    return r
+                print(f"[dvb-cffi] {attempt+1}/{retries} {_resp_meta(r)} → {url}")
+                # 記事URLはAMP系も試す
                 if r.status_code in (403, 503) and "/post/" in url:
                     for amp in _amp_candidates(url):
-                        r2 = scraper.get(
-                            amp, headers=HEADERS, timeout=30, allow_redirects=True
+                        r2 = cfr.get(
+                            amp,
+                            headers=HEADERS,
+                            impersonate="chrome124",
+                            timeout=30,
+                            allow_redirects=True,
+                            proxies={k: v for k, v in proxies.items() if v},
                         )
-                        if r2.status_code == 200 and getattr(r2, "text", "").strip():
+                        if r2.status_code == 200 and (r2.text or "").strip():
                             return r2
-                        print(f"[dvb-cs-amp] {attempt+1}/{retries} {_resp_meta(r2)} amp={amp} base={url}")
+                        print(f"[dvb-cffi-amp] {attempt+1}/{retries} {_resp_meta(r2)} amp={amp} base={url}")
                 if r.status_code in (403, 429, 503):
                     time.sleep(wait_seconds * (2**attempt) + random.uniform(0, 0.8))
                     continue
                 break
-            except Exception as e:
-                print(f"[dvb-cs] {attempt+1}/{retries} EXC {type(e).__name__}: {e} → {url}")
-                time.sleep(wait_seconds * (2**attempt) + random.uniform(0, 0.8))
-    except Exception as e:
-        print(f"[dvb-cs] INIT EXC {type(e).__name__}: {e} → {url}")
+        except Exception as e:
+            print(f"[dvb-cffi] EXC {type(e).__name__}: {e} → {url}")
+
+    # --- Try 2: cloudscraper ---
+    def _tier_cloudscraper():
+        try:
+            import cloudscraper
+
+            sess = session or shared_http_session()
+            scraper = cloudscraper.create_scraper(
+                sess=sess,
+                browser={"browser": "chrome", "platform": "windows", "mobile": False},
+                delay=7,
+            )
+            for attempt in range(retries):
+                try:
+                    r = scraper.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
+                    if r.status_code == 304:
+                        return r
+                    if r.status_code == 200 and getattr(r, "text", "").strip():
+                        return r
+                    print(f"[dvb-cs] {attempt+1}/{retries} {_resp_meta(r)} → {url}")
+                    if r.status_code in (403, 503) and "/post/" in url:
+                        for amp in _amp_candidates(url):
+                            r2 = scraper.get(
+                                amp, headers=HEADERS, timeout=30, allow_redirects=True
+                            )
+                            if r2.status_code == 200 and getattr(r2, "text", "").strip():
+                                return r2
+                            print(f"[dvb-cs-amp] {attempt+1}/{retries} {_resp_meta(r2)} amp={amp} base={url}")
+                    if r.status_code in (403, 429, 503):
+                        time.sleep(wait_seconds * (2**attempt) + random.uniform(0, 0.8))
+                        continue
+                    break
+                except Exception as e:
+                    print(f"[dvb-cs] {attempt+1}/{retries} EXC {type(e).__name__}: {e} → {url}")
+                    time.sleep(wait_seconds * (2**attempt) + random.uniform(0, 0.8))
+        except Exception as e:
+            print(f"[dvb-cs] INIT EXC {type(e).__name__}: {e} → {url}")
 
     # --- Try 3: requests ---
-    try:
-        import requests
-
-        sess = session or requests.Session()
-        r2 = sess.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
-        if r2.status_code == 200 and getattr(r2, "text", "").strip():
-            return r2
-        print(f"[dvb-rq] {_resp_meta(r2)} → {url}")
-        if r2.status_code in (403, 503) and "/post/" in url:
-            for amp in _amp_candidates(url):
-                r3 = sess.get(amp, headers=HEADERS, timeout=30, allow_redirects=True)
-                if r3.status_code == 200 and getattr(r3, "text", "").strip():
-                    return r3
-                print(f"[dvb-rq-amp] {_resp_meta(r3)} amp={amp} base={url}")
-    except Exception as e:
-        print(f"[dvb-rq] EXC final {type(e).__name__}: {e} → {url}")
+    def _tier_requests():
+        try:
+            sess = session or shared_http_session()
+            r2 = sess.get(url, headers=HEADERS, timeout=30, allow_redirects=True)
+            if r2.status_code == 304:
+                return r2
+            if r2.status_code == 200 and getattr(r2, "text", "").strip():
+                return r2
+            print(f"[dvb-rq] {_resp_meta(r2)} → {url}")
+            if r2.status_code in (403, 503) and "/post/" in url:
+                for amp in _amp_candidates(url):
+                    r3 = sess.get(amp, headers=HEADERS, timeout=30, allow_redirects=True)
+                    if r3.status_code == 200 and getattr(r3, "text", "").strip():
+                        return r3
+                    print(f"[dvb-rq-amp] {_resp_meta(r3)} amp={amp} base={url}")
+        except Exception as e:
+            print(f"[dvb-rq] EXC final {type(e).__name__}: {e} → {url}")
+
+    # 既定順は curl_cffi → cloudscraper → requests。ドメインごとの実績でルーターが並べ替え、
+    # 連続失敗中の手段（バックオフ待ちが重い）はブレーカーでスキップする。
+    res = run_routed_tiers(
+        url,
+        [
+            ("curl_cffi", _tier_curl_cffi),
+            ("cloudscraper", _tier_cloudscraper),
+            ("requests", _tier_requests),
+        ],
+    )
+    if res is not None:
+        return res
 
     raise Exception(f"Failed to fetch DVB {url} after {retries} attempts.")
 
@@ -1655,7 +3873,7 @@ def fetch_once_irrawaddy_html(url, session=None, *, allow_brightdata_fallback: b
         # 記事HTMLは meta か本文の少なくともどちらかが欲しい
         if "irrawaddy.com" in host:
             try:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html)
                 if _article_date_from_meta_mmt(soup) is not None:
                     return True
                 if (extract_body_irrawaddy(soup) or "").strip():
@@ -1669,23 +3887,33 @@ def fetch_once_irrawaddy_html(url, session=None, *, allow_brightdata_fallback: b
     status = None
     source = "none"
 
-    try:
-        r = fetch_with_retry_irrawaddy(url, retries=1, wait_seconds=0, session=session)
-        status = getattr(r, "status_code", None)
-        html_text = _normalize_html(r)
-        if _looks_usable(html_text, url) and status != 403:
-            source = "direct"
-            return html_text, status, source
-        print(
-            f"[irrawaddy-html] direct fallback status={status} usable={_looks_usable(html_text, url)} "
-            f"cf={_looks_like_cloudflare_block(html_text)} len={len(html_text or '')} → {url}"
-        )
-    except Exception as e:
-        print(f"[irrawaddy-html] direct fail: {e} → {url}")
-        html_text = ""
-        status = None
+    router = fetch_router()
+    # direct が連続で弾かれている（ブレーカー開）間は、失敗待ちを払わず Bright Data へ直行する
+    skip_direct = allow_brightdata_fallback and router.is_open(url, "direct")
+    if skip_direct:
+        print(f"[irrawaddy-html] direct skipped (router breaker open) → {url}")
+    else:
+        t0 = time.time()
+        try:
+            r = fetch_with_retry_irrawaddy(url, retries=1, wait_seconds=0, session=session)
+            status = getattr(r, "status_code", None)
+            html_text = _normalize_html(r)
+            if _looks_usable(html_text, url) and status != 403:
+                router.record(url, "direct", ok=True, latency=time.time() - t0)
+                source = "direct"
+                return html_text, status, source
+            print(
+                f"[irrawaddy-html] direct fallback status={status} usable={_looks_usable(html_text, url)} "
+                f"cf={_looks_like_cloudflare_block(html_text)} len={len(html_text or '')} → {url}"
+            )
+        except Exception as e:
+            print(f"[irrawaddy-html] direct fail: {e} → {url}")
+            html_text = ""
+            status = None
+        router.record(url, "direct", ok=False, latency=time.time() - t0)
 
     if allow_brightdata_fallback:
+        t0 = time.time()
         try:
             html2 = (fetch_html_via_brightdata_unlocker(
                 url,
@@ -1693,6 +3921,7 @@ def fetch_once_irrawaddy_html(url, session=None, *, allow_brightdata_fallback: b
                 retry_once=False,
             ) or "").strip()
             if _looks_usable(html2, url):
+                router.record(url, "unlocker", ok=True, latency=time.time() - t0)
                 print(f"[irrawaddy-html] unlocker ok len={len(html2)} → {url}")
                 return html2, 200, "unlocker"
             print(
@@ -1700,10 +3929,13 @@ def fetch_once_irrawaddy_html(url, session=None, *, allow_brightdata_fallback: b
             )
         except Exception as e:
             print(f"[irrawaddy-html] unlocker fail: {e} → {url}")
+        router.record(url, "unlocker", ok=False, latency=time.time() - t0)
 
+        t0 = time.time()
         try:
             html3 = (fetch_html_via_brightdata_browser(url) or "").strip()
             if _looks_usable(html3, url):
+                router.record(url, "browser", ok=True, latency=time.time() - t0)
                 print(f"[irrawaddy-html] browser ok len={len(html3)} → {url}")
                 return html3, 200, "browser"
             print(
@@ -1711,6 +3943,7 @@ def fetch_once_irrawaddy_html(url, session=None, *, allow_brightdata_fallback: b
             )
         except Exception as e:
             print(f"[irrawaddy-html] browser fail: {e} → {url}")
+        router.record(url, "browser", ok=False, latency=time.time() - t0)
 
     return html_text, status, source
 
@@ -1742,7 +3975,7 @@ def fetch_once_irrawaddy(url, session=None, *, allow_brightdata_fallback: bool =
         if not html:
             return False
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html)
             body = extract_body_irrawaddy(soup)
             return bool((body or "").strip())
         except Exception:
@@ -1829,8 +4062,10 @@ MIZZIMA_CATEGORY_PATHS = [
 ]
 
 def _mizzima_has_myanmar_keyword(title: str, body: str) -> bool:
-    haystack = unicodedata.normalize("NFC", f"{title or ''}\n{body or ''}")
-    return MIZZIMA_MYANMAR_KEYWORD in haystack
+    hits = keyword_hits(
+        unicodedata.normalize("NFC", title or ""), unicodedata.normalize("NFC", body or "")
+    )
+    return KEYWORD_SET_MYANMAR in hits
 
 # Mizzimaカテゴリーページ巡回で取得
 def get_mizzima_articles_from_category(
@@ -1866,11 +4101,17 @@ def get_mizzima_articles_from_category(
                 url = f"{base_url}{path}/page/{page_num}/"
 
             try:
-                res = requests.get(url, timeout=10)
+                # 一覧は短い TTL で永続 HTTP キャッシュを通す（記事リンクの無い応答は保存しない）
+                res = http_get(
+                    url,
+                    timeout=10,
+                    cache_validate=http_cache_marker_validator("post-thumbnail"),
+                    cache_ttl=HTTP_CACHE_TTL_LIST,
+                )
                 if res.status_code != 200:
                     continue
 
-                soup = BeautifulSoup(res.content, "html.parser")
+                soup = make_soup(res.content)
                 links = [
                     a["href"]
                     for a in soup.select("main.site-main article a.post-thumbnail[href]")
@@ -1883,15 +4124,16 @@ def get_mizzima_articles_from_category(
                 print(f"Error crawling category page {url}: {e}")
                 continue
 
-    filtered_articles = []
-    for url, require_myanmar_keyword in article_require_keyword.items():
+    # 記事ページ取得は fanout_ordered で並列化（結果はカテゴリ巡回で見つけた順のまま）
+    def _fetch_one(url):
+        require_myanmar_keyword = article_require_keyword[url]
         try:
-            res_article = fetch_with_retry(url)
-            soup_article = BeautifulSoup(res_article.content, "html.parser")
+            res_article = fetch_with_retry(url, cache_validate=HTTP_CACHE_ARTICLE_VALIDATOR)
+            soup_article = make_soup(res_article.content)
 
             meta_tag = soup_article.find("meta", property="article:published_time")
             if not meta_tag or not meta_tag.has_attr("content"):
-                continue
+                return None
 
             date_str = meta_tag["content"]
             article_datetime_utc = datetime.fromisoformat(date_str)
@@ -1899,22 +4141,22 @@ def get_mizzima_articles_from_category(
             article_date = article_datetime_mmt.date()
 
             if article_date != date_obj:
-                continue
+                return None
 
             title_tag = soup_article.find("meta", attrs={"property": "og:title"})
             if not title_tag or not title_tag.has_attr("content"):
-                continue
+                return None
             title = title_tag["content"].strip()
 
             # === 除外キーワード判定（タイトルをNFC正規化してから） ===
             title_nfc = unicodedata.normalize("NFC", title)
             if any(kw in title_nfc for kw in EXCLUDE_TITLE_KEYWORDS):
                 print(f"SKIP: excluded keyword in title → {url} | TITLE: {title_nfc}")
-                continue
+                return None
 
             content_div = soup_article.find("div", class_="entry-content")
             if not content_div:
-                continue
+                return None
 
             paragraphs = []
             for p in content_div.find_all("p"):
@@ -1926,33 +4168,36 @@ def get_mizzima_articles_from_category(
             body_text = unicodedata.normalize("NFC", body_text)
 
             if not body_text.strip():
-                continue
+                return None
 
-            if require_myanmar_keyword and not _mizzima_has_myanmar_keyword(title_nfc, body_text):
+            # キーワード判定は正規化済みタイトルで行う（မြန်မာ 必須判定と共通の1回の走査）
+            hits = keyword_hits(title_nfc, body_text)
+            if require_myanmar_keyword and KEYWORD_SET_MYANMAR not in hits:
                 print(f"SKIP: no မြန်မာ keyword in extra Mizzima category → {url} | TITLE: {title_nfc}")
-                continue
+                return None
 
-            # キーワード判定は正規化済みタイトルで行う
-            if not any_keyword_hit(title, body_text):
+            if KEYWORD_SET_NEWS not in hits and KEYWORD_SET_KYAT not in hits:
                 log_no_keyword_hit(
                     source_name, url, title, body_text, "mizzima:category"
                 )
-                continue
+                return None
 
-            filtered_articles.append(
-                {
-                    "source": source_name,
-                    "url": url,
-                    "title": title,
-                    "date": article_date.isoformat(),
-                    "body": body_text,
-                }
-            )
+            return {
+                "source": source_name,
+                "url": url,
+                "title": title,
+                "date": article_date.isoformat(),
+                "body": body_text,
+            }
 
         except Exception as e:
             print(f"Error processing {url}: {e}")
-            continue
+            return None
 
+    filtered_articles = [
+        a for a in fanout_ordered(list(article_require_keyword), _fetch_one, label="mizzima")
+        if a
+    ]
     return filtered_articles
 
 
@@ -2048,7 +4293,7 @@ def get_bbc_burmese_articles_for(target_date_mmt):
         try:
             article_res = session.get(link, timeout=10)
             article_res.raise_for_status()
-            article_soup = BeautifulSoup(article_res.content, "html.parser")
+            article_soup = make_soup(article_res.content)
 
             # ===== ここで除外セクションをまとめて削除 =====
             # 記事署名やメタ情報
@@ -2171,7 +4416,7 @@ def get_khit_thit_media_articles_from_category(date_obj, max_pages=3):
                 print(f"[khitthit] stop pagination (missing/unreachable): {url} -> {e}")
                 break
 
-            soup = BeautifulSoup(res.content, "html.parser")
+            soup = make_soup(res.content)
             entry_links = soup.select("p.entry-title.td-module-title a[href]")
             if not entry_links:
                 print(f"[khitthit] stop pagination (no entries): {url}")
@@ -2188,8 +4433,8 @@ def get_khit_thit_media_articles_from_category(date_obj, max_pages=3):
     filtered_articles = []
     for url in collected_urls:
         try:
-            res_article = fetch_with_retry(url)
-            soup_article = BeautifulSoup(res_article.content, "html.parser")
+            res_article = fetch_with_retry(url, cache_validate=HTTP_CACHE_ARTICLE_VALIDATOR)
+            soup_article = make_soup(res_article.content)
 
             # 日付取得
             meta_tag = soup_article.find("meta", property="article:published_time")
@@ -2349,7 +4594,13 @@ def get_irrawaddy_articles_for(date_obj, debug=True):
         # print(f"Fetching {url}")
         html = ""
         try:
-            res = fetch_with_retry_irrawaddy(url, session=session)
+            # 一覧は短い TTL で永続 HTTP キャッシュを通す（日付リンクの無いチャレンジページ等は保存しない）
+            res = http_cache_fetch(
+                url,
+                lambda h: fetch_with_retry_irrawaddy(url, session=session, extra_headers=h),
+                ttl=HTTP_CACHE_TTL_LIST,
+                validate=http_cache_marker_validator("jeg_meta_date"),
+            )
             # 403 等でも content は取れていることがあるので一旦 HTML 化
             html = (getattr(res, "content", None) or res.text or "")
             # Cloudflare の 403 はここで弾く（len判定などより安全）
@@ -2379,7 +4630,7 @@ def get_irrawaddy_articles_for(date_obj, debug=True):
         if not html:
             continue
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         wrapper = soup.select_one("div.jeg_content")  # テーマによっては無いこともある
 
         # ✅ union 方式：wrapper 内→見つからなければページ全体の順で探索
@@ -2430,8 +4681,13 @@ def get_irrawaddy_articles_for(date_obj, debug=True):
     # ==== 1.5) ホーム（kuDRpuoカラム）巡回 → 当日候補抽出（新規） ====
     try:
         home_url = f"{BASE}/"
-        res_home = fetch_with_retry_irrawaddy(home_url, session=session)
-        soup_home = BeautifulSoup(res_home.content, "html.parser")
+        res_home = http_cache_fetch(
+            home_url,
+            lambda h: fetch_with_retry_irrawaddy(home_url, session=session, extra_headers=h),
+            ttl=HTTP_CACHE_TTL_LIST,
+            validate=http_cache_marker_validator("kuDRpuo"),
+        )
+        soup_home = make_soup(res_home.content)
 
         # data-id でスコープ特定（class でも拾えるように冗長化）
         home_scope = soup_home.select_one(
@@ -2719,7 +4975,7 @@ def get_irrawaddy_articles_for(date_obj, debug=True):
                 if not html_once:
                     html_once = fetch_html_via_brightdata_browser(url)
                 if html_once:
-                    soup_article = BeautifulSoup(html_once, "html.parser")
+                    soup_article = make_soup(html_once)
                     # Irrawaddy ドメインのときだけ、厳密に meta 日付を照合
                     try:
                         host = urlparse(url).netloc.lower()
@@ -2905,7 +5161,12 @@ def get_dvb_articles_for(date_obj: date, debug: bool = True) -> List[Dict]:
         for page_no in (1, 2):
             url = f"{BASE}{rel}" if page_no == 1 else f"{BASE}{rel}?page=2"
             try:
-                res = fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=sess)
+                res = http_cache_fetch(
+                    url,
+                    lambda h: fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=sess, extra_headers=h),
+                    ttl=HTTP_CACHE_TTL_LIST,
+                    validate=http_cache_marker_validator('href="/post/'),
+                )
             except Exception as e:
                 log(f"[warn] fetch fail {url}: {e}")
                 continue
@@ -2914,9 +5175,7 @@ def get_dvb_articles_for(date_obj: date, debug: bool = True) -> List[Dict]:
                 log(f"[skip] non-200 ({res.status_code}) {url}")
                 continue
 
-            soup = BeautifulSoup(
-                getattr(res, "content", None) or res.text, "html.parser"
-            )
+            soup = make_soup(getattr(res, "content", None) or res.text)
 
             # 一覧ブロック（特徴で特定。無ければフォールバックでページ全体）
             blocks = soup.select(
@@ -2961,9 +5220,7 @@ def get_dvb_articles_for(date_obj: date, debug: bool = True) -> List[Dict]:
             if getattr(res, "status_code", 200) != 200:
                 log(f"[skip] non-200 article {res.status_code} {url}")
                 continue
-            soup = BeautifulSoup(
-                getattr(res, "content", None) or res.text, "html.parser"
-            )
+            soup = make_soup(getattr(res, "content", None) or res.text)
 
             title = _extract_title_dvb(soup)
             body = _extract_body_dvb(soup)
@@ -3092,7 +5349,7 @@ def get_myanmar_now_articles_mm(date_obj, max_pages=3):
                 res = fetch_with_retry(url)
             except Exception:
                 break
-            soup = BeautifulSoup(res.content, "html.parser")
+            soup = make_soup(res.content)
 
             for span in soup.select("span.date.meta-item.tie-icon"):
                 if (span.get_text(strip=True) or "") != today_label:
@@ -3164,8 +5421,8 @@ def get_myanmar_now_articles_mm(date_obj, max_pages=3):
             soup = None
             dt_mmt = None
             try:
-                res = fetch_with_retry(url)
-                soup = BeautifulSoup(res.content, "html.parser")
+                res = fetch_with_retry(url, cache_validate=HTTP_CACHE_ARTICLE_VALIDATOR)
+                soup = make_soup(res.content)
                 meta = soup.find("meta", attrs={"property": "article:published_time"})
                 if meta and meta.get("content"):
                     try:
@@ -3315,10 +5572,11 @@ def process_and_enqueue_articles(
             title_nfc = unicodedata.normalize("NFC", art["title"])
             body_nfc = unicodedata.normalize("NFC", body_text)
             
-            # エーヤワディ系/全体/非エーヤワディのヒット判定（各1回のみ）
-            is_ayeyar = is_ayeyarwady_hit(title_nfc, body_nfc)
-            # 非エーヤワディのヒット（NEWS_KEYWORDS のみ）
-            hit_non_aye = any_keyword_hit(title_nfc, body_nfc)
+            # エーヤワディ系/全体/非エーヤワディのヒット判定（1回の走査で全集合）
+            hits = keyword_hits(title_nfc, body_nfc)
+            is_ayeyar = KEYWORD_SET_AYEYARWADY in hits
+            # 非エーヤワディのヒット（NEWS_KEYWORDS / 通貨）
+            hit_non_aye = KEYWORD_SET_NEWS in hits or KEYWORD_SET_KYAT in hits
             # 全体ヒット = 非エーヤワディ or エーヤワディ
             hit_full = hit_non_aye or is_ayeyar
 
@@ -3352,6 +5610,9 @@ def process_and_enqueue_articles(
             continue
 
     translation_queue.extend(queued_items)
+    # ストリーミング有効時は、その場で要約スレッドへ流す
+    if _SUMMARY_STREAM is not None:
+        _SUMMARY_STREAM.submit(queued_items)
 
 
 # MEMO: ログ用、デバック用関数
@@ -3588,6 +5849,125 @@ def log_dedupe_report(
     printer("===== END DEDUPE REPORT =====\n")
 
 
+# 重複判定プロンプトの固定ルール部分（記事に依存しない）
+# 見積り 500 トークン程度で GEMINI_CONTEXT_CACHE_MIN_TOKENS に届かないため、コンテキストキャッシュには載せない
+DEDUPE_PROMPT_RULES = (
+    "あなたはニュースの重複判定フィルタです。\n"
+    "以後の判定は各記事の「title」と「body（これは超要約または短縮要約）」のみを使用し、元本文には戻って再参照しません。\n"
+    "目的：同一主旨（トピック + 角度 + 発信主体）を報じる記事を束ね、各クラスターから1本だけ残します。出力は必ずJSONのみ。\n\n"
+    "【定義】\n"
+    "・トピック一致：who / what / where / when のうち少なくとも3要素が一致（言い換え・言語差は同一扱い。日付は±14日を同一扱い可）。\n"
+    "・記事の種類（type）：以下の正規化カテゴリのいずれか1つに内部で分類して用いる（出力には含めない）。\n"
+    "  速報/単報, 政策発表要点, 公式発表/声明, インタビュー, 解説/背景, 物声明, 組織声明, 公示,\n"
+    "  データ/統計, まとめ/ダイジェスト, ライブ/時系列更新,\n"
+    "  写真/映像特集, 社説/論説/寄稿, プロフィール\n"
+    "  近い同義語は内部で正規化：『press release/announcement→公式発表/声明』『explainer/analysis→解説/背景』\n"
+    "  『roundup/digest→まとめ/ダイジェスト』『live updates→ライブ/時系列更新』\n"
+    "  判別不能な場合は type=不明 とし、種類一致には数えない。\n"
+    "・発信主体（provenance）：以下のいずれか1つを内部で推定して用いる。\n"
+    "  ① 本人指示/首長の直言（例：ミン・アウン・フラインが「指示/命令/表明」）\n"
+    "  ② 公式機関の発表（官報/会見/文書/広報）\n"
+    "  ③ 匿名の軍筋/関係者/消息筋/内部筋（「軍筋によれば」「関係者によると」等）\n"
+    "  ④ 現地運用・治安部隊/委員会の実務通達\n\n"
+    "【判定方針】\n"
+    "1) 同一主旨 = 『トピック一致』かつ『種類一致（typeが一致、かつ不明以外）』かつ『発信主体（provenance）一致』の全てを満たす場合に限る。\n"
+    "   ※ まとめ/ダイジェスト/複数案件列挙の要約と、単一案件の速報・解説は重複にしない（別クラスター）。\n"
+    "   ※ 同一テーマ（例：選挙運動規制）でも『内容規制』と『運用・手続（許認可/場所/時間/警備/管理）』は別角度として必ず別クラスターにする。\n"
+    "   例：〈軍への批判的選挙運動を禁じる（内容規制）〉と〈軍の管理下・事前許可でのみ選挙活動可（運用・手続）〉は別クラスター。\n"
+    "   例：〈MAH本人が“批判禁止”を指示（本人指示）〉と〈ネピドー軍筋が“許可制・管理下”と伝聞（軍筋）〉は、角度も発信主体も異なるため別クラスター。\n"
+    "2) クラスター化：記事は最も一致度が高いクラスターにのみ所属。不確実なら別クラスターにする。\n"
+    "3) 残す基準：a)固有情報量（地名/人数/金額/組織名/新規事実） b)具体性/明瞭さ c)タイトル情報量。\n"
+    "   同点なら 本文長（bodyの文字数）→ source昇順 → id昇順 の順で決定。\n"
+    "4) 入力外の事実は加えない。統合記事は作らない。\n\n"
+    "【出力の制約】\n"
+    "・JSONのみを返す。余計なテキストやキーは禁止。\n"
+    "・kept/removed/clusters の id は必ず入力 articles の id に含まれていること。\n"
+    "・clusters[].member_ids は入力 id を重複なくすべて含むこと。クラスター数と kept件数は同数。\n"
+    "・removed[].duplicate_of は同一クラスター内の kept id を指すこと。\n"
+    "・why は16〜24字程度、event_key は25字以内に収めること。\n\n"
+)
+
+
+# ===== 重複判定の前段：ローカルな候補クラスタリング =====
+# タイトル＋超要約の文字 bigram TF-IDF で近い記事同士だけを束ね、
+# 2件以上の候補クラスタだけを小さなプロンプトで LLM に判定させる（近傍の無い記事は LLM に送らない）。
+DEDUPE_PRECLUSTER_ENABLED = os.getenv("DEDUPE_PRECLUSTER", "1") == "1"
+DEDUPE_PRECLUSTER_THRESHOLD = float(os.getenv("DEDUPE_PRECLUSTER_THRESHOLD", "0.25"))
+# 連鎖で巨大クラスタ（＝巨大プロンプト）にならないよう、1クラスタの上限件数
+DEDUPE_PRECLUSTER_MAX_CLUSTER = int(os.getenv("DEDUPE_PRECLUSTER_MAX_CLUSTER", "12"))
+
+_DEDUPE_NORM_RE = re.compile(r"[\s\W_]+", re.UNICODE)
+
+
+def _char_ngram_counts(text: str, n: int = 2) -> dict:
+    t = _DEDUPE_NORM_RE.sub("", (text or "").lower())
+    if len(t) < n:
+        return {t: 1} if t else {}
+    counts = defaultdict(int)
+    for k in range(len(t) - n + 1):
+        counts[t[k : k + n]] += 1
+    return counts
+
+
+def precluster_articles(
+    articles: list[dict], threshold: float = None, max_cluster: int = None
+) -> list[list[int]]:
+    """
+    articles（title/body を持つ dict）を文字 bigram TF-IDF のコサイン類似度で束ねる。
+    threshold 以上のペアを類似度の高い順に union-find で連結し（max_cluster 件を超える連結はしない）、
+    クラスタ（添字リスト）を入力順で返す。
+    """
+    thr = DEDUPE_PRECLUSTER_THRESHOLD if threshold is None else threshold
+    cap = max(2, DEDUPE_PRECLUSTER_MAX_CLUSTER if max_cluster is None else max_cluster)
+    n = len(articles)
+    docs = [_char_ngram_counts(f"{a.get('title') or ''} {a.get('body') or ''}") for a in articles]
+
+    df = defaultdict(int)
+    for d in docs:
+        for g in d:
+            df[g] += 1
+    vecs = []
+    for d in docs:
+        # 平滑化 IDF（+1）：記事数が少ないとき、全記事に共通の n-gram も重み 0 にしない
+        v = {g: (1.0 + math.log(c)) * (math.log((1 + n) / (1 + df[g])) + 1.0) for g, c in d.items()}
+        norm = math.sqrt(sum(w * w for w in v.values())) or 1.0
+        vecs.append({g: w / norm for g, w in v.items() if w > 0})
+
+    # 転置インデックスで、同じ n-gram を持つ記事ペアだけ内積を計算する
+    postings = defaultdict(list)
+    for k, v in enumerate(vecs):
+        for g, w in v.items():
+            postings[g].append((k, w))
+    edges = []
+    for a in range(n):
+        dots = defaultdict(float)
+        for g, wa in vecs[a].items():
+            for b, wb in postings[g]:
+                if b > a:
+                    dots[b] += wa * wb
+        edges.extend((sim, a, b) for b, sim in dots.items() if sim >= thr)
+
+    parent = list(range(n))
+    size = [1] * n
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for _sim, a, b in sorted(edges, key=lambda e: (-e[0], e[1], e[2])):
+        ra, rb = find(a), find(b)
+        if ra != rb and size[ra] + size[rb] <= cap:
+            parent[rb] = ra
+            size[ra] += size[rb]
+
+    groups = {}
+    for k in range(n):
+        groups.setdefault(find(k), []).append(k)
+    return sorted(groups.values(), key=lambda g: g[0])
+
+
 def dedupe_articles_with_llm(
     client,
     summarized_results,
@@ -3622,7 +6002,6 @@ def dedupe_articles_with_llm(
     articles_for_llm = []
     id_map_llm = {}
     id_to_meta_llm = {}
-    ids_in_order_llm = []
     all_ids_in_order = []  # 返却時の順序維持用
 
     for idx, it in enumerate(summarized_results):
@@ -3643,7 +6022,6 @@ def dedupe_articles_with_llm(
         body_fallback = _strip_tags(it.get("summary", ""))[:summary_fallback_chars]
         body = body_ultra[:ultra_max_chars] if body_ultra else body_fallback
 
-        ids_in_order_llm.append(_id)
         id_map_llm[_id] = it
         id_to_meta_llm[_id] = {"title": it.get("title"), "source": it.get("source")}
         articles_for_llm.append(
@@ -3663,49 +6041,61 @@ def dedupe_articles_with_llm(
             )
         return summarized_results
 
+    if debug and irrawaddy_ids:
+        printer(f"⏭️ Irrawaddy {len(irrawaddy_ids)} 件は常に keep（LLM スキップ）。")
+
+    # ===== 候補クラスタリング：近傍のある記事だけ LLM へ =====
+    if DEDUPE_PRECLUSTER_ENABLED:
+        groups = precluster_articles(articles_for_llm)
+    else:
+        groups = [list(range(len(articles_for_llm)))]
+    singles = [g[0] for g in groups if len(g) == 1]
+    candidates = [g for g in groups if len(g) > 1]
+    if DEDUPE_PRECLUSTER_ENABLED:
+        printer(
+            f"[dedupe] precluster: {len(articles_for_llm)} articles → "
+            f"{len(candidates)} candidate cluster(s), {len(singles)} singleton(s) kept without LLM"
+        )
+
+    kept_union = set(irrawaddy_ids) | {articles_for_llm[k]["id"] for k in singles}
+    for n, g in enumerate(candidates, 1):
+        cluster = [articles_for_llm[k] for k in g]
+        kept = _dedupe_cluster_with_llm(
+            client,
+            cluster,
+            id_map_llm,
+            id_to_meta_llm,
+            debug=debug,
+            printer=printer,
+            label=f"{n}/{len(candidates)}" if len(candidates) > 1 else "",
+        )
+        # 判定できなかったクラスタは全件残す
+        kept_union |= kept if kept else {a["id"] for a in cluster}
+
+    return [
+        obj
+        for obj, _id in zip(summarized_results, all_ids_in_order)
+        if _id in kept_union
+    ]
+
+
+def _dedupe_cluster_with_llm(
+    client, articles_for_llm, id_map_llm, id_to_meta_llm, *, debug=True, printer=print, label=""
+):
+    """
+    候補クラスタ1つ（非 Irrawaddy の記事のみ）を LLM で重複判定し、残す ID の集合を返す。
+    判定できなかった場合は空集合（呼び出し側で全件 keep）。
+    """
+    ids_in_order_llm = [a["id"] for a in articles_for_llm]
+
     # ===== デバッグ出力（LLM に送る分のみ） =====
     if debug:
-        if irrawaddy_ids:
-            printer(f"⏭️ Irrawaddy {len(irrawaddy_ids)} 件は常に keep（LLM スキップ）。")
-        printer("===== DEBUG 2: articles SENT TO LLM =====")
+        printer(f"===== DEBUG 2: articles SENT TO LLM {label}".rstrip() + " =====")
         printer(_pprint.pformat(articles_for_llm, width=120, compact=False))
         printer("===== END DEBUG 2 =====\n")
 
     # ===== プロンプト（非 Irrawaddy のみ） =====
-    prompt = (
-        "あなたはニュースの重複判定フィルタです。\n"
-        "以後の判定は各記事の「title」と「body（これは超要約または短縮要約）」のみを使用し、元本文には戻って再参照しません。\n"
-        "目的：同一主旨（トピック + 角度 + 発信主体）を報じる記事を束ね、各クラスターから1本だけ残します。出力は必ずJSONのみ。\n\n"
-        "【定義】\n"
-        "・トピック一致：who / what / where / when のうち少なくとも3要素が一致（言い換え・言語差は同一扱い。日付は±14日を同一扱い可）。\n"
-        "・記事の種類（type）：以下の正規化カテゴリのいずれか1つに内部で分類して用いる（出力には含めない）。\n"
-        "  速報/単報, 政策発表要点, 公式発表/声明, インタビュー, 解説/背景, 物声明, 組織声明, 公示,\n"
-        "  データ/統計, まとめ/ダイジェスト, ライブ/時系列更新,\n"
-        "  写真/映像特集, 社説/論説/寄稿, プロフィール\n"
-        "  近い同義語は内部で正規化：『press release/announcement→公式発表/声明』『explainer/analysis→解説/背景』\n"
-        "  『roundup/digest→まとめ/ダイジェスト』『live updates→ライブ/時系列更新』\n"
-        "  判別不能な場合は type=不明 とし、種類一致には数えない。\n"
-        "・発信主体（provenance）：以下のいずれか1つを内部で推定して用いる。\n"
-        "  ① 本人指示/首長の直言（例：ミン・アウン・フラインが「指示/命令/表明」）\n"
-        "  ② 公式機関の発表（官報/会見/文書/広報）\n"
-        "  ③ 匿名の軍筋/関係者/消息筋/内部筋（「軍筋によれば」「関係者によると」等）\n"
-        "  ④ 現地運用・治安部隊/委員会の実務通達\n\n"
-        "【判定方針】\n"
-        "1) 同一主旨 = 『トピック一致』かつ『種類一致（typeが一致、かつ不明以外）』かつ『発信主体（provenance）一致』の全てを満たす場合に限る。\n"
-        "   ※ まとめ/ダイジェスト/複数案件列挙の要約と、単一案件の速報・解説は重複にしない（別クラスター）。\n"
-        "   ※ 同一テーマ（例：選挙運動規制）でも『内容規制』と『運用・手続（許認可/場所/時間/警備/管理）』は別角度として必ず別クラスターにする。\n"
-        "   例：〈軍への批判的選挙運動を禁じる（内容規制）〉と〈軍の管理下・事前許可でのみ選挙活動可（運用・手続）〉は別クラスター。\n"
-        "   例：〈MAH本人が“批判禁止”を指示（本人指示）〉と〈ネピドー軍筋が“許可制・管理下”と伝聞（軍筋）〉は、角度も発信主体も異なるため別クラスター。\n"
-        "2) クラスター化：記事は最も一致度が高いクラスターにのみ所属。不確実なら別クラスターにする。\n"
-        "3) 残す基準：a)固有情報量（地名/人数/金額/組織名/新規事実） b)具体性/明瞭さ c)タイトル情報量。\n"
-        "   同点なら 本文長（bodyの文字数）→ source昇順 → id昇順 の順で決定。\n"
-        "4) 入力外の事実は加えない。統合記事は作らない。\n\n"
-        "【出力の制約】\n"
-        "・JSONのみを返す。余計なテキストやキーは禁止。\n"
-        "・kept/removed/clusters の id は必ず入力 articles の id に含まれていること。\n"
-        "・clusters[].member_ids は入力 id を重複なくすべて含むこと。クラスター数と kept件数は同数。\n"
-        "・removed[].duplicate_of は同一クラスター内の kept id を指すこと。\n"
-        "・why は16〜24字程度、event_key は25字以内に収めること。\n\n"
+    prompt = DEDUPE_PROMPT_RULES + (
         "入力:\n"
         f'{{\\n  "articles": {json.dumps(articles_for_llm, ensure_ascii=False)}\\n}}\\n\\n'
         "出力フォーマット（JSONのみ）:\n"
@@ -3755,25 +6145,14 @@ def dedupe_articles_with_llm(
                 id_to_meta=id_to_meta_llm,
                 article_ids_in_order=ids_in_order_llm,
                 printer=printer,
-                header="🧩 DEDUPE REPORT (non-Irrawaddy only)",
+                header=f"🧩 DEDUPE REPORT (non-Irrawaddy only) {label}".rstrip(),
             )
 
-        # kept が出たときのみフィルタ適用し、Irrawaddy を合流
-        if kept_ids_others:
-            kept_union = set(kept_ids_others) | irrawaddy_ids
-            filtered = [
-                obj
-                for obj, _id in zip(summarized_results, all_ids_in_order)
-                if _id in kept_union
-            ]
-            return filtered
-
-        # うまく判定できなかったら原本を返す（Irrawaddy も当然残る）
-        return summarized_results
+        return set(kept_ids_others)
 
     except Exception as e:
-        print(f"🛑 Dedupe failed, returning original list: {e}")
-        return summarized_results
+        print(f"🛑 Dedupe failed, keeping the cluster as is: {e}")
+        return set()
 
 
 # ===== 要約・翻訳プロンプトパーツ =====
@@ -4871,8 +7250,11 @@ def _build_region_glossary_prompt_for(entries: list[dict], *, use_headline_ja: b
             lines.append(f"- 「{en}」が出たら、必ず「{ja}」と訳す。")
     return ("【用語固定（必須）】\n" + "\n".join(lines) + "\n") if lines else ""
 
+SUMMARY_PROMPT_HEADER = "次の手順で記事を判定・処理してください。\n\n"
+
+
 def build_prompt(item: dict, *, skip_filters: bool, body_max: int) -> str:
-    header = "次の手順で記事を判定・処理してください。\n\n"
+    header = SUMMARY_PROMPT_HEADER
     pre = SKIP_NOTE_IRRAWADDY if skip_filters else STEP12_FILTERS + "\n\n"
     input_block = (
         "入力データ：\n"
@@ -5363,142 +7745,409 @@ def _cut_ultra_block(lines):
     return "", lines
 
 
-# 本処理関数
-def process_translation_batches(batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60):
-    # MEMO: TEST用、Geminiを呼ばず、URLリストだけ返す
-    # summarized_results = []
-    # for item in translation_queue:
-    #     summarized_results.append({
-    #         "source": item["source"],
-    #         "url": item["url"],
-    #         "title": item['title'],
-    #         "summary": item['body'][:BODY_MAX_CHARS]
-    #     })
+def _summary_result_from_output(item: dict, output_text: str):
+    """
+    要約モデルの出力テキスト（【タイトル】/【要約】/【超要約】）を整形して結果 dict にする。
+    exit（記事ではない）と判定されたら None。
+    """
+    # --- exit を広めに判定（バッククォートや句読点混入対策）---
+    EXIT_ONLY_RE = re.compile(
+        r"^\s*(?:`{0,3})?\s*exit\s*(?:`{0,3})?\.?\s*$", re.IGNORECASE
+    )
+    if EXIT_ONLY_RE.match(output_text):
+        return None
+
+    # --- 行整形（NFC + 空行除去）---
+    lines = [
+        unicodedata.normalize("NFC", ln).strip()
+        for ln in output_text.splitlines()
+        if ln.strip()
+    ]
+
+    # --- 超要約を先に抜く（本文からも消す）---
+    ultra_text, lines = _cut_ultra_block(lines)
+
+    # --- タイトル抽出（要件に合わせて厳格化）---
+    # ルール:
+    #  A) 「【タイトル】訳題」= 同一行
+    #  B) 1行目が「【タイトル】」のみ → 次の行を訳題として採用
+    #  C) 上記以外のラベル揺れ（タイトル:, Title: など）は無視（救済しない）
+    title_text = ""
+    title_idx = next(
+        (
+            i
+            for i, ln in enumerate(lines)
+            if re.match(r"^【\s*タイトル\s*】", ln)
+        ),
+        None,
+    )
+    if title_idx is not None:
+        # マーカー行を解析
+        m = re.match(r"^【\s*タイトル\s*】\s*(.*)$", lines[title_idx])
+        inline = (m.group(1) or "").strip()
+        # マーカー行は消す
+        lines.pop(title_idx)
+
+        if inline:
+            # A) 同一行（【タイトル】◯◯）
+            # 先頭にコロンが紛れる事故だけ軽く除去（ラベル救済ではない）
+            title_text = inline.lstrip(":：").strip()
+        else:
+            # B) 次の行をタイトルとして採用（存在すれば）
+            if title_idx < len(lines):
+                title_text = lines[title_idx].strip()
+                lines.pop(title_idx)
+
+    # 最終フォールバック（空を許さない）
+    translated_title = (
+        title_text or item.get("title") or "（翻訳失敗）"
+    ).strip()
+
+    # --- 要約ラベルを先頭に強制 ---
+    if not lines or not re.match(r"^【\s*要約\s*】\s*$", lines[0]):
+        lines.insert(0, "【要約】")
+
+    lines_summary = build_summary_lines(output_text, lines)
+    summary_text = "\n".join(lines_summary).strip()
+    translated_title = normalize_output_terminology_by_source(translated_title, item.get("source") or "", context="headline")
+    summary_text = normalize_output_terminology_by_source(summary_text, item.get("source") or "", context="body")
+    summary_text = fix_myanmar_billion_kyat_mistranslation(summary_text, item.get("title") or "", item.get("body") or "")
+    summary_text = remove_yen_for_non_kyat(summary_text)
+    summary_text = fix_kyat_yen_in_text(summary_text)
+    summary_text = strip_current_year_from_summary_dates(summary_text)
+    summary_html  = summary_text.replace("\n", "<br>")
+
+    norm_url = _norm_id(item.get("url") or "")
+
+    return {
+        "source": item["source"],
+        "url": norm_url,  # ★ 正規化済み
+        "title": translated_title,
+        "summary": summary_html,
+        "ultra": ultra_text,
+        "is_ayeyar": item.get("is_ayeyar", False),  # エーヤワディ系ヒット判定
+        "hit_full": item.get("hit_full", False),  # 全体キーワード判定
+        "hit_non_ayeyar": item.get("hit_non_ayeyar", False),  # 非エーヤワディ判定
+        "date": item.get("date"), 
+    }
+
+
+def _summary_checkpoint_key(item: dict):
+    """
+    要約チェックポイントのキー（正規化URL）と入力ハッシュ。
+    ハッシュには原題・送信本文・媒体に加え、実際に送る規則文（単発/まとめ両方の固定部分と
+    媒体別ルール）を含める。exit を決める Step 1/2 を変えた同日の再実行で古い結果を復元しないため。
+    """
+    skip = _is_irrawaddy_item(item)
+    single_pre = SKIP_NOTE_IRRAWADDY if skip else STEP12_FILTERS + "\n\n"
+    return _norm_id(item.get("url") or ""), _CheckpointJournal.digest(
+        item.get("title"), (item.get("body") or "")[:BODY_MAX_CHARS], item.get("source"),
+        SUMMARY_PROMPT_HEADER + COMMON_RULES_HEADER + single_pre + STEP3_TASK,
+        summary_batch_preamble(skip), SUMMARY_BATCH_OUTPUT_RULES,
+        _build_source_specific_translation_rules(item.get("source") or ""),
+    )
+
+
+def _summary_checkpoint_put(item: dict, result):
+    if _CHECKPOINT is not None:
+        _CHECKPOINT.put("summary", *_summary_checkpoint_key(item), result)
+
+
+def _summarize_single_item(item: dict):
+    """従来どおり1記事1リクエストで要約する。戻り値: (結果 dict or None, キャッシュ命中か)"""
+    # デバッグ: 入力データを確認
+    print("----- DEBUG: Prompt Input -----")
+    print(f"TITLE: {item['title']}")
+    print(f"BODY[:{BODY_MAX_CHARS}]: {item['body'][:BODY_MAX_CHARS]}")
+
+    # プロンプト実行、Irrawaddy は Step1/2 をスキップ
+    prompt = build_prompt(
+        item, skip_filters=_is_irrawaddy_item(item), body_max=BODY_MAX_CHARS
+    )
+
+    resp = call_llm_with_fallback(
+        client_summary, prompt, model="gemini-2.5-flash",
+        cacheable_prefix=SUMMARY_PROMPT_HEADER + COMMON_RULES_HEADER,
+    )
+    from_cache = bool(getattr(resp, "from_cache", False))
+    output_text = resp.text.strip()
+
+    print("----- DEBUG: Model Output -----")
+    print(output_text)
+
+    result = _summary_result_from_output(item, output_text)
+    _summary_checkpoint_put(item, result)
+    return result, from_cache
+
+
+def _is_irrawaddy_item(item: dict) -> bool:
+    return (item.get("source") == "Irrawaddy") or ("irrawaddy.com" in (item.get("url") or ""))
+
+
+def _pack_summary_batches(items: list[dict]) -> list[list[int]]:
+    """
+    要約キューを「1リクエストにまとめる記事の添字リスト」に詰める。
+    - Irrawaddy（Step1/2 スキップ）とそれ以外は手順が違うので別パック
+    - 本文長からの推定トークンが SUMMARY_BATCH_TOKEN_BUDGET を超えない範囲で、最大 SUMMARY_BATCH_MAX_ITEMS 件
+    """
+    packs: list[list[int]] = []
+    open_pack: dict[bool, tuple[list[int], int]] = {}
+    for idx, item in enumerate(items):
+        kind = _is_irrawaddy_item(item)
+        cost = estimate_prompt_tokens((item.get("title") or "") + (item.get("body") or "")[:BODY_MAX_CHARS])
+        cur = open_pack.get(kind)
+        if cur and (len(cur[0]) >= SUMMARY_BATCH_MAX_ITEMS or cur[1] + cost > SUMMARY_BATCH_TOKEN_BUDGET):
+            cur = None
+        if cur is None:
+            cur = ([], 0)
+            packs.append(cur[0])
+        cur[0].append(idx)
+        open_pack[kind] = (cur[0], cur[1] + cost)
+    return packs
+
+
+SUMMARY_BATCH_OUTPUT_RULES = (
+    "【出力形式（複数記事のまとめ処理・最優先）】\n"
+    "入力には複数の記事が含まれます。各記事を独立に、上記の手順どおり処理してください。\n"
+    "出力は次の JSON 配列のみとし、前後の説明文やコードフェンスは付けないでください。\n"
+    '[{"id": "<記事のid>", "exit": false, "title": "<訳したタイトル>", "summary": "【要約】\\n<要約本文>", "ultra": "<超要約本文>"}, ...]\n'
+    "- 入力のすべての id について、入力と同じ順に1要素ずつ返す。\n"
+    "- Step 1/2 の判定で exit となる記事は {\"id\": \"<id>\", \"exit\": true} のみを返す。\n"
+    "- title には【タイトル】ラベルを含めない。ultra には【超要約】ラベルを含めない。\n"
+    "- summary は【要約】から始め、Step 3 の要約の出力条件・空行ルールに従う（改行は \\n）。\n"
+)
+
+
+def summary_batch_preamble(skip_filters: bool) -> str:
+    """まとめ要約プロンプトの固定部分（記事に依存しない。コンテキストキャッシュの対象）"""
+    header = "次の手順で、以下の各記事を判定・処理してください。\n\n"
+    pre = (
+        "【重要】以下の記事はすべて Irrawaddy の記事です。Step 1 と Step 2 は実施せず、直ちに Step 3 のみを実施してください。\n\n"
+        if skip_filters else STEP12_FILTERS + "\n\n"
+    )
+    return header + COMMON_RULES_HEADER + "\n" + pre + STEP3_TASK
+
+
+def build_batch_prompt(items_with_ids: list[tuple[str, dict]], *, skip_filters: bool, body_max: int) -> str:
+    """build_prompt の複数記事版。共通ルールは1回だけ送り、記事ごとのルール・入力は id 付きで並べる。"""
+    preamble = summary_batch_preamble(skip_filters)
+    titles = "\n".join((it.get("title") or "") for _, it in items_with_ids)
+    bodies = "\n".join((it.get("body") or "")[:body_max] for _, it in items_with_ids)
+    rg_title = _build_region_glossary_prompt_for(
+        _select_region_entries_for_text(titles, _load_regions_cached()),
+        use_headline_ja=True,   # タイトルは D 列（見出し訳）
+    )
+    rg_body = _build_region_glossary_prompt_for(
+        _select_region_entries_for_text(bodies, _load_regions_cached()),
+        use_headline_ja=False,  # 本文は C 列（本文訳）
+    )
+    term_rules = _build_term_rules_prompt(titles, bodies)
+
+    per_item_rules = []
+    input_blocks = []
+    for item_id, it in items_with_ids:
+        title_src = it.get("title") or ""
+        body_src = (it.get("body") or "")[:body_max]
+        source_rules = _build_source_specific_translation_rules(it.get("source") or "")
+        amount_facts = build_myanmar_amount_facts_prompt(title_src, body_src)
+        if source_rules or amount_facts:
+            per_item_rules.append(f"【id={item_id} の記事に固有のルール】\n{source_rules}{amount_facts}")
+        input_blocks.append(
+            f"[id={item_id}]\n"
+            "[記事タイトル]\n###\n"
+            f"{title_src}\n\n"
+            "[記事本文]\n###\n"
+            f"{body_src}\n"
+            "###\n"
+        )
+
+    return (
+        preamble
+        + rg_title + rg_body + term_rules + "\n"
+        + "\n".join(per_item_rules) + "\n"
+        + SUMMARY_BATCH_OUTPUT_RULES + "\n"
+        + "入力データ：\n" + "\n".join(input_blocks)
+    )
+
+
+def _parse_summary_batch_output(text: str, ids: list[str]) -> dict:
+    """
+    まとめ要約の JSON 配列を id → 出力テキスト（単発要約と同じ【タイトル】/【要約】/【超要約】形式）に直す。
+    exit は "exit"。形式が崩れている id は含めない（呼び出し側で単発に回す）。
+    """
+    try:
+        data = json.loads(re.sub(r"^\s*```(?:json)?\s*|\s*```\s*$", "", text or "").strip(), strict=False)
+    except Exception:
+        m = re.search(r"\[.*\]", text or "", flags=re.DOTALL)
+        if not m:
+            return {}
+        try:
+            data = json.loads(m.group(0), strict=False)
+        except Exception:
+            return {}
+    if not isinstance(data, list):
+        return {}
+
+    wanted = set(ids)
+    out: dict = {}
+    for row in data:
+        if not isinstance(row, dict):
+            continue
+        item_id = str(row.get("id") or "").strip()
+        if item_id not in wanted or item_id in out:
+            continue
+        if row.get("exit") is True:
+            out[item_id] = "exit"
+            continue
+        title = row.get("title")
+        summary = row.get("summary")
+        ultra = row.get("ultra")
+        if not all(isinstance(v, str) and v.strip() for v in (title, summary, ultra)):
+            continue
+        summary = summary.strip()
+        if not re.sub(r"^【\s*要約\s*】", "", summary).strip():
+            continue
+        if not re.match(r"^【\s*要約\s*】", summary):
+            summary = "【要約】\n" + summary
+        out[item_id] = f"【タイトル】 {title.strip()}\n{summary}\n【超要約】\n{ultra.strip()}"
+    return out
 
-    summarized_results = []
-    for i in range(0, len(translation_queue), batch_size):
-        batch = translation_queue[i : i + batch_size]
-        print(f"⚙️ Processing batch {i // batch_size + 1}...")
 
-        for item in batch:
+def _summarize_queue_batched(queue: list[dict], *, wait_seconds: int = 60) -> list[dict]:
+    """
+    複数記事を JSON 配列で1リクエストにまとめて要約する。
+    検証に通らなかった記事（欠落・空・壊れた JSON）だけ単発パス（_summarize_single_item）で再実行する。
+    結果はキューの順序どおり。
+    """
+    packs = _pack_summary_batches(queue)
+    results: list = [None] * len(queue)
+    for n, pack in enumerate(packs):
+        print(f"⚙️ Processing summary batch {n + 1}/{len(packs)} (items={len(pack)})...")
+        live = False
+        retry = list(pack) if len(pack) == 1 else []
+
+        if len(pack) > 1:
+            ids = [f"a{k}" for k in pack]
+            done: set = set()  # 結果（exit を含む）を確定させた添字
             try:
-                # デバッグ: 入力データを確認
-                print("----- DEBUG: Prompt Input -----")
-                print(f"TITLE: {item['title']}")
-                print(f"BODY[:{BODY_MAX_CHARS}]: {item['body'][:BODY_MAX_CHARS]}")
-
-                # プロンプト実行、Irrawaddy は Step1/2 をスキップ
-                is_irrawaddy = (item.get("source") == "Irrawaddy") or (
-                    "irrawaddy.com" in (item.get("url") or "")
-                )
-                prompt = build_prompt(
-                    item, skip_filters=is_irrawaddy, body_max=BODY_MAX_CHARS
+                skip = _is_irrawaddy_item(queue[pack[0]])
+                prompt = build_batch_prompt(
+                    [(f"a{k}", queue[k]) for k in pack],
+                    skip_filters=skip,
+                    body_max=BODY_MAX_CHARS,
                 )
-
                 resp = call_llm_with_fallback(
-                    client_summary, prompt, model="gemini-2.5-flash"
+                    client_summary, prompt, model="gemini-2.5-flash", usage_tag="summary-batch",
+                    cacheable_prefix=summary_batch_preamble(skip),
+                    # 全件が検証を通った応答だけキャッシュする（壊れた JSON を再実行で再生しない）
+                    validate=lambda t: len(_parse_summary_batch_output(t, ids)) == len(ids),
                 )
-                output_text = resp.text.strip()
+                live = not getattr(resp, "from_cache", False)
+                parsed = _parse_summary_batch_output(resp.text or "", ids)
+                for k in pack:
+                    out = parsed.get(f"a{k}")
+                    if out is None:
+                        retry.append(k)
+                        continue
+                    try:
+                        results[k] = _summary_result_from_output(queue[k], out) if out != "exit" else None
+                    except Exception as e:
+                        print("🛑 Error during batch post-processing:", e.__class__.__name__, "|", repr(e))
+                        retry.append(k)
+                        continue
+                    _summary_checkpoint_put(queue[k], results[k])
+                    done.add(k)
+            except Exception as e:
+                print("🛑 Error during batch translation:", e.__class__.__name__, "|", repr(e))
+                # 確定済みの記事は単発で再実行しない（二重課金と結果の上書きを避ける）
+                retry = [k for k in pack if k not in done]
+            if retry:
+                print(f"↩️ {len(retry)}/{len(pack)} item(s) failed validation; re-running one by one")
+
+        for k in retry:
+            from_cache = False
+            try:
+                results[k], from_cache = _summarize_single_item(queue[k])
+                live = live or not from_cache
+            except Exception as e:
+                print("🛑 Error during translation:", e.__class__.__name__, "|", repr(e))
+            if not from_cache:
+                _fixed_pace_sleep(0.6)
 
-                print("----- DEBUG: Model Output -----")
-                print(output_text)
+        if n + 1 < len(packs) and live:
+            _fixed_pace_sleep(wait_seconds, f"🕒 Waiting {wait_seconds} seconds before next batch...")
 
-                # --- exit を広めに判定（バッククォートや句読点混入対策）---
-                EXIT_ONLY_RE = re.compile(
-                    r"^\s*(?:`{0,3})?\s*exit\s*(?:`{0,3})?\.?\s*$", re.IGNORECASE
-                )
-                if EXIT_ONLY_RE.match(output_text):
-                    continue
+    return [r for r in results if r is not None]
 
-                # --- 行整形（NFC + 空行除去）---
-                lines = [
-                    unicodedata.normalize("NFC", ln).strip()
-                    for ln in output_text.splitlines()
-                    if ln.strip()
-                ]
 
-                # --- 超要約を先に抜く（本文からも消す）---
-                ultra_text, lines = _cut_ultra_block(lines)
-
-                # --- タイトル抽出（要件に合わせて厳格化）---
-                # ルール:
-                #  A) 「【タイトル】訳題」= 同一行
-                #  B) 1行目が「【タイトル】」のみ → 次の行を訳題として採用
-                #  C) 上記以外のラベル揺れ（タイトル:, Title: など）は無視（救済しない）
-                title_text = ""
-                title_idx = next(
-                    (
-                        i
-                        for i, ln in enumerate(lines)
-                        if re.match(r"^【\s*タイトル\s*】", ln)
-                    ),
-                    None,
-                )
-                if title_idx is not None:
-                    # マーカー行を解析
-                    m = re.match(r"^【\s*タイトル\s*】\s*(.*)$", lines[title_idx])
-                    inline = (m.group(1) or "").strip()
-                    # マーカー行は消す
-                    lines.pop(title_idx)
-
-                    if inline:
-                        # A) 同一行（【タイトル】◯◯）
-                        # 先頭にコロンが紛れる事故だけ軽く除去（ラベル救済ではない）
-                        title_text = inline.lstrip(":：").strip()
-                    else:
-                        # B) 次の行をタイトルとして採用（存在すれば）
-                        if title_idx < len(lines):
-                            title_text = lines[title_idx].strip()
-                            lines.pop(title_idx)
-
-                # 最終フォールバック（空を許さない）
-                translated_title = (
-                    title_text or item.get("title") or "（翻訳失敗）"
-                ).strip()
-
-                # --- 要約ラベルを先頭に強制 ---
-                if not lines or not re.match(r"^【\s*要約\s*】\s*$", lines[0]):
-                    lines.insert(0, "【要約】")
-
-                lines_summary = build_summary_lines(output_text, lines)
-                summary_text = "\n".join(lines_summary).strip()
-                translated_title = normalize_output_terminology_by_source(translated_title, item.get("source") or "", context="headline")
-                summary_text = normalize_output_terminology_by_source(summary_text, item.get("source") or "", context="body")
-                summary_text = fix_myanmar_billion_kyat_mistranslation(summary_text, item.get("title") or "", item.get("body") or "")
-                summary_text = remove_yen_for_non_kyat(summary_text)
-                summary_text = fix_kyat_yen_in_text(summary_text)
-                summary_text = strip_current_year_from_summary_dates(summary_text)
-                summary_html  = summary_text.replace("\n", "<br>")
-
-                norm_url = _norm_id(item.get("url") or "")
-
-                summarized_results.append(
-                    {
-                        "source": item["source"],
-                        "url": norm_url,  # ★ 正規化済み
-                        "title": translated_title,
-                        "summary": summary_html,
-                        "ultra": ultra_text,
-                        "is_ayeyar": item.get("is_ayeyar", False),  # エーヤワディ系ヒット判定
-                        "hit_full": item.get("hit_full", False),  # 全体キーワード判定
-                        "hit_non_ayeyar": item.get("hit_non_ayeyar", False),  # 非エーヤワディ判定
-                        "date": item.get("date"), 
-                    }
-                )
+def summarize_items(items, batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60, *, learn_boilerplate=True):
+    """
+    コンパクション → 要約（まとめ or 1件ずつ）。LLM 重複判定はしない（finalize_summaries で行う）。
+    戻り値は items の順（exit・失敗分は含まない）。
+    """
+    # 送信前に本文をコンパクション（媒体ごとの定型行を学習→除去、文字種別トークン予算で文境界カット）
+    if learn_boilerplate:
+        learn_source_boilerplate(items)
+    compacted = [
+        dict(it, body=compact_body_for_llm(it.get("body") or "", source=it.get("source") or ""))
+        for it in items
+    ]
 
-            except Exception as e:
-                print(
-                    "🛑 Error during translation:", e.__class__.__name__, "|", repr(e)
-                )
-                continue
+    # 前回の実行で要約済みの記事はジャーナルから復元し、残りだけ LLM に送る
+    restored = {}
+    queue = []
+    for idx, it in enumerate(compacted):
+        found, rec = _CHECKPOINT.get("summary", *_summary_checkpoint_key(it)) if _CHECKPOINT else (False, None)
+        if found:
+            restored[idx] = rec
+        else:
+            queue.append(it)
+    if restored:
+        print(f"[checkpoint] summary: {len(restored)} item(s) restored, {len(queue)} to go")
+
+    if SUMMARY_BATCH_ENABLED:
+        summarized_results = _summarize_queue_batched(queue, wait_seconds=wait_seconds)
+    else:
+        summarized_results = []
+        for i in range(0, len(queue), batch_size):
+            batch = queue[i : i + batch_size]
+            print(f"⚙️ Processing batch {i // batch_size + 1}...")
+            live_calls = 0  # キャッシュ命中以外で実際に API を叩いた回数
+
+            for item in batch:
+                from_cache = False
+                try:
+                    result, from_cache = _summarize_single_item(item)
+                    if not from_cache:
+                        live_calls += 1
+                    if result is not None:
+                        summarized_results.append(result)
+                except Exception as e:
+                    print(
+                        "🛑 Error during translation:", e.__class__.__name__, "|", repr(e)
+                    )
+                    continue
+
+                # バッチ内で微スリープしてバーストを抑える（キャッシュ命中は API を叩いていないので不要）
+                # スケジューラ有効時は呼び出し側でクォータに合わせて待つので不要
+                if not from_cache:
+                    _fixed_pace_sleep(0.6)
 
-            # バッチ内で微スリープしてバーストを抑える
-            time.sleep(0.6)
+            if i + batch_size < len(queue) and live_calls:
+                _fixed_pace_sleep(wait_seconds, f"🕒 Waiting {wait_seconds} seconds before next batch...")
 
-        if i + batch_size < len(translation_queue):
-            print(f"🕒 Waiting {wait_seconds} seconds before next batch...")
-            time.sleep(wait_seconds)
+    if restored:
+        fresh = {_norm_id(x.get("url") or ""): x for x in summarized_results}
+        summarized_results = []
+        for idx, it in enumerate(compacted):
+            x = restored[idx] if idx in restored else fresh.get(_norm_id(it.get("url") or ""))
+            if x:
+                summarized_results.append(x)
+    return summarized_results
 
+
+def finalize_summaries(summarized_results):
+    """全件そろった要約に LLM 重複判定をかけ、返却フォーマットを固定する。"""
     # 重複判定→片方残し（最終アウトプットの形式は変えない）
     deduped = dedupe_articles_with_llm(client_dedupe, summarized_results, debug=True)
 
@@ -5519,6 +8168,110 @@ def process_translation_batches(batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=
     return normalized
 
 
+# 本処理関数
+def process_translation_batches(batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60):
+    # MEMO: TEST用、Geminiを呼ばず、URLリストだけ返す
+    # summarized_results = []
+    # for item in translation_queue:
+    #     summarized_results.append({
+    #         "source": item["source"],
+    #         "url": item["url"],
+    #         "title": item['title'],
+    #         "summary": item['body'][:BODY_MAX_CHARS]
+    #     })
+    return finalize_summaries(summarize_items(translation_queue, batch_size, wait_seconds))
+
+
+# ===== 収集と要約のストリーミング（プロデューサ／コンシューマ） =====
+# 収集器が process_and_enqueue_articles でキューに積んだ記事を、その場で要約スレッドへ流す。
+# 全体の所要時間が「収集＋要約」から「max(収集, 要約)」に近づく。
+# URL 重複の最終排除と dedupe_articles_with_llm は従来どおり収集完了後に1回だけ行う。
+SUMMARY_STREAMING = os.getenv("SUMMARY_STREAMING", "1") == "1"
+SUMMARY_STREAM_QUEUE_MAX = int(os.getenv("SUMMARY_STREAM_QUEUE_MAX", "50"))
+
+
+class _SummaryStream:
+    """
+    有界キュー + 要約スレッド1本（要約用キーは1本なので、並列化しても枠で詰まるだけ）。
+    - submit(): 収集側。URL 重複は投入時点で除外し、媒体の定型行をその媒体分で学習してから積む
+      （キューが満杯なら収集側が待つ＝バックプレッシャ）
+    - finish(): 残りを処理し終えるまで待って、投入順の要約結果を返す
+    """
+
+    _DONE = object()
+
+    def __init__(self, batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60, maxsize=SUMMARY_STREAM_QUEUE_MAX):
+        import queue as _queue
+
+        self.batch_size = batch_size
+        self.wait_seconds = wait_seconds
+        self._q = _queue.Queue(maxsize=max(1, maxsize))
+        self._empty = _queue.Empty
+        self._seen = set()
+        self._results = []
+        self._submitted = 0
+        self._thread = threading.Thread(target=self._run, name="summary-stream", daemon=True)
+        self._thread.start()
+
+    def submit(self, items):
+        fresh = []
+        for it in items or []:
+            if it["url"] in self._seen:
+                continue
+            self._seen.add(it["url"])
+            fresh.append(it)
+        if not fresh:
+            return
+        learn_source_boilerplate(fresh)
+        for it in fresh:
+            self._q.put(it)
+        self._submitted += len(fresh)
+        print(f"[stream] queued {len(fresh)} item(s) (total {self._submitted}, waiting {self._q.qsize()})")
+
+    def _drain(self, first):
+        """1件目を受け取ったら、その時点でキューにある分をまとめ要約1回分まで取り出す。"""
+        chunk = [first]
+        limit = SUMMARY_BATCH_MAX_ITEMS if SUMMARY_BATCH_ENABLED else self.batch_size
+        done = False
+        while len(chunk) < limit:
+            try:
+                it = self._q.get_nowait()
+            except self._empty:
+                break
+            if it is self._DONE:
+                done = True
+                break
+            chunk.append(it)
+        return chunk, done
+
+    def _run(self):
+        done = False
+        first_chunk = True
+        while not done:
+            it = self._q.get()
+            if it is self._DONE:
+                break
+            chunk, done = self._drain(it)
+            if not first_chunk:
+                _fixed_pace_sleep(self.wait_seconds, f"🕒 Waiting {self.wait_seconds} seconds before next batch...")
+            first_chunk = False
+            try:
+                self._results.extend(
+                    summarize_items(chunk, self.batch_size, self.wait_seconds, learn_boilerplate=False)
+                )
+            except Exception as e:
+                print("🛑 Error during streamed translation:", e.__class__.__name__, "|", repr(e))
+
+    def finish(self):
+        self._q.put(self._DONE)
+        self._thread.join()
+        print(f"[stream] summarized {len(self._results)}/{self._submitted} item(s)")
+        return list(self._results)
+
+
+_SUMMARY_STREAM = None
+
+
 # ===== 全文翻訳（Business向けPDF用） =====
 # 方針：
 #  - 2件まとめ翻訳（JSON配列）
@@ -5603,49 +8356,19 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
         u = u.split("#", 1)[0]
         return u.rstrip("/")
 
-    # --- English & Burmese leading labels / outlet-only lines ---
-    EXCLUDE_LINE_PATTERNS = [
-        # Captions / media labels (English)
-        r"^(?:Photo|Image|Video|Graphic|Map|Caption)[:：\)]",
-        r"^\((?:Photo|Image|Video|Graphic|Map)\)\s*$",
-        # Credits / sources (English)
-        r"^(?:Credit|Credits|Source|Sources|Via|Courtesy of)[:：]",
-        # Editorial / translation notes (English)
-        r"^(?:With reporting by|Reported by|Reporting by|Edited by|Compiled by|Translation|Translator|Translated by).*$",
-
-        # Captions / labels (Burmese)
-        r"^(?:ဓာတ်ပုံ|ရုပ်ပုံ)[:：]",            # photo / image
-        # Sources / credits (Burmese)
-        r"^(?:ရင်းမြစ်)[:：]",                 # source
-        # Editorial / translation notes (Burmese)
-        r"^(?:ဘာသာပြန်|ဘာသာပြန်သူ|တည်းဖြတ်)[:：]",
-
-        # Outlet-only line (English outlet names)
-        r"^(?:BBC Burmese|DVB|Myanmar Now|The Irrawaddy|Khit Thit Media|Mizzima|RFA Burmese|VOA Burmese|Eleven Media|Frontier Myanmar|Reuters|AP|Associated Press|AFP|SCMP)\s*$",
-        # 3個以上のハッシュタグ行（タグ雲）
-        r'^(?:[#＃][^\s#]+(?:\s+|$)){3,}$',
-        # WPコメント欄の定型文・コメント誘導
-        r'^(?:Save my name, email, and website.*)$',
-        r'^(?:Leave a comment|Post a Comment|Your email address will not be published).*$',
-        # 単独 "PDF" 行
-        r'^(?:PDF)\s*$',
-        # 記号だけの行
-        r'^[\s\-/–—•·|\\\(\)\[\]{}“”"\'«»。、．…／]+$',
-        # "##..." で始まるタグ群の行
-        r'^(?:##.*)$',
-    ]
-    EXCLUDE_RE_LIST = [re.compile(p, re.IGNORECASE) for p in EXCLUDE_LINE_PATTERNS]
-
-    def compact_body(body: str) -> str:
+    # 定型行（キャプション・クレジット・署名・共有ボタン等）は BOILERPLATE_LINE_RES と、
+    # 要約段階で学習済みの媒体ごとの繰り返し行（_SOURCE_BOILERPLATE）で落とす
+    def compact_body(body: str, source: str = "") -> str:
         if not body:
             return ""
+        learned = _SOURCE_BOILERPLATE.get((source or "").strip()) or set()
         norm_lines = []
         for ln in body.splitlines():
             ln = unicodedata.normalize("NFC", ln)
             ln = re.sub(r"\s+", " ", ln).strip()
             if not ln:
                 continue
-            if any(p.search(ln) for p in EXCLUDE_RE_LIST):
+            if ln in learned or any(p.search(ln) for p in BOILERPLATE_LINE_RES):
                 continue
             norm_lines.append(ln)
         s = "\n\n".join(norm_lines).strip()
@@ -5653,34 +8376,24 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
 
     def trim_by_chars(s: str, max_chars: int) -> str:
         s = s or ""
-        return s if len(s) <= max_chars else (s[:max_chars].rstrip() + "\n\n[…本文が長いためここまでを翻訳]")
+        if len(s) <= max_chars:
+            return s
+        # 文の途中で切らないよう、上限内の最後の文末（後半にあるもの）まで戻す
+        head = s[:max_chars]
+        cut = max(head.rfind(". "), head.rfind("။"), head.rfind("。"), head.rfind("\n"))
+        if cut >= max_chars // 2:
+            head = head[: cut + 1]
+        return head.rstrip() + "\n\n[…本文が長いためここまでを翻訳]"
 
     def rough_token_estimate(s: str) -> int:
-        """英語 or ビルマ語（ミャンマー文字）前提の**ざっくり**見積り。
-        - English 優勢: 4 chars ≒ 1 token
-        - Myanmar 優勢: 2 chars ≒ 1 token
-        - 混在/その他: 3 chars ≒ 1 token（安全側）
-        ※ 目的は超過前待機の“目安”なので、少し多め（安全側）に見積もります。
-        """
-        s = s or ""
-        total = len(s)
-        if total == 0:
-            return 0
-        # Unicode ブロックでミャンマー文字を概算カウント
-        my = len(re.findall(r"[\u1000-\u109F\uAA60-\uAA7F\uA9E0-\uA9FF]", s))
-        la = len(re.findall(r"[A-Za-z]", s))  # 英字の概算
-        my_ratio = my / total
-        la_ratio = la / total
-        if my_ratio >= 0.6:
-            div = 2.0
-        elif la_ratio >= 0.6:
-            div = 4.0
-        else:
-            div = 3.0
-        return max(0, int(total / div))
+        """入力トークンの目安（estimate_prompt_tokens と同じ見積り）"""
+        return estimate_prompt_tokens(s)
 
     def precheck_sleep(predicted_prompt_tokens: int, tag: str = "fulltext-batch"):
-        """_FREE_TIER_MON の窓データで RPM/TPM(in) を事前チェックして、危なければ待機。"""
+        """_FREE_TIER_MON の窓データで RPM/TPM(in) を事前チェックして、危なければ待機。
+        スケジューラ有効時は call_gemini_with_retries 側で正確に待つので何もしない。"""
+        if _GEMINI_SCHEDULER is not None:
+            return
         try:
             mon = _FREE_TIER_MON  # 既存のグローバル（監視オブジェクト）
         except NameError:
@@ -5784,6 +8497,19 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
         t = (body or "").strip()
         return bool(t) and (not _contains_cjk(t))
 
+    # 記事に依存しない冒頭部分（コンテキストキャッシュの対象）
+    FULLTEXT_PROMPT_PREAMBLE = (
+        "次のニュース記事の【本文だけ】を**自然な日本語**に完全翻訳してください。\n"
+        "・固有名詞は一般的な日本語表記に\n"
+        "・ビルマ語/英語が混在していてもOK\n"
+        "・タイトル（見出し）は訳さない／出力しない\n"
+        "・本文は改行と段落を活かして読みやすく\n"
+        "・文体は だ・である調。必要に応じて体言止めを用いる（乱用は避ける）\n"
+        "・冗長な修飾は削り、できるだけ簡潔に表現する\n"
+        "・半角の()括弧はすべて全角の（ ）に統一すること\n\n"
+        f"{COMMON_TRANSLATION_RULES}\n"
+    )
+
     # === 全文翻訳プロンプトの共通ビルダー（既存prompt_partsの共通化） ===
     def _build_fulltext_prompt(input_array: list[dict]) -> str:
         # 文字列の隣接連結と + の混在での解析エラーを避けるため、配列で組み立て
@@ -5803,15 +8529,7 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
             if build_myanmar_amount_facts_prompt(x.get("title") or "", x.get("body") or "")
         )
         prompt_parts = (
-            "次のニュース記事の【本文だけ】を**自然な日本語**に完全翻訳してください。\n"
-            "・固有名詞は一般的な日本語表記に\n"
-            "・ビルマ語/英語が混在していてもOK\n"
-            "・タイトル（見出し）は訳さない／出力しない\n"
-            "・本文は改行と段落を活かして読みやすく\n"
-            "・文体は だ・である調。必要に応じて体言止めを用いる（乱用は避ける）\n"
-            "・冗長な修飾は削り、できるだけ簡潔に表現する\n"
-            "・半角の()括弧はすべて全角の（ ）に統一すること\n\n"
-            f"{COMMON_TRANSLATION_RULES}\n"
+            FULLTEXT_PROMPT_PREAMBLE,
             f"{source_specific_rules}\n"
             f"{amount_facts_rules}\n"
             f"{PROMPT_SELF_CHECK_RULE}\n"
@@ -5838,6 +8556,19 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
         )
         return "".join(prompt_parts)
     
+    def _fulltext_response_ok(text: str, expected: int) -> bool:
+        """JSON として読めて、expected 件すべてに日本語の body_ja があるか（キャッシュ保存の条件）"""
+        arr = _safe_json_loads_extract(text)
+        if isinstance(arr, dict):
+            arr = [arr]
+        if not isinstance(arr, list):
+            return False
+        translated = [
+            x for x in arr
+            if isinstance(x, dict) and _contains_cjk(str(x.get("body_ja") or ""))
+        ]
+        return len(translated) >= expected
+
     # === 未翻訳検知時の“単発リトライ”（同じプロンプトを単一要素配列で再利用） ===
     def _single_fulltext_retry(item_id: str, url: str, raw_body: str, source: str = "", max_chars: int = 6000) -> str:
         body_trim = trim_by_chars(raw_body or "", max_chars)
@@ -5850,6 +8581,8 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
                 prompt,
                 model="gemini-3.1-flash-lite",
                 usage_tag="fulltext-retry",
+                cacheable_prefix=FULLTEXT_PROMPT_PREAMBLE,
+                validate=lambda t: _fulltext_response_ok(t, 1),
             )
 
             llm_text = getattr(resp, "text", None) or ""
@@ -5932,7 +8665,7 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
             continue
 
         # PDFの全文翻訳では 100,000 字までは翻訳対象に含める。
-        body_compact = trim_by_chars(compact_body(body_src), FULLTEXT_MAX_CHARS)
+        body_compact = trim_by_chars(compact_body(body_src, it.get("source") or ""), FULLTEXT_MAX_CHARS)
         prepared.append({
             "item_id": item_id,
             "url": u,
@@ -5941,12 +8674,29 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
             "body": body_compact,
         })
 
-    # --- 2) まとめ翻訳（長文だけ単独バッチ） ---
+    # --- 1.5) 前回の実行で翻訳済みの記事はジャーナルから復元（本文が同じ場合のみ） ---
+    def _fulltext_checkpoint_key(b: dict):
+        return (
+            _normalize_url_key(b["url"]) or b["item_id"],
+            _CheckpointJournal.digest(b["body"], b.get("source"), FULLTEXT_PROMPT_PREAMBLE),
+        )
+
     results = []
+    pending = []
+    for b in prepared:
+        found, rec = _CHECKPOINT.get("fulltext", *_fulltext_checkpoint_key(b)) if _CHECKPOINT else (False, None)
+        if found and rec:
+            results.append({"item_id": b["item_id"], "url": b["url"], "body_ja": rec.get("body_ja") or ""})
+        else:
+            pending.append(b)
+    if results:
+        print(f"[checkpoint] fulltext: {len(results)} item(s) restored, {len(pending)} to go")
+
+    # --- 2) まとめ翻訳（長文だけ単独バッチ） ---
     i = 0
-    n = len(prepared)
+    n = len(pending)
     while i < n:
-        current = prepared[i]
+        current = pending[i]
 
         # 5000文字超えならその記事だけ単独バッチ
         if len(current["body"]) > LONG_FULLTEXT_THRESHOLD:
@@ -5956,9 +8706,9 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
             # 短めの記事どうしなら 2本まとめる
             if (
                 i + 1 < n
-                and len(prepared[i + 1]["body"]) <= LONG_FULLTEXT_THRESHOLD
+                and len(pending[i + 1]["body"]) <= LONG_FULLTEXT_THRESHOLD
             ):
-                batch = [current, prepared[i + 1]]
+                batch = [current, pending[i + 1]]
                 effective_batch_size = 2
             else:
                 # 最後の1本だけ残った場合など
@@ -5976,6 +8726,8 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
                 prompt,
                 model="gemini-3.1-flash-lite",
                 usage_tag="fulltext",
+                cacheable_prefix=FULLTEXT_PROMPT_PREAMBLE,
+                validate=lambda t, n=len(batch): _fulltext_response_ok(t, n),
             )
             text = getattr(resp, "text", None) or ""
             arr = _safe_json_loads_extract(text)
@@ -6085,14 +8837,19 @@ def translate_fulltexts_for_business(urls_in_order_or_items, url_to_source_title
                     repaired = fix_kyat_yen_in_text(repaired)
                     results[j]["body_ja"] = repaired
                     print(f"[ok] repaired fulltext via single retry: {url}")
-                time.sleep(0.6)
+                _fixed_pace_sleep(0.6)
 
-        time.sleep(0.6)  # バッチ内マイクロスリープ
+        # 日本語訳が取れた記事だけチェックポイントに記録（未翻訳のままの記事は再実行で再挑戦）
+        if _CHECKPOINT is not None:
+            for b, item in zip(batch, results[start_idx:end_idx]):
+                if _contains_cjk(item.get("body_ja") or ""):
+                    _CHECKPOINT.put("fulltext", *_fulltext_checkpoint_key(b), {"body_ja": item["body_ja"]})
+
+        _fixed_pace_sleep(0.6)  # バッチ内マイクロスリープ
 
         i += effective_batch_size
         if i < n:
-            print(f"🕒 Waiting {WAIT} seconds before next fulltext batch …")
-            time.sleep(WAIT)
+            _fixed_pace_sleep(WAIT, f"🕒 Waiting {WAIT} seconds before next fulltext batch …")
 
     # --- 3) 入力順で並べ直し（同一URLでも item_id ごとに維持） ---
     item_to_item = {
@@ -6783,6 +9540,13 @@ if __name__ == "__main__":
     
     seen_urls = set()
 
+    # 要約・全文翻訳の途中結果を bundle に記録（再実行時は済んだ記事をスキップ）
+    open_checkpoint_journal(args.bundle_dir, date_mmt.isoformat())
+
+    # 収集しながら要約を進める（SUMMARY_STREAMING=0 なら従来どおり収集後にまとめて要約）
+    if SUMMARY_STREAMING:
+        _SUMMARY_STREAM = _SummaryStream(batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60)
+
     print("=== Mizzima (Burmese) ===")
     articles_mizzima = get_mizzima_articles_from_category(
         date_mmt,
@@ -6864,8 +9628,15 @@ if __name__ == "__main__":
     print(f"⚙️ Removing URL duplicates from {len(translation_queue)} articles...")
     translation_queue = deduplicate_by_url(translation_queue)
 
-    # バッチ翻訳実行 (5件ごとに1分待機)
-    all_summaries = process_translation_batches(batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60)
+    if _SUMMARY_STREAM is not None:
+        # 収集中に流した分の要約を待ち、URL 重複排除後に残った記事だけで LLM 重複判定
+        streamed = _SUMMARY_STREAM.finish()
+        _SUMMARY_STREAM = None
+        kept_urls = {_norm_id(q.get("url") or "") for q in translation_queue}
+        all_summaries = finalize_summaries([x for x in streamed if x.get("url") in kept_urls])
+    else:
+        # バッチ翻訳実行 (5件ごとに1分待機)
+        all_summaries = process_translation_batches(batch_size=TRANSLATION_BATCH_SIZE, wait_seconds=60)
 
     # 2) エーヤワディ以外のキーワードヒット（エーヤワディに該当しないものだけ）
     summaries_non_ayeyar = [
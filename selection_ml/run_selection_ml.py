@@ -25,17 +25,23 @@ Applied changes:
 
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
 import http.client
 import json
 import os
+import pickle
 import random
 import re
 import socket
 import ssl
 import sys
+import threading
 import time
 import unicodedata
-from dataclasses import dataclass, replace
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from datetime import date, datetime, timedelta
 from typing import Any, Iterable
 
@@ -76,6 +82,15 @@ SAME_DAY_DUPLICATE_LABEL_PREFIX = "重複"
 MAX_REASON_FEATURES = 8
 MIN_COLUMNS = 32
 
+# Trained models are stored per archive fingerprint (file ids + modifiedTime),
+# so scheduled runs reuse the fitted pipeline until an archive file changes.
+MODEL_STORE_DIR_DEFAULT = ".selection_ml_cache/models"
+MODEL_STORE_KEEP_DEFAULT = 3
+# Parsed archive rows are snapshotted per archive file; only files whose Drive
+# modifiedTime changed are read from Sheets again.
+ARCHIVE_SNAPSHOT_DIR_DEFAULT = ".selection_ml_cache/archives"
+ARCHIVE_SNAPSHOT_READ_WORKERS_DEFAULT = 4
+
 SHEETS_WRITE_CHUNK_ROWS_DEFAULT = 25
 SHEETS_WRITE_MAX_PAYLOAD_BYTES_DEFAULT = 1_800_000
 SHEETS_WRITE_MAX_RETRIES_DEFAULT = 6
@@ -91,10 +106,21 @@ GEMINI_MODEL_FALLBACK_WAIT_SECONDS_DEFAULT = 2.0
 GEMINI_DEFAULT_MIN_ML_SCORE = 0
 GEMINI_DEFAULT_MAX_ARTICLES = 150
 GEMINI_DEFAULT_BATCH_SIZE = 20
+# Rerank batches run concurrently; request starts share one rate limiter.
+GEMINI_DEFAULT_RERANK_CONCURRENCY = 3
+GEMINI_DEFAULT_RERANK_RPM = 30
+GEMINI_RATE_LIMIT_BACKOFF_SECONDS_DEFAULT = 10.0
+GEMINI_CONTEXT_CACHE_TTL_SECONDS_DEFAULT = 3600
+# Explicit caches need a minimum prompt size (about 1024 tokens); shorter preambles are sent inline.
+GEMINI_CONTEXT_CACHE_MIN_CHARS_DEFAULT = 3000
 ARCHIVE_ADOPTED_CONTEXT_MAX_ITEMS = 6
 ARCHIVE_ADOPTED_CONTEXT_MAX_CHARS = 2600
 SAME_DAY_CONTEXT_MAX_ITEMS = 6
 SAME_DAY_CONTEXT_MAX_CHARS = 2600
+# Text-similarity match used by both context maps: overlap coefficient of
+# character n-grams, counted when >= threshold and weighted into match_score.
+CONTEXT_TEXT_SIMILARITY_THRESHOLD = 0.18
+CONTEXT_TEXT_SIMILARITY_WEIGHT = 40.0
 
 COL_DATE = 0       # A
 COL_MEDIA = 2      # C
@@ -517,39 +543,161 @@ def build_classification_training_records_from_sheet(
     return deduped
 
 
+class ArchiveSnapshotStore:
+    """Gzipped JSONL snapshots of parsed ArticleRecords, one file per archive.
+
+    The first line holds the archive's Drive modifiedTime and MODEL_VERSION; a
+    snapshot is only used while both still match.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def path_for(self, archive_file: dict[str, str]) -> str:
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "_", archive_file["id"])
+        return os.path.join(self.directory, f"{safe_id}.jsonl.gz")
+
+    @staticmethod
+    def header_for(archive_file: dict[str, str]) -> dict[str, str]:
+        return {
+            "id": archive_file["id"],
+            "modifiedTime": archive_file.get("modifiedTime", ""),
+            "model_version": MODEL_VERSION,
+        }
+
+    def is_fresh(self, archive_file: dict[str, str]) -> bool:
+        if not archive_file.get("modifiedTime"):
+            return False
+        try:
+            with gzip.open(self.path_for(archive_file), "rt", encoding="utf-8") as handle:
+                return json.loads(handle.readline()) == self.header_for(archive_file)
+        except (OSError, ValueError):
+            return False
+
+    def load(self, archive_file: dict[str, str]) -> list[ArticleRecord] | None:
+        try:
+            with gzip.open(self.path_for(archive_file), "rt", encoding="utf-8") as handle:
+                if json.loads(handle.readline()) != self.header_for(archive_file):
+                    return None
+                return [ArticleRecord(**json.loads(line)) for line in handle if line.strip()]
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, archive_file: dict[str, str], records: list[ArticleRecord]) -> None:
+        path = self.path_for(archive_file)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+                handle.write(json.dumps(self.header_for(archive_file), ensure_ascii=False) + "\n")
+                for record in records:
+                    handle.write(json.dumps(asdict(record), ensure_ascii=False) + "\n")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"[selection-ml-classifier] archive_snapshot_save_failed path={path} error={exc}", file=sys.stderr)
+
+    def prune(self, archive_files: list[dict[str, str]]) -> None:
+        """Remove snapshots of archive files that no longer exist in the folder."""
+        keep = {os.path.basename(self.path_for(archive_file)) for archive_file in archive_files}
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".jsonl.gz") and name not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
 def load_archive_records(
     drive: Any,
     sheets: Any,
     archive_folder_id: str,
+    snapshot_store: ArchiveSnapshotStore | None = None,
 ) -> tuple[list[ArticleRecord], int]:
+    archive_files = list_archive_spreadsheets(drive, archive_folder_id)
+    return read_archive_records(sheets, archive_files, snapshot_store), len(archive_files)
+
+
+def read_archive_file_records(sheets: Any, archive_file: dict[str, str]) -> list[ArticleRecord] | None:
+    """Read one archive file from Sheets; None when the sheet cannot be read."""
     from googleapiclient.errors import HttpError
 
-    archive_files = list_archive_spreadsheets(drive, archive_folder_id)
-    rows: list[ArticleRecord] = []
+    try:
+        values = read_sheet_values(
+            sheets,
+            archive_file["id"],
+            f"{ARCHIVE_SHEET_NAME}!A:AF",
+        )
+    except HttpError as exc:
+        print(
+            f"[selection-ml-classifier] skip {archive_file['name']} / "
+            f"{ARCHIVE_SHEET_NAME}: {exc}",
+            file=sys.stderr,
+        )
+        return None
 
-    for archive_file in archive_files:
-        try:
-            values = read_sheet_values(
-                sheets,
-                archive_file["id"],
-                f"{ARCHIVE_SHEET_NAME}!A:AF",
-            )
-        except HttpError as exc:
-            print(
-                f"[selection-ml-classifier] skip {archive_file['name']} / "
-                f"{ARCHIVE_SHEET_NAME}: {exc}",
-                file=sys.stderr,
+    return build_classification_training_records_from_sheet(
+        values,
+        source_group_prefix=archive_file.get("name", archive_file["id"]),
+    )
+
+
+def read_archive_records(
+    sheets: Any,
+    archive_files: list[dict[str, str]],
+    snapshot_store: ArchiveSnapshotStore | None = None,
+) -> list[ArticleRecord]:
+    """Read archive records, using local snapshots for unchanged files.
+
+    Unchanged files are loaded from disk in parallel. Changed or missing ones
+    are read from Sheets one by one (the API client is not thread-safe) and
+    their snapshots refreshed. Records keep the archive file order.
+    """
+    records_by_file: list[list[ArticleRecord] | None] = [None] * len(archive_files)
+    fresh_indexes: list[int] = []
+    if snapshot_store is not None:
+        fresh_indexes = [
+            index for index, archive_file in enumerate(archive_files)
+            if snapshot_store.is_fresh(archive_file)
+        ]
+        if fresh_indexes:
+            workers = env_int(
+                "SELECTION_ML_SNAPSHOT_READ_WORKERS",
+                ARCHIVE_SNAPSHOT_READ_WORKERS_DEFAULT,
+                min_value=1,
+                max_value=16,
             )
+            with ThreadPoolExecutor(max_workers=min(workers, len(fresh_indexes))) as executor:
+                loaded = executor.map(lambda index: snapshot_store.load(archive_files[index]), fresh_indexes)
+                for index, records in zip(fresh_indexes, loaded):
+                    records_by_file[index] = records
+
+    sheets_reads = 0
+    for index, archive_file in enumerate(archive_files):
+        if records_by_file[index] is not None:
+            continue
+        sheets_reads += 1
+        records = read_archive_file_records(sheets, archive_file)
+        if records is None:
             continue
+        records_by_file[index] = records
+        if snapshot_store is not None:
+            snapshot_store.save(archive_file, records)
 
-        rows.extend(
-            build_classification_training_records_from_sheet(
-                values,
-                source_group_prefix=archive_file.get("name", archive_file["id"]),
-            )
+    if snapshot_store is not None:
+        snapshot_store.prune(archive_files)
+        print(
+            f"[selection-ml-classifier] archive_snapshot_hits={len(archive_files) - sheets_reads} "
+            f"archive_sheets_reads={sheets_reads}"
         )
 
-    return rows, len(archive_files)
+    rows: list[ArticleRecord] = []
+    for records in records_by_file:
+        rows.extend(records or [])
+    return rows
 
 
 def extract_existing_output_values(
@@ -1072,6 +1220,175 @@ def generic_similarity_score(a: str, b: str) -> float:
     return overlap / denom
 
 
+@functools.lru_cache(maxsize=65536)
+def record_similarity_tokens(row: ArticleRecord) -> frozenset[str]:
+    """similarity_tokens of archive_candidate_text, computed once per record."""
+    return frozenset(similarity_tokens(archive_candidate_text(row)))
+
+
+def record_title_key(row: ArticleRecord) -> str:
+    return normalize_key_text(" ".join([row.headline_a, row.headline_final, row.headline_body]))
+
+
+class SimilarityCandidateIndex:
+    """Inverted n-gram index over a fixed list of records.
+
+    Each record's similarity_tokens signature is built once. For a query, the
+    n-gram overlap with every record sharing at least one n-gram is counted via
+    the postings lists (or one sparse matrix product, see overlap_matrix), so
+    generic_similarity_score (overlap / smaller set) can be evaluated without
+    rebuilding or intersecting sets per pair. Records that share no n-gram can
+    only match on URL / Q key / title equality, which are looked up from
+    exact-key maps. Results equal the all-pairs scan.
+    """
+
+    def __init__(self, rows: list[ArticleRecord]):
+        self.rows = rows
+        self.tokens = [record_similarity_tokens(row) for row in rows]
+        self.title_keys = [record_title_key(row) for row in rows]
+        self._postings: dict[str, list[int]] | None = None
+        self.by_url: dict[str, list[int]] = {}
+        self.by_duplicate_key: dict[str, list[int]] = {}
+        self.by_title_key: dict[str, list[int]] = {}
+        self._record_matrix: Any = None
+        self._vocabulary: dict[str, int] | None = None
+        for position, (row, title_key) in enumerate(zip(rows, self.title_keys)):
+            if row.url:
+                self.by_url.setdefault(row.url, []).append(position)
+            if row.duplicate_key:
+                self.by_duplicate_key.setdefault(row.duplicate_key, []).append(position)
+            if title_key:
+                self.by_title_key.setdefault(title_key, []).append(position)
+
+    @property
+    def postings(self) -> dict[str, list[int]]:
+        if self._postings is None:
+            self._postings = {}
+            for position, tokens in enumerate(self.tokens):
+                for token in tokens:
+                    self._postings.setdefault(token, []).append(position)
+        return self._postings
+
+    def exact_positions(self, row: ArticleRecord, title_key: str, match_duplicate_key: bool) -> list[int]:
+        positions = list(self.by_url.get(row.url, ())) if row.url else []
+        if match_duplicate_key and row.duplicate_key:
+            positions.extend(self.by_duplicate_key.get(row.duplicate_key, ()))
+        if title_key:
+            positions.extend(self.by_title_key.get(title_key, ()))
+        return positions
+
+    def overlap_candidates(
+        self,
+        row: ArticleRecord,
+        tokens: frozenset[str],
+        title_key: str,
+        match_duplicate_key: bool = False,
+    ) -> dict[int, int]:
+        """Return {position: n-gram overlap} for every record that can score > 0."""
+        overlaps: dict[int, int] = {}
+        for token in tokens:
+            for position in self.postings.get(token, ()):
+                overlaps[position] = overlaps.get(position, 0) + 1
+        for position in self.exact_positions(row, title_key, match_duplicate_key):
+            overlaps.setdefault(position, 0)
+        return overlaps
+
+    def batch_overlap_candidates(
+        self,
+        queries: list[tuple[ArticleRecord, frozenset[str], str]],
+        match_duplicate_key: bool = False,
+        top_k: int | None = None,
+    ) -> list[dict[int, int]]:
+        """overlap_candidates for many (row, tokens, title_key) queries at once.
+
+        With scipy available, all n-gram overlaps come from one sparse product
+        of binary query/record matrices. Text-only pairs below the similarity
+        threshold, or (with top_k) below each query's top_k-th text score, are
+        dropped; exact-key pairs always stay, since their bonus ranks them above
+        any text-only match. The callers' top-k output is therefore unchanged.
+        Without scipy this falls back to the postings lists.
+        """
+        matrix = self.overlap_matrix([tokens for _, tokens, _ in queries], top_k=top_k)
+        if matrix is None:
+            return [
+                self.overlap_candidates(row, tokens, title_key, match_duplicate_key)
+                for row, tokens, title_key in queries
+            ]
+
+        results: list[dict[int, int]] = []
+        for query_index, (row, tokens, title_key) in enumerate(queries):
+            start, end = matrix.indptr[query_index], matrix.indptr[query_index + 1]
+            overlaps = {
+                int(position): int(overlap)
+                for position, overlap in zip(matrix.indices[start:end], matrix.data[start:end])
+            }
+            for position in self.exact_positions(row, title_key, match_duplicate_key):
+                if position not in overlaps:
+                    overlaps[position] = len(self.tokens[position] & tokens)
+            results.append(overlaps)
+        return results
+
+    def overlap_matrix(self, query_tokens: list[frozenset[str]], top_k: int | None = None) -> Any:
+        """Sparse (queries x records) n-gram overlap counts of text matches, or None without scipy."""
+        try:
+            import numpy as np
+            from scipy import sparse
+        except ImportError:
+            return None
+
+        if self._vocabulary is None:
+            self._vocabulary = {}
+            for tokens in self.tokens:
+                for token in tokens:
+                    self._vocabulary.setdefault(token, len(self._vocabulary))
+        vocabulary = self._vocabulary
+
+        def binary_matrix(token_sets: list[frozenset[str]]) -> Any:
+            indptr = [0]
+            indices: list[int] = []
+            for tokens in token_sets:
+                indices.extend(vocabulary[token] for token in tokens if token in vocabulary)
+                indptr.append(len(indices))
+            data = np.ones(len(indices), dtype=np.int32)
+            return sparse.csr_matrix(
+                (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+                shape=(len(token_sets), len(vocabulary)),
+            )
+
+        if self._record_matrix is None:
+            self._record_matrix = binary_matrix(self.tokens).T.tocsr()
+        overlaps = (binary_matrix(query_tokens) @ self._record_matrix).tocsr()
+        overlaps.sort_indices()
+
+        # overlap / smaller set and its match_score share, computed like the scoring loop.
+        query_sizes = np.asarray([len(tokens) for tokens in query_tokens], dtype=np.int64)
+        record_sizes = np.asarray([len(tokens) for tokens in self.tokens], dtype=np.int64)
+        query_rows = np.repeat(np.arange(overlaps.shape[0]), np.diff(overlaps.indptr))
+        denominators = np.maximum(1, np.minimum(query_sizes[query_rows], record_sizes[overlaps.indices]))
+        similarities = overlaps.data / denominators
+        keep = similarities >= CONTEXT_TEXT_SIMILARITY_THRESHOLD
+        if top_k is not None:
+            text_scores = similarities * CONTEXT_TEXT_SIMILARITY_WEIGHT
+            for query_index in range(overlaps.shape[0]):
+                start, end = overlaps.indptr[query_index], overlaps.indptr[query_index + 1]
+                row_keep = keep[start:end]
+                if int(row_keep.sum()) <= top_k:
+                    continue
+                row_scores = text_scores[start:end]
+                cutoff = np.partition(row_scores[row_keep], -top_k)[-top_k]
+                # Ties at the cutoff stay so row_index tie-breaking is unaffected.
+                keep[start:end] = row_keep & (row_scores >= cutoff)
+        overlaps.data[~keep] = 0
+        overlaps.eliminate_zeros()
+        return overlaps
+
+    def similarity(self, tokens: frozenset[str], position: int, overlap: int) -> float:
+        other_tokens = self.tokens[position]
+        if not tokens or not other_tokens:
+            return 0.0
+        return overlap / max(1, min(len(tokens), len(other_tokens)))
+
+
 def should_check_adopted_archive_diff(row: ArticleRecord) -> bool:
     """Return True only for rows whose O column flag is 2.
 
@@ -1099,14 +1416,22 @@ def build_archive_adopted_context_map(
     if not adopted:
         return out
 
-    for current in current_rows:
-        if not should_check_adopted_archive_diff(current):
-            continue
+    targets = [current for current in current_rows if should_check_adopted_archive_diff(current)]
+    if not targets:
+        return out
+    index = SimilarityCandidateIndex(adopted)
+    queries = [(current, record_similarity_tokens(current), record_title_key(current)) for current in targets]
+    candidates = index.batch_overlap_candidates(
+        queries,
+        match_duplicate_key=True,
+        top_k=ARCHIVE_ADOPTED_CONTEXT_MAX_ITEMS,
+    )
 
-        current_title_key = normalize_key_text(" ".join([current.headline_a, current.headline_final, current.headline_body]))
-        current_text = archive_candidate_text(current)
+    for (current, current_tokens, current_title_key), overlaps in zip(queries, candidates):
         scored: list[tuple[float, ArticleRecord, str]] = []
-        for past in adopted:
+        # Positions in archive order so equal (score, row_index) ties keep the scan order.
+        for position in sorted(overlaps):
+            past = adopted[position]
             reasons: list[str] = []
             score = 0.0
             if current.url and past.url and current.url == past.url:
@@ -1116,14 +1441,14 @@ def build_archive_adopted_context_map(
                 score += 80.0
                 reasons.append("duplicate_key_exact")
 
-            past_title_key = normalize_key_text(" ".join([past.headline_a, past.headline_final, past.headline_body]))
+            past_title_key = index.title_keys[position]
             if current_title_key and past_title_key and current_title_key == past_title_key:
                 score += 60.0
                 reasons.append("title_exact")
 
-            sim = generic_similarity_score(current_text, archive_candidate_text(past))
-            if sim >= 0.18:
-                score += sim * 40.0
+            sim = index.similarity(current_tokens, position, overlaps[position])
+            if sim >= CONTEXT_TEXT_SIMILARITY_THRESHOLD:
+                score += sim * CONTEXT_TEXT_SIMILARITY_WEIGHT
                 reasons.append(f"text_similarity={sim:.2f}")
 
             if score > 0:
@@ -1169,36 +1494,51 @@ def build_same_day_context_map(
     if len(current_rows) < 2:
         return out
 
+    # Only rows of the same date can match, so index each date group separately.
+    rows_by_date: dict[str, list[ArticleRecord]] = {}
+    for row in current_rows:
+        rows_by_date.setdefault(row.date_key or "current", []).append(row)
+    index_by_date: dict[str, SimilarityCandidateIndex] = {}
+    candidates_by_row: dict[int, dict[int, int]] = {}
+    for date_key, rows in rows_by_date.items():
+        if len(rows) < 2:
+            continue
+        index = SimilarityCandidateIndex(rows)
+        index_by_date[date_key] = index
+        # The date group is both the query and the record side: one X @ X.T product.
+        # top_k + 1 because every row also matches itself.
+        queries = [(row, index.tokens[position], index.title_keys[position]) for position, row in enumerate(rows)]
+        overlaps_by_position = index.batch_overlap_candidates(queries, top_k=SAME_DAY_CONTEXT_MAX_ITEMS + 1)
+        for row, overlaps in zip(rows, overlaps_by_position):
+            candidates_by_row[row.row_index] = overlaps
+
     for current in current_rows:
-        current_date_key = current.date_key or "current"
-        current_title_key = normalize_key_text(
-            " ".join([current.headline_a, current.headline_final, current.headline_body])
-        )
-        current_text = archive_candidate_text(current)
+        index = index_by_date.get(current.date_key or "current")
+        if index is None:
+            continue
+        current_title_key = record_title_key(current)
+        current_tokens = record_similarity_tokens(current)
+        overlaps = candidates_by_row[current.row_index]
         scored: list[tuple[float, ArticleRecord, str]] = []
 
-        for other in current_rows:
+        for position in sorted(overlaps):
+            other = index.rows[position]
             if other.row_index == current.row_index:
                 continue
-            other_date_key = other.date_key or "current"
-            if current_date_key != other_date_key:
-                continue
 
             reasons: list[str] = []
             score = 0.0
             if current.url and other.url and current.url == other.url:
                 score += 100.0
                 reasons.append("url_exact")
-            other_title_key = normalize_key_text(
-                " ".join([other.headline_a, other.headline_final, other.headline_body])
-            )
+            other_title_key = index.title_keys[position]
             if current_title_key and other_title_key and current_title_key == other_title_key:
                 score += 60.0
                 reasons.append("title_exact")
 
-            sim = generic_similarity_score(current_text, archive_candidate_text(other))
-            if sim >= 0.18:
-                score += sim * 40.0
+            sim = index.similarity(current_tokens, position, overlaps[position])
+            if sim >= CONTEXT_TEXT_SIMILARITY_THRESHOLD:
+                score += sim * CONTEXT_TEXT_SIMILARITY_WEIGHT
                 reasons.append(f"text_similarity={sim:.2f}")
 
             if score > 0:
@@ -1599,13 +1939,131 @@ def should_fallback_to_gemini_model(exc: Exception) -> bool:
     return any(signal in text_value for signal in fallback_signals)
 
 
-def generate_gemini_content_once(
+class GeminiContextCache:
+    """Explicit Gemini context-cache handles for the static leading prompt (best effort).
+
+    The first element of ``contents`` (the system prompt) is registered once per
+    model with ``client.caches.create`` and later requests reference it through
+    ``cached_content``. When a cache cannot be created for a model, that model
+    falls back to sending the prompt inline for the rest of the run.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = GEMINI_CONTEXT_CACHE_TTL_SECONDS_DEFAULT,
+        min_chars: int = GEMINI_CONTEXT_CACHE_MIN_CHARS_DEFAULT,
+        clock: Any = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.min_chars = min_chars
+        self.clock = clock
+        self.handles: dict[tuple[str, str], tuple[str, float]] = {}
+        self.disabled_models: set[str] = set()
+        self.stats = {"created": 0, "reused": 0, "inline": 0, "cached_tokens": 0, "uncached_tokens": 0}
+        # Concurrent rerank batches share one cache; creation is serialized so a
+        # prompt gets a single handle per model.
+        self.lock = threading.RLock()
+
+    def handle_for(self, client: Any, types: Any, model_name: str, text: str) -> str | None:
+        with self.lock:
+            return self._handle_for(client, types, model_name, text)
+
+    def _handle_for(self, client: Any, types: Any, model_name: str, text: str) -> str | None:
+        if len(text) < self.min_chars or model_name in self.disabled_models:
+            self.stats["inline"] += 1
+            return None
+
+        key = (model_name, text)
+        now = self.clock()
+        cached = self.handles.get(key)
+        if cached and cached[1] - 60 > now:
+            self.stats["reused"] += 1
+            return cached[0]
+
+        try:
+            created = client.caches.create(
+                model=model_name,
+                config=types.CreateCachedContentConfig(
+                    contents=[text],
+                    ttl=f"{int(self.ttl_seconds)}s",
+                ),
+            )
+        except Exception as exc:
+            self.disabled_models.add(model_name)
+            self.stats["inline"] += 1
+            print(
+                f"[selection-ml-classifier] gemini_context_cache_unavailable "
+                f"model={model_name} error={str(exc)[:300]}",
+                file=sys.stderr,
+            )
+            return None
+
+        self.handles[key] = (created.name, now + self.ttl_seconds)
+        self.stats["created"] += 1
+        return created.name
+
+    def invalidate(self, name: str) -> None:
+        with self.lock:
+            for key, (handle, _expires_at) in list(self.handles.items()):
+                if handle == name:
+                    del self.handles[key]
+
+    def record_usage(self, response: Any) -> None:
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        prompt_tokens = safe_int(getattr(usage, "prompt_token_count", 0), 0)
+        cached_tokens = safe_int(getattr(usage, "cached_content_token_count", 0), 0)
+        with self.lock:
+            self.stats["cached_tokens"] += cached_tokens
+            self.stats["uncached_tokens"] += max(0, prompt_tokens - cached_tokens)
+
+
+class GeminiRateLimiter:
+    """Shared pacing for Gemini requests issued from concurrent rerank batches.
+
+    Request starts are spaced at least 60/rpm seconds apart across threads. A
+    429 reported through ``backoff`` pushes the next allowed start for every
+    thread, so parallel batches slow down together instead of all retrying into
+    the same exhausted quota.
+    """
+
+    def __init__(self, rpm: int, clock: Any = time.monotonic, sleep: Any = time.sleep) -> None:
+        self.min_interval = 60.0 / rpm if rpm > 0 else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self.next_start = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = self.clock()
+            start_at = max(now, self.next_start)
+            self.next_start = start_at + self.min_interval
+        if start_at > now:
+            self.sleep(start_at - now)
+
+    def backoff(self, seconds: float) -> None:
+        with self.lock:
+            self.next_start = max(self.next_start, self.clock() + seconds)
+
+
+def is_gemini_cached_content_error(exc: Exception) -> bool:
+    text_value = str(exc).lower()
+    return "cached" in text_value and any(
+        signal in text_value for signal in ("not found", "expired", "invalid", "permission")
+    )
+
+
+def generate_gemini_json_content(
     client: Any,
     types: Any,
     model_name: str,
     contents: list[str],
+    cached_content: str | None = None,
 ) -> Any:
-    """Call one Gemini model once, keeping schema support as a best-effort option."""
+    """Call generate_content in JSON mode, keeping schema support as a best-effort option."""
+    extra_config: dict[str, Any] = {"cached_content": cached_content} if cached_content else {}
     try:
         return client.models.generate_content(
             model=model_name,
@@ -1614,6 +2072,7 @@ def generate_gemini_content_once(
                 temperature=0,
                 response_mime_type="application/json",
                 response_schema=GEMINI_RERANK_RESPONSE_SCHEMA,
+                **extra_config,
             ),
         )
     except TypeError:
@@ -1624,10 +2083,39 @@ def generate_gemini_content_once(
             config=types.GenerateContentConfig(
                 temperature=0,
                 response_mime_type="application/json",
+                **extra_config,
             ),
         )
 
 
+def generate_gemini_content_once(
+    client: Any,
+    types: Any,
+    model_name: str,
+    contents: list[str],
+    context_cache: GeminiContextCache | None = None,
+) -> Any:
+    """Call one Gemini model once, sending contents[0] through a context cache when possible."""
+    if context_cache is not None and len(contents) > 1:
+        cached_content = context_cache.handle_for(client, types, model_name, contents[0])
+        if cached_content:
+            try:
+                response = generate_gemini_json_content(
+                    client, types, model_name, contents[1:], cached_content
+                )
+                context_cache.record_usage(response)
+                return response
+            except Exception as exc:
+                if not is_gemini_cached_content_error(exc):
+                    raise
+                context_cache.invalidate(cached_content)
+
+    response = generate_gemini_json_content(client, types, model_name, contents)
+    if context_cache is not None:
+        context_cache.record_usage(response)
+    return response
+
+
 def generate_gemini_content_with_model_fallback(
     client: Any,
     types: Any,
@@ -1635,10 +2123,17 @@ def generate_gemini_content_with_model_fallback(
     fallback_model_name: str,
     contents: list[str],
     fallback_wait_seconds: float,
+    context_cache: GeminiContextCache | None = None,
+    rate_limiter: GeminiRateLimiter | None = None,
 ) -> tuple[Any, str]:
     """Try the primary Gemini model, then fallback model for transient capacity errors."""
+    if rate_limiter is not None:
+        rate_limiter.wait()
     try:
-        return generate_gemini_content_once(client, types, primary_model_name, contents), primary_model_name
+        return (
+            generate_gemini_content_once(client, types, primary_model_name, contents, context_cache),
+            primary_model_name,
+        )
     except Exception as primary_exc:
         should_fallback = should_fallback_to_gemini_model(primary_exc)
         print(
@@ -1647,14 +2142,27 @@ def generate_gemini_content_with_model_fallback(
             f"fallback={should_fallback} error={str(primary_exc)[:300]}",
             file=sys.stderr,
         )
+        if rate_limiter is not None and gemini_error_code(primary_exc) == 429:
+            rate_limiter.backoff(
+                env_float(
+                    "GEMINI_RATE_LIMIT_BACKOFF_SECONDS",
+                    GEMINI_RATE_LIMIT_BACKOFF_SECONDS_DEFAULT,
+                    0.0,
+                    120.0,
+                )
+            )
         if not should_fallback or fallback_model_name == primary_model_name:
             raise
 
         if fallback_wait_seconds > 0:
             time.sleep(fallback_wait_seconds)
+        if rate_limiter is not None:
+            rate_limiter.wait()
 
         try:
-            response = generate_gemini_content_once(client, types, fallback_model_name, contents)
+            response = generate_gemini_content_once(
+                client, types, fallback_model_name, contents, context_cache
+            )
             print(
                 f"[selection-ml-classifier] gemini_fallback_succeeded "
                 f"model={fallback_model_name}",
@@ -1745,6 +2253,91 @@ def same_day_duplicate_group_key(
 
 
 
+def run_gemini_rerank_batch(
+    client: Any,
+    types: Any,
+    contents: list[str],
+    *,
+    start: int,
+    size: int,
+    model_name: str,
+    fallback_model_name: str,
+    retry_count: int,
+    sleep_seconds: float,
+    fallback_wait_seconds: float,
+    context_cache: GeminiContextCache | None = None,
+    rate_limiter: GeminiRateLimiter | None = None,
+) -> tuple[dict[int, dict[str, Any]], str | None]:
+    """Run one rerank batch with its own retries and model fallback.
+
+    Returns (results keyed by row_index, model that answered). A batch that
+    still fails after all retries returns ({}, None) so other batches proceed.
+    """
+    for attempt in range(retry_count + 1):
+        try:
+            response, used_model_name = generate_gemini_content_with_model_fallback(
+                client,
+                types,
+                model_name,
+                fallback_model_name,
+                contents,
+                fallback_wait_seconds,
+                context_cache,
+                rate_limiter,
+            )
+            parsed = parse_gemini_json_response(response.text)
+            results: dict[int, dict[str, Any]] = {}
+            for item in parsed.get("articles", []):
+                if not isinstance(item, dict):
+                    continue
+                row_index = safe_int(item.get("row_index"), -1)
+                if row_index > 0:
+                    results[row_index] = normalize_gemini_result(item)
+            return results, used_model_name
+        except Exception as exc:
+            if attempt < retry_count:
+                time.sleep(sleep_seconds)
+            else:
+                print(
+                    f"[selection-ml-classifier] gemini_rerank_batch_failed "
+                    f"start={start} size={size} error={exc}",
+                    file=sys.stderr,
+                )
+    return {}, None
+
+
+def run_gemini_rerank_batches(
+    client: Any,
+    types: Any,
+    batches: list[tuple[int, int, list[str]]],
+    concurrency: int,
+    **batch_options: Any,
+) -> tuple[dict[int, dict[str, Any]], dict[str, int]]:
+    """Run (start, size, contents) batches with up to ``concurrency`` in flight.
+
+    Results are merged in batch order, so the row_index-keyed output is the
+    same as the sequential loop regardless of completion order.
+    """
+    def run_one(batch: tuple[int, int, list[str]]) -> tuple[dict[int, dict[str, Any]], str | None]:
+        start, size, contents = batch
+        return run_gemini_rerank_batch(client, types, contents, start=start, size=size, **batch_options)
+
+    workers = max(1, min(concurrency, len(batches)))
+    if workers == 1:
+        outcomes = [run_one(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(run_one, batches))
+
+    results: dict[int, dict[str, Any]] = {}
+    model_usage_counts: dict[str, int] = {}
+    for (_start, size, _contents), (batch_results, used_model_name) in zip(batches, outcomes):
+        results.update(batch_results)
+        if used_model_name:
+            model_usage_counts[used_model_name] = model_usage_counts.get(used_model_name, 0) + size
+    return results, model_usage_counts
+
+
 def run_gemini_rerank(
     rows: list[ArticleRecord],
     prediction_details: list[dict[str, Any]],
@@ -1786,11 +2379,23 @@ def run_gemini_rerank(
     from google.genai import types
 
     client = genai.Client(api_key=api_key)
-    results: dict[int, dict[str, Any]] = {}
-    model_usage_counts: dict[str, int] = {}
+    context_cache = (
+        GeminiContextCache(
+            ttl_seconds=env_int(
+                "GEMINI_CONTEXT_CACHE_TTL_SECONDS", GEMINI_CONTEXT_CACHE_TTL_SECONDS_DEFAULT, 60, 86400
+            )
+        )
+        if env_bool("GEMINI_CONTEXT_CACHE", True)
+        else None
+    )
+    concurrency = env_int("GEMINI_RERANK_CONCURRENCY", GEMINI_DEFAULT_RERANK_CONCURRENCY, 1, 8)
+    rate_limiter = GeminiRateLimiter(
+        env_int("GEMINI_RERANK_RPM", GEMINI_DEFAULT_RERANK_RPM, 0, 1000)
+    )
     archive_context_map = build_archive_adopted_context_map(rows, archive_records or [])
     same_day_context_map = build_same_day_context_map(same_day_context_rows or rows)
 
+    batches: list[tuple[int, int, list[str]]] = []
     for start in range(0, len(candidates), batch_size):
         batch = candidates[start : start + batch_size]
         payloads = [
@@ -1803,48 +2408,31 @@ def run_gemini_rerank(
             for row, detail in batch
         ]
         prompt = build_gemini_rerank_prompt(payloads)
-        contents = [gemini_system_prompt(), prompt]
-
-        last_error: Exception | None = None
-        for attempt in range(retry_count + 1):
-            try:
-                response, used_model_name = generate_gemini_content_with_model_fallback(
-                    client,
-                    types,
-                    model_name,
-                    fallback_model_name,
-                    contents,
-                    fallback_wait_seconds,
-                )
-                model_usage_counts[used_model_name] = model_usage_counts.get(used_model_name, 0) + len(batch)
-                parsed = parse_gemini_json_response(response.text)
-                for item in parsed.get("articles", []):
-                    if not isinstance(item, dict):
-                        continue
-                    row_index = safe_int(item.get("row_index"), -1)
-                    if row_index > 0:
-                        results[row_index] = normalize_gemini_result(item)
-                break
-            except Exception as exc:
-                last_error = exc
-                if attempt < retry_count:
-                    time.sleep(sleep_seconds)
-                else:
-                    print(
-                        f"[selection-ml-classifier] gemini_rerank_batch_failed "
-                        f"start={start} size={len(batch)} error={exc}",
-                        file=sys.stderr,
-                    )
-        if last_error is None:
-            pass
+        batches.append((start, len(batch), [gemini_system_prompt(), prompt]))
+
+    results, model_usage_counts = run_gemini_rerank_batches(
+        client,
+        types,
+        batches,
+        concurrency,
+        model_name=model_name,
+        fallback_model_name=fallback_model_name,
+        retry_count=retry_count,
+        sleep_seconds=sleep_seconds,
+        fallback_wait_seconds=fallback_wait_seconds,
+        context_cache=context_cache,
+        rate_limiter=rate_limiter,
+    )
 
     print(
         f"[selection-ml-classifier] gemini_rerank=done model={model_name} "
         f"fallback_model={fallback_model_name} candidates={len(candidates)} "
+        f"batches={len(batches)} concurrency={concurrency} "
         f"results={len(results)} same_day_context_rows={len(same_day_context_map)} "
         f"archive_context_rows={len(archive_context_map)} "
         f"archive_context_target_rows_o_eq_2={sum(1 for row in rows if should_check_adopted_archive_diff(row))} "
-        f"model_usage={json.dumps(model_usage_counts, ensure_ascii=False)}"
+        f"model_usage={json.dumps(model_usage_counts, ensure_ascii=False)} "
+        f"context_cache={json.dumps(context_cache.stats if context_cache else {}, ensure_ascii=False)}"
     )
     return results
 
@@ -2022,6 +2610,144 @@ def train_model(rows: list[ArticleRecord]) -> ConstantClassificationModel | Skle
     return SklearnClassificationModel(feature_pipeline, classifier, info)
 
 
+# ---------------------------------------------------------------------------
+# Persisted model artifacts keyed by archive modifiedTime
+# ---------------------------------------------------------------------------
+
+
+def sklearn_version() -> str:
+    try:
+        import sklearn
+    except ImportError:
+        return ""
+    return str(sklearn.__version__)
+
+
+def archive_fingerprint(archive_files: list[dict[str, str]]) -> str:
+    """Stable key for the archive state a model was trained on.
+
+    Any added, removed, renamed or edited archive file (Drive modifiedTime)
+    changes the key, as do MODEL_VERSION and the scikit-learn version.
+    """
+    parts = [MODEL_VERSION, sklearn_version()]
+    for archive_file in sorted(archive_files, key=lambda item: item.get("id", "")):
+        parts.append(
+            "|".join(
+                [
+                    archive_file.get("id", ""),
+                    archive_file.get("name", ""),
+                    archive_file.get("modifiedTime", ""),
+                ]
+            )
+        )
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+class ModelArtifactStore:
+    """Pickle store for trained models and the archive records they came from.
+
+    The archive records are stored with the model because the Gemini rerank
+    also needs them as adopted-archive context; a hit therefore skips both the
+    archive reads and the refit.
+    """
+
+    def __init__(self, directory: str, keep: int = MODEL_STORE_KEEP_DEFAULT):
+        self.directory = directory
+        self.keep = max(1, keep)
+
+    def path_for(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"model-{fingerprint}.pkl")
+
+    def load(
+        self,
+        fingerprint: str,
+    ) -> tuple[ConstantClassificationModel | SklearnClassificationModel, list[ArticleRecord]] | None:
+        path = self.path_for(fingerprint)
+        try:
+            with open(path, "rb") as handle:
+                artifact = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # corrupt or incompatible pickle: retrain
+            print(f"[selection-ml-classifier] model_store_load_failed path={path} error={exc}", file=sys.stderr)
+            return None
+        if artifact.get("fingerprint") != fingerprint:
+            return None
+        return artifact["model"], artifact["archive_records"]
+
+    def save(
+        self,
+        fingerprint: str,
+        model: ConstantClassificationModel | SklearnClassificationModel,
+        archive_records: list[ArticleRecord],
+    ) -> None:
+        path = self.path_for(fingerprint)
+        artifact = {
+            "fingerprint": fingerprint,
+            "model_version": MODEL_VERSION,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "model": model,
+            "archive_records": archive_records,
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as handle:
+                pickle.dump(artifact, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"[selection-ml-classifier] model_store_save_failed path={path} error={exc}", file=sys.stderr)
+            return
+        self.prune()
+
+    def prune(self) -> None:
+        try:
+            names = [
+                name for name in os.listdir(self.directory)
+                if name.startswith("model-") and name.endswith(".pkl")
+            ]
+        except OSError:
+            return
+        paths = sorted(
+            (os.path.join(self.directory, name) for name in names),
+            key=os.path.getmtime,
+            reverse=True,
+        )
+        for stale in paths[self.keep:]:
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+
+
+def load_or_train_model(
+    sheets: Any,
+    archive_files: list[dict[str, str]],
+    store: ModelArtifactStore | None,
+    snapshot_store: ArchiveSnapshotStore | None = None,
+) -> tuple[ConstantClassificationModel | SklearnClassificationModel, list[ArticleRecord], bool]:
+    """Return (model, archive_records, reused).
+
+    When the archive fingerprint matches a stored artifact the fitted model and
+    its archive records are reused as-is; otherwise archives are read and the
+    model is retrained and stored.
+    """
+    fingerprint = archive_fingerprint(archive_files)
+    if store is not None:
+        cached = store.load(fingerprint)
+        if cached is not None:
+            model, archive_records = cached
+            print(f"[selection-ml-classifier] model_store=hit fingerprint={fingerprint}")
+            return model, archive_records, True
+        print(f"[selection-ml-classifier] model_store=miss fingerprint={fingerprint}")
+
+    archive_records = read_archive_records(sheets, archive_files, snapshot_store)
+    model = train_model(archive_records)
+    if store is not None:
+        store.save(fingerprint, model, archive_records)
+    return model, archive_records, False
+
+
 def normalize_probability_scores(probabilities: list[float]) -> list[int]:
     """Convert classifier probabilities to 0-100 scores."""
     scores: list[int] = []
@@ -2447,10 +3173,28 @@ def run() -> None:
         )
         return
 
-    archive_records, archive_file_count = load_archive_records(
-        drive,
+    archive_files = list_archive_spreadsheets(drive, archive_folder_id)
+    archive_file_count = len(archive_files)
+    model_store = (
+        ModelArtifactStore(
+            os.environ.get("SELECTION_ML_MODEL_DIR", "").strip() or MODEL_STORE_DIR_DEFAULT,
+            keep=env_int("SELECTION_ML_MODEL_KEEP", MODEL_STORE_KEEP_DEFAULT, min_value=1),
+        )
+        if env_bool("SELECTION_ML_MODEL_STORE", True)
+        else None
+    )
+    snapshot_store = (
+        ArchiveSnapshotStore(
+            os.environ.get("SELECTION_ML_SNAPSHOT_DIR", "").strip() or ARCHIVE_SNAPSHOT_DIR_DEFAULT
+        )
+        if env_bool("SELECTION_ML_ARCHIVE_SNAPSHOT", True)
+        else None
+    )
+    model, archive_records, model_reused = load_or_train_model(
         sheets,
-        archive_folder_id,
+        archive_files,
+        model_store,
+        snapshot_store,
     )
     local_adopted_archive_records = load_local_adopted_archive_records(
         sheets,
@@ -2466,11 +3210,10 @@ def run() -> None:
         f"local_adopted_archive_rows={len(local_adopted_archive_records)} "
         f"pending_rows={len(pending_rows)} "
         "rules=off priority_topics=off media_feature=off prev_day=off recency_weight=off gemini=max_score "
-        "model=logistic_regression_classifier manual_order_weight=on"
+        "model=logistic_regression_classifier manual_order_weight=on "
+        f"model_reused={str(model_reused).lower()}"
     )
 
-    model = train_model(archive_records)
-
     prediction_details = model.prediction_details(pending_rows)
     gemini_results = run_gemini_rerank(
         pending_rows,
@@ -1,14 +1,82 @@
+import importlib.util
+import json
+import os
+import tempfile
 import unittest
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest import mock
 
 from selection_ml.run_selection_ml import (
-    CurrentRow,
+    ArchiveSnapshotStore,
+    ArticleRecord,
+    ConstantClassificationModel,
+    GeminiContextCache,
+    GeminiRateLimiter,
+    ModelArtifactStore,
+    SimilarityCandidateIndex,
+    archive_fingerprint,
+    build_archive_adopted_context_map,
     build_output_values,
+    build_same_day_context_map,
+    generate_gemini_content_once,
+    generic_similarity_score,
     is_archive_spreadsheet,
-    model_text,
+    load_or_train_model,
+    make_article_record,
     parse_target_sheet,
+    read_archive_records,
+    run_gemini_rerank_batches,
 )
 
 
+class FakeGeminiTypes:
+    GenerateContentConfig = staticmethod(lambda **kwargs: kwargs)
+    CreateCachedContentConfig = staticmethod(lambda **kwargs: kwargs)
+
+
+class FakeGeminiClient:
+    def __init__(self, cache_error: Exception | None = None, respond=None):
+        self.cache_error = cache_error
+        self.respond = respond
+        self.created: list[dict] = []
+        self.calls: list[dict] = []
+        self.caches = SimpleNamespace(create=self._create_cache)
+        self.models = SimpleNamespace(generate_content=self._generate_content)
+
+    def _create_cache(self, **kwargs):
+        if self.cache_error:
+            raise self.cache_error
+        self.created.append(kwargs)
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+    def _generate_content(self, **kwargs):
+        self.calls.append(kwargs)
+        cached = 80 if kwargs["config"].get("cached_content") else 0
+        usage = SimpleNamespace(prompt_token_count=100, cached_content_token_count=cached)
+        text = self.respond(kwargs["contents"][-1]) if self.respond else "{}"
+        return SimpleNamespace(text=text, usage_metadata=usage)
+
+
+def make_record(row_index: int, headline: str, **kwargs) -> ArticleRecord:
+    values = dict(
+        row_index=row_index,
+        date_key="2026-05-01",
+        group_key="2026-05-01",
+        media="",
+        headline_a=headline,
+        headline_final=headline,
+        headline_body="",
+        summary="",
+        url="",
+        same_topic_flag="",
+        same_topic_note="",
+        duplicate_key="",
+    )
+    values.update(kwargs)
+    return ArticleRecord(**values)
+
+
 class SelectionMlTest(unittest.TestCase):
     def test_model_text_uses_efgi(self):
         row = [""] * 9
@@ -16,7 +84,7 @@ class SelectionMlTest(unittest.TestCase):
         row[5] = "F"
         row[6] = "G"
         row[8] = "I"
-        self.assertEqual(model_text(row), "E\nF\nG\nI")
+        self.assertEqual(make_article_record(row, 2, None).full_text, "E\nF\nG\nI")
 
     def test_parse_target_sheet_accepts_prod_and_dev(self):
         self.assertEqual(parse_target_sheet("prod"), "prod")
@@ -34,11 +102,193 @@ class SelectionMlTest(unittest.TestCase):
         self.assertFalse(is_archive_spreadsheet({"name": "archive_prod_2026-05"}))
 
     def test_output_keeps_blank_rows_aligned(self):
-        rows = [CurrentRow(row_index=3, text="article")]
-        values = build_output_values(rows, 3, [0.74], 10, 100)
-        self.assertEqual(values[0], ["", "", ""])
+        rows = [make_record(3, "article")]
+        values = build_output_values(rows, 3, [{"score": 74}], {})
+        blank = [""] * len(values[1])
+        self.assertEqual(values[0], blank)
         self.assertEqual(values[1][0], 74)
-        self.assertEqual(values[2], ["", "", ""])
+        self.assertEqual(values[2], blank)
+
+    def test_gemini_context_cache_reuses_handle_for_system_prompt(self):
+        client = FakeGeminiClient()
+        cache = GeminiContextCache(min_chars=10)
+        system_prompt = "rules " * 10
+        for prompt in ("batch-1", "batch-2"):
+            generate_gemini_content_once(client, FakeGeminiTypes, "m", [system_prompt, prompt], cache)
+
+        self.assertEqual(len(client.created), 1)
+        self.assertEqual([call["contents"] for call in client.calls], [["batch-1"], ["batch-2"]])
+        self.assertEqual(client.calls[1]["config"]["cached_content"], "cachedContents/1")
+        self.assertEqual(cache.stats["cached_tokens"], 160)
+        self.assertEqual(cache.stats["uncached_tokens"], 40)
+
+    def test_gemini_context_cache_falls_back_to_inline_prompt(self):
+        client = FakeGeminiClient(cache_error=RuntimeError("caching not supported"))
+        cache = GeminiContextCache(min_chars=10)
+        system_prompt = "rules " * 10
+        for prompt in ("batch-1", "batch-2"):
+            generate_gemini_content_once(client, FakeGeminiTypes, "m", [system_prompt, prompt], cache)
+
+        self.assertEqual(cache.disabled_models, {"m"})
+        self.assertEqual(client.calls[1]["contents"], [system_prompt, "batch-2"])
+        self.assertNotIn("cached_content", client.calls[1]["config"])
+        self.assertEqual(cache.stats["uncached_tokens"], 200)
+
+    def test_archive_fingerprint_tracks_modified_time(self):
+        files = [
+            {"id": "b", "name": "prod_2026-05", "modifiedTime": "2026-05-31T00:00:00Z"},
+            {"id": "a", "name": "prod_2026-04", "modifiedTime": "2026-04-30T00:00:00Z"},
+        ]
+        self.assertEqual(archive_fingerprint(files), archive_fingerprint(list(reversed(files))))
+        edited = [dict(files[0], modifiedTime="2026-06-01T00:00:00Z"), files[1]]
+        self.assertNotEqual(archive_fingerprint(files), archive_fingerprint(edited))
+
+    def test_model_store_hit_skips_archive_reads(self):
+        files = [{"id": "a", "name": "prod_2026-04", "modifiedTime": "2026-04-30T00:00:00Z"}]
+        with tempfile.TemporaryDirectory() as directory:
+            store = ModelArtifactStore(directory)
+            store.save(archive_fingerprint(files), ConstantClassificationModel(0.25, {"rows": 4}), [])
+
+            model, archive_records, reused = load_or_train_model(None, files, store)
+
+        self.assertTrue(reused)
+        self.assertEqual(archive_records, [])
+        self.assertEqual(model.probability, 0.25)
+        self.assertEqual(model.info, {"rows": 4})
+
+    def test_model_store_prunes_old_artifacts(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ModelArtifactStore(directory, keep=1)
+            store.save("old", ConstantClassificationModel(0.1, {}), [])
+            os.utime(store.path_for("old"), (0, 0))
+            store.save("new", ConstantClassificationModel(0.2, {}), [])
+
+            self.assertIsNone(store.load("old"))
+            self.assertEqual(store.load("new")[0].probability, 0.2)
+
+    def test_archive_snapshot_is_used_until_modified_time_changes(self):
+        archive_file = {"id": "sheet/1", "name": "prod_2026-05", "modifiedTime": "2026-05-31T00:00:00Z"}
+        records = [make_record(2, "見出し", label=1, manual_rank=1), make_record(3, "別の記事", label=0)]
+        with tempfile.TemporaryDirectory() as directory:
+            store = ArchiveSnapshotStore(directory)
+            store.save(archive_file, records)
+
+            self.assertTrue(store.is_fresh(archive_file))
+            self.assertEqual(store.load(archive_file), records)
+            edited = dict(archive_file, modifiedTime="2026-06-01T00:00:00Z")
+            self.assertFalse(store.is_fresh(edited))
+            self.assertIsNone(store.load(edited))
+
+    def test_read_archive_records_uses_fresh_snapshots_in_file_order(self):
+        files = [
+            {"id": f"f{index}", "name": f"prod_2026-0{index}", "modifiedTime": f"t{index}"}
+            for index in range(1, 4)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            store = ArchiveSnapshotStore(directory)
+            for index, archive_file in enumerate(files, start=1):
+                store.save(archive_file, [make_record(index, f"記事{index}")])
+            store.save({"id": "gone", "modifiedTime": "t"}, [])
+
+            # sheets=None: any Sheets read would fail.
+            rows = read_archive_records(None, files, store)
+
+            self.assertEqual([row.headline_a for row in rows], ["記事1", "記事2", "記事3"])
+            self.assertFalse(os.path.exists(store.path_for({"id": "gone"})))
+
+    def test_same_day_context_matches_text_similarity_and_exact_url(self):
+        rows = [
+            make_record(2, "ヤンゴンで停電が深刻化", summary="工業団地の操業に影響", url="u1"),
+            make_record(3, "ヤンゴン停電が深刻化、工業団地", summary="操業に影響が出ている"),
+            make_record(4, "全く別の話題", summary="関係のない内容", url="u1"),
+            make_record(5, "ヤンゴンで停電が深刻化", summary="工業団地の操業に影響", date_key="2026-05-02"),
+        ]
+
+        context = build_same_day_context_map(rows)
+
+        self.assertEqual([item["row_index"] for item in context[2]], [4, 3])
+        self.assertEqual(context[2][0]["match_reason"], "url_exact")
+        expected = generic_similarity_score(
+            "\n".join(["ヤンゴンで停電が深刻化"] * 2 + ["", "工業団地の操業に影響", ""]),
+            "\n".join(["ヤンゴン停電が深刻化、工業団地"] * 2 + ["", "操業に影響が出ている", ""]),
+        )
+        self.assertEqual(context[2][1]["match_reason"], f"text_similarity={expected:.2f}")
+        self.assertNotIn(5, context)
+
+    def test_archive_context_finds_duplicate_key_without_shared_ngrams(self):
+        current = [
+            make_record(2, "新しい見出し", duplicate_key="q-1", same_topic_flag=2.0),
+            make_record(3, "新しい見出し", duplicate_key="q-1", same_topic_flag="0"),
+        ]
+        archive = [
+            make_record(10, "あいうえお", duplicate_key="q-1", label=1),
+            make_record(11, "あいうえお", duplicate_key="q-1", label=0),
+        ]
+
+        context = build_archive_adopted_context_map(current, archive)
+
+        self.assertEqual(list(context), [2])
+        self.assertEqual([item["archive_row_index"] for item in context[2]], [10])
+        self.assertEqual(context[2][0]["match_reason"], "duplicate_key_exact")
+
+    @unittest.skipUnless(importlib.util.find_spec("scipy"), "scipy is not installed")
+    def test_sparse_overlap_path_matches_postings_path(self):
+        headlines = ["ヤンゴンで停電", "ヤンゴン停電続く", "中銀が為替据え置き", "中銀、為替を据え置き", "国境貿易が再開"]
+        rows = [
+            make_record(index, headline, summary=headline * 2, url="u" if index in (2, 6) else "")
+            for index, headline in enumerate(headlines * 2, start=2)
+        ]
+        archive = [replace(row, label=1) for row in rows]
+        current = [replace(row, same_topic_flag="2") for row in rows[:5]]
+
+        sparse_result = (build_same_day_context_map(rows), build_archive_adopted_context_map(current, archive))
+        with mock.patch.object(SimilarityCandidateIndex, "overlap_matrix", return_value=None):
+            postings_result = (build_same_day_context_map(rows), build_archive_adopted_context_map(current, archive))
+
+        self.assertEqual(sparse_result, postings_result)
+        self.assertTrue(sparse_result[0] and sparse_result[1])
+
+    def test_rerank_batches_merge_by_row_index_and_isolate_failures(self):
+        def respond(prompt):
+            if prompt == "fail":
+                raise RuntimeError("bad request")
+            rows = [int(value) for value in prompt.split(",")]
+            return json.dumps({"articles": [{"row_index": row, "score": row} for row in rows]})
+
+        client = FakeGeminiClient(respond=respond)
+        batches = [(0, 2, ["system", "2,3"]), (2, 1, ["system", "fail"]), (3, 2, ["system", "5,6"])]
+
+        results, usage = run_gemini_rerank_batches(
+            client,
+            FakeGeminiTypes,
+            batches,
+            3,
+            model_name="m",
+            fallback_model_name="m",
+            retry_count=0,
+            sleep_seconds=0,
+            fallback_wait_seconds=0,
+        )
+
+        self.assertEqual(sorted(results), [2, 3, 5, 6])
+        self.assertEqual(usage, {"m": 4})
+        self.assertEqual(len(client.calls), 3)
+
+    def test_rate_limiter_spaces_requests_and_backs_off(self):
+        now = [100.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        limiter = GeminiRateLimiter(30, clock=lambda: now[0], sleep=sleep)
+        limiter.wait()
+        limiter.wait()
+        limiter.backoff(10)
+        limiter.wait()
+
+        self.assertEqual(sleeps, [2.0, 10.0])
 
 
 if __name__ == "__main__":
@@ -313,6 +313,139 @@ def _upsert_body_cache_entry(
     cache[idx] = entry
     return cache
 
+def _bodies_log_path(out_dir: str) -> str:
+    return os.path.join(out_dir, "bodies.jsonl")
+
+class _BodyStore:
+    """
+    本文キャッシュのインデックス付きストア（out_dir ごとに1つ）。
+    - 起動時に bodies.json（スナップショット）+ bodies.jsonl（追記ログ）を1回だけ読む
+    - item_id / 正規化URL の辞書で O(1) 検索
+    - 書き込みは bodies.jsonl への1行追記のみ（全体の再書き込みはしない）
+    - export() で従来どおりの bodies.json 配列を書き出し、追記ログを畳む
+    """
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self.entries: list[dict] = []
+        self._by_item: dict[str, int] = {}
+        self._by_url: dict[str, int] = {}        # get 用（_find_body_cache_entry と同じく最後の行）
+        self._by_url_first: dict[str, int] = {}  # upsert 用（_upsert_body_cache_entry と同じく最初の行）
+        self._appended = 0
+        for entry in _load_bodies_cache(out_dir):
+            self._apply(entry)
+        p = _bodies_log_path(out_dir)
+        if os.path.exists(p):
+            try:
+                with open(p, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                        except Exception:
+                            continue  # 途中で落ちた書きかけ行は捨てる
+                        if isinstance(entry, dict):
+                            self._apply(entry)
+                            self._appended += 1
+            except Exception as e:
+                logging.warning(f"[bodies] failed to replay {p}: {e}")
+
+    @staticmethod
+    def _keys(item_id: str = "", url: str = "") -> tuple[str, str]:
+        return (item_id or "").strip(), (url or "").strip().rstrip("/")
+
+    def _index_of(self, key_item: str, key_url: str) -> int | None:
+        # _upsert_body_cache_entry と同じく item_id 優先、無ければ URL 単位（最初に一致した行）
+        if key_item:
+            return self._by_item.get(key_item)
+        if key_url:
+            return self._by_url_first.get(key_url)
+        return None
+
+    def _apply(self, entry: dict) -> dict:
+        key_item, key_url = self._keys(entry.get("item_id"), entry.get("url"))
+        idx = self._index_of(key_item, key_url)
+        if idx is None:
+            self.entries.append(dict(entry))
+            idx = len(self.entries) - 1
+        else:
+            self.entries[idx] = dict(entry)
+        if key_item:
+            self._by_item.setdefault(key_item, idx)
+        if key_url:
+            self._by_url[key_url] = idx  # 検索は同一URLの複数行のうち最後の行を優先
+            self._by_url_first.setdefault(key_url, idx)
+        return self.entries[idx]
+
+    def get(self, *, url: str = "", item_id: str = "") -> dict | None:
+        """_find_body_cache_entry 相当（item_id 優先、無ければ URL）。"""
+        key_item, key_url = self._keys(item_id, url)
+        idx = self._by_item.get(key_item) if key_item else None
+        if idx is None and key_url:
+            idx = self._by_url.get(key_url)
+        return self.entries[idx] if idx is not None else None
+
+    def upsert(
+        self,
+        *,
+        url: str = "",
+        item_id: str = "",
+        source: str = "",
+        title: str = "",
+        body: str = "",
+        body_ja: str = "",
+    ) -> dict:
+        """_upsert_body_cache_entry 相当。マージ後の1件を bodies.jsonl に追記する。"""
+        key_item, key_url = self._keys(item_id, url)
+        idx = self._index_of(key_item, key_url)
+        entry = dict(self.entries[idx]) if idx is not None else {}
+        if key_item:
+            entry["item_id"] = key_item
+        if key_url:
+            entry["url"] = key_url
+        if source:
+            entry["source"] = source
+        if title:
+            entry["title"] = title
+        if body:
+            entry["body"] = body
+        if body_ja:
+            entry["body_ja"] = body_ja
+        entry = self._apply(entry)
+
+        os.makedirs(self.out_dir, exist_ok=True)
+        with open(_bodies_log_path(self.out_dir), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._appended += 1
+        return entry
+
+    def export(self) -> None:
+        """bodies.json（item_id ベースの配列）を1回で書き出し、追記ログを空にする。"""
+        if not self.entries and not self._appended:
+            return
+        _save_bodies_cache(self.out_dir, self.entries)
+        p = _bodies_log_path(self.out_dir)
+        if os.path.exists(p):
+            try:
+                os.remove(p)
+            except Exception as e:
+                logging.warning(f"[bodies] failed to remove {p}: {e}")
+        logging.info(f"[bodies] exported {len(self.entries)} entries (appended={self._appended})")
+        self._appended = 0
+
+_BODY_STORES: dict[str, _BodyStore] = {}
+
+def _body_store(out_dir: str) -> _BodyStore:
+    """out_dir ごとの _BodyStore をプロセス内で使い回す（呼び出し側で _BODIES_LOCK を持つこと）。"""
+    key = os.path.abspath(out_dir)
+    store = _BODY_STORES.get(key)
+    if store is None:
+        store = _BodyStore(out_dir)
+        _BODY_STORES[key] = store
+    return store
+
 import requests
 from bs4 import BeautifulSoup
 try:
@@ -338,10 +471,33 @@ except Exception:
     build_combined_pdf_for_business = None
     _jp_date = None
 
+try:
+    # 共有 HTTP エンジン（接続プール / HTTP/2）。無ければ素の requests で動かす
+    from fetch_articles import http_get, shared_http_session
+except Exception:
+    http_get = None
+    shared_http_session = None
+
+try:
+    # Bright Data の実行単位の利用状況（回数 / 所要 / 概算コスト）
+    from fetch_articles import brightdata_unlocker_stats, brightdata_browser_stats
+except Exception:
+    brightdata_unlocker_stats = None
+    brightdata_browser_stats = None
+
+def _http_get_ok(url: str, timeout: int = 25):
+    """共有エンジン経由で GET し、4xx/5xx は requests.HTTPError にする。"""
+    if http_get is None:
+        r = requests.get(url, timeout=timeout, headers={"User-Agent":"Mozilla/5.0"})
+        r.raise_for_status()
+        return r
+    r = http_get(url, timeout=timeout, headers={"User-Agent":"Mozilla/5.0"})
+    if r.status_code >= 400:
+        raise requests.HTTPError(f"{r.status_code} Error for url: {url}")
+    return r
+
 def _simple_fetch(url: str) -> str:
-    r = requests.get(url, timeout=25, headers={"User-Agent":"Mozilla/5.0"})
-    r.raise_for_status()
-    return r.text
+    return _http_get_ok(url, timeout=25).text
 
 def _resolve_news_google_redirect_global(u: str, timeout: int = 20) -> str:
     """
@@ -445,9 +601,7 @@ def _fetch_once_dvb(url: str, session: Optional[requests.Session] = None) -> byt
         return t.encode("utf-8", "ignore")
     except Exception:
         try:
-            rr = requests.get(url, timeout=25, headers={"User-Agent":"Mozilla/5.0"})
-            rr.raise_for_status()
-            return rr.content
+            return _http_get_ok(url, timeout=25).content
         except Exception:
             return b""
 
@@ -471,7 +625,7 @@ def _extract_body_dvb_first_then_scoped(url: str, soup: "BeautifulSoup") -> str:
 
 def _get_body_once(url: str, source: str, out_dir: str, title: str = "", summary: str = "") -> str:
     """
-    1) bundle/bodies.json を見てあれば返す
+    1) 本文ストア（bundle/bodies.json + bodies.jsonl）を見てあれば返す
     2) なければ取得→保存→返す
     - Irrawaddy は本文抽出失敗時に r.jina.ai → AMP (/amp, ?output=amp) の順でフォールバック
     - Google News (news.google.com/rss/articles/...) は最終到達URLを解決してから試行
@@ -494,8 +648,8 @@ def _get_body_once(url: str, source: str, out_dir: str, title: str = "", summary
         return ""
 
     # --- 1) キャッシュ命中なら即返す ---
-    cache = _load_bodies_cache(out_dir)
-    cached = _find_body_cache_entry(cache, url=url)
+    with _BODIES_LOCK:
+        cached = _body_store(out_dir).get(url=url)
     if cached and isinstance(cached, dict) and (cached.get("body") or "").strip():
         return cached["body"]
 
@@ -542,7 +696,8 @@ def _get_body_once(url: str, source: str, out_dir: str, title: str = "", summary
 
             elif "dvb" in url_l or "burmese.dvb.no" in url_l or "dvb" in src_l:
                 # ★ DVB: 専用フェッチャ + DVB向け抽出（失敗時は強化抽出器にフォールバック）
-                html_fetcher = lambda u: _fetch_once_dvb(u, session=requests.Session())
+                dvb_session = shared_http_session() if shared_http_session else requests.Session()
+                html_fetcher = lambda u: _fetch_once_dvb(u, session=dvb_session)
                 extractor    = lambda soup, _u=url: _extract_body_dvb_first_then_scoped(_u, soup)
 
             else:
@@ -600,17 +755,15 @@ def _get_body_once(url: str, source: str, out_dir: str, title: str = "", summary
     # --- 4) 空本文はキャッシュしない（将来の再取得の余地を残す）---
     if body.strip():
         with _BODIES_LOCK:
-            cache = _load_bodies_cache(out_dir)  # 競合対策で再読込
-            existing = _find_body_cache_entry(cache, url=url) or {}
-            cache = _upsert_body_cache_entry(
-                cache,
+            store = _body_store(out_dir)
+            existing = store.get(url=url) or {}
+            store.upsert(
                 url=url,
                 source=source,
                 title=title,
                 body=body,
                 body_ja=(existing.get("body_ja") or ""),
             )
-            _save_bodies_cache(out_dir, cache)
 
     return body
 
@@ -1071,6 +1224,50 @@ HEADLINE_PROMPT_3 = (
     "- 事実関係が曖昧な断定は避ける（推定語を最小限に）\n"
 )
 
+# 見出し3案を1リクエストで生成する（JSON出力）。パース失敗時は従来の3回呼び出しに戻す
+HEADLINE_JSON_ENABLED = os.getenv("SHEET_HEADLINE_JSON", "1") == "1"
+
+HEADLINE_PROMPT_JSON = (
+    "あなたは報道見出しの専門翻訳者・新聞社の見出しデスクです。"
+    "以下の原題と本文から、日本語の報道見出しを3案作成してください。\n"
+    "・v1: 原題を自然で簡潔な日本語見出しに翻訳する（固有名詞は一般的な日本語表記、意訳しすぎず要点を保つ）\n"
+    "・v2: v1 を素材にした別案。直訳ではなく30文字以内で要点を端的に、主語・動作を明確に、重複語や冗長な修飾を避ける\n"
+    "・v3: 本文から要点（誰／どこ／何が起きた／規模・数値／結果／時点）を抽出して作る見出し。"
+    "重要な固有名詞・数値を優先し、事実関係が曖昧な断定は避ける（本文が無い場合は v1 と同じでよい）\n"
+    "共通：文体は だ・である調。必要に応じて体言止め（乱用は避ける）。"
+    "「〜と述べた」「〜が行われた」などの曖昧・婉曲表現は避ける。各案は1行。\n"
+    "出力は次の JSON オブジェクトのみ（前後の説明文・コードフェンス・ラベルは不要）：\n"
+    '{"v1": "…", "v2": "…", "v3": "…"}\n'
+)
+
+
+def _parse_headline_variants_json(text: str) -> Optional[List[str]]:
+    """JSON 応答から [v1, v2, v3] を取り出す。形式が崩れていれば None。"""
+    s = (text or "").strip()
+    s = re.sub(r"^```(?:json)?\s*|\s*```$", "", s)
+    try:
+        data = json.loads(s, strict=False)
+    except Exception:
+        m = re.search(r"\{.*\}", s, flags=re.DOTALL)
+        if not m:
+            return None
+        try:
+            data = json.loads(m.group(0), strict=False)
+        except Exception:
+            return None
+    if not isinstance(data, dict):
+        return None
+    out: List[str] = []
+    for k in ("v1", "v2", "v3"):
+        v = data.get(k)
+        if not isinstance(v, str):
+            return None
+        v = unicodedata.normalize("NFC", " ".join(v.split()))
+        if not v:
+            return None
+        out.append(v)
+    return out
+
 # ===== クリーニング手順（必要に応じて適用） =====
 STEP12_FILTERS = (
     "Step 1: 例外チェック（最優先）\n"
@@ -1120,9 +1317,11 @@ STEP3_TASK = (
     "- 要約全体は最大500文字以内。重要情報（日時／主体／行為／規模／結果）を優先してください。\n"
 )
 
+SUMMARY_PROMPT_HEADER = "次の手順で記事を判定・処理してください。\n\n"
+
 def _build_summary_prompt(item: dict, *, body_max: int) -> str:
     """Gemini用の要約プロンプトを生成（Irrawaddy特例なし、超要約も削除済み）"""
-    header = "次の手順で記事を判定・処理してください。\n\n"
+    header = SUMMARY_PROMPT_HEADER
     pre = STEP12_FILTERS + "\n\n"
     body = (item.get("body") or "")[:max(body_max, 0)]
     input_block = (
@@ -1254,6 +1453,10 @@ try:
 except Exception:
     _RateLimiterImpl = None
 
+# fetch_articles の (キー, モデル) 別クォータスケジューラが有効なら、call_llm_with_fallback 側で待つので
+# ここのリミッタ（全体 / レーン別）は作らない（同じ呼び出しを二重に絞らない）
+from fetch_articles import GEMINI_SCHEDULER_ENABLED, gemini_key_id
+
 @runtime_checkable
 class _RateLimiterProto(Protocol):
     rpm: int
@@ -1263,6 +1466,14 @@ class _RateLimiterProto(Protocol):
 
 # 実行時に main() で初期化して、各 Gemini 呼び出しの直前で wait() する
 _LIMITER: Optional[_RateLimiterProto] = None
+# キー別レーン（_GeminiKeyLanes）で動いているスレッドは、そのレーン専用のリミッタを使う
+_LANE_LOCAL = threading.local()
+
+
+def _limiter_wait() -> None:
+    limiter = getattr(_LANE_LOCAL, "limiter", None) or _LIMITER
+    if limiter:
+        limiter.wait()
 
 # ===== Google Sheets 認証（Service Account） ====
 import gspread
@@ -1409,14 +1620,39 @@ def _headline_variants_ja(title: str, source: str, url: str, body: str = "") ->
     glossary = rg_title + rg_body + _build_term_rules_prompt(title, body)
     source_rules = _build_source_specific_translation_rules(source)
 
+    # ---- 3案を1リクエストで（共通ルール・用語集の送信は1回で済む） ----
+    if HEADLINE_JSON_ENABLED:
+        try:
+            _limiter_wait()
+            body_for_prompt = _clip_body_for_headline(body, max_chars=1200)
+            prompt = (
+                COMMON_RULES_HEADER
+                + source_rules + "\n"
+                + HEADLINE_PROMPT_JSON
+                + (glossary or "")
+                + f"\n\n原題: {title}\nsource:{source}\nurl:{url}\n"
+                + ("【本文】\n" + body_for_prompt + "\n" if body_for_prompt else "")
+            )
+            resp = call_llm_with_fallback(
+                client, prompt, model=model, cacheable_prefix=COMMON_RULES_HEADER,
+                # JSON として読めた応答だけキャッシュ（壊れた応答を再実行で再生しない）
+                validate=lambda t: _parse_headline_variants_json(t) is not None,
+            )
+            variants = _parse_headline_variants_json(resp.text or "")
+            if variants:
+                return _finalize_headline_variants(*variants, title=title, source=source, body=body)
+            logging.warning(f"[headline] JSON parse failed; falling back to 3 calls url={url}")
+        except Exception as e:
+            logging.warning(f"[headline] single-call failed; falling back to 3 calls url={url}: {e}")
+
     # ---- 案1：原題ベース ----
     try:
-        if _LIMITER:
-            _LIMITER.wait()
+        _limiter_wait()
         resp1 = call_llm_with_fallback(
             client,
             f"{COMMON_RULES_HEADER}{source_rules}\n{HEADLINE_PROMPT_1}{glossary}\n\n原題: {title}\nsource:{source}\nurl:{url}",
             model=model,
+            cacheable_prefix=COMMON_RULES_HEADER,
         )
         v1 = unicodedata.normalize("NFC", (resp1.text or "").strip())
     except Exception:
@@ -1424,18 +1660,16 @@ def _headline_variants_ja(title: str, source: str, url: str, body: str = "") ->
 
     # ---- 案2：案1を素材に再生成 ----
     try:
-        if _LIMITER:
-            _LIMITER.wait()
+        _limiter_wait()
         prompt2 = COMMON_RULES_HEADER + source_rules + "\n" + (glossary or "") + make_headline_prompt_2_from(v1)
-        resp2 = call_llm_with_fallback(client, prompt2, model=model)
+        resp2 = call_llm_with_fallback(client, prompt2, model=model, cacheable_prefix=COMMON_RULES_HEADER)
         v2 = unicodedata.normalize("NFC", (resp2.text or "").strip())
     except Exception:
         v2 = v1
 
     # ---- 案3：本文から要素抽出して新聞見出し化 ----
     try:
-        if _LIMITER:
-            _LIMITER.wait()
+        _limiter_wait()
         body_for_prompt = _clip_body_for_headline(body, max_chars=1200)
         if not body_for_prompt:
             # 本文が無いときは案1でフォールバック
@@ -1449,11 +1683,15 @@ def _headline_variants_ja(title: str, source: str, url: str, body: str = "") ->
                 + "【本文】\n" + body_for_prompt + "\n\n"
                 f"（参考）原題: {title}\nsource:{source}\nurl:{url}\n"
             )
-            resp3 = call_llm_with_fallback(client, prompt3, model=model)
+            resp3 = call_llm_with_fallback(client, prompt3, model=model, cacheable_prefix=COMMON_RULES_HEADER)
             v3 = unicodedata.normalize("NFC", (resp3.text or "").strip())
     except Exception:
         v3 = v1
 
+    return _finalize_headline_variants(v1, v2, v3, title=title, source=source, body=body)
+
+
+def _finalize_headline_variants(v1: str, v2: str, v3: str, *, title: str, source: str, body: str) -> List[str]:
     # 生成後の最終統一（州・管区名 → 既存）＋（用語集 → 新規）
     v1 = _apply_region_glossary_to_text(v1); v1 = _apply_term_glossary_to_output(v1, src=title, prefer="title_ja"); v1 = normalize_output_terminology_by_source(v1, source, context="headline")
     v2 = _apply_region_glossary_to_text(v2); v2 = _apply_term_glossary_to_output(v2, src=title, prefer="title_ja"); v2 = normalize_output_terminology_by_source(v2, source, context="headline")
@@ -1497,12 +1735,12 @@ def _summary_ja(source: str, title: str, body: str, url: str) -> str:
     prompt = _build_summary_prompt(payload, body_max=body_max)
 
     try:
-        if _LIMITER:
-            _LIMITER.wait()
+        _limiter_wait()
         resp = call_llm_with_fallback(
             client,
             prompt,
             model=os.getenv("GEMINI_SUMMARY_MODEL", "gemini-2.5-flash"),
+            cacheable_prefix=SUMMARY_PROMPT_HEADER + COMMON_RULES_HEADER,
         )
         text = unicodedata.normalize("NFC", (resp.text or "").strip())
         text = _apply_region_glossary_to_text(text)
@@ -1525,6 +1763,88 @@ def _summary_ja(source: str, title: str, body: str, url: str) -> str:
         return text
 
 
+# ===== API キー別レーンでの並列ディスパッチ =====
+# 媒体ごとに Gemini キー（= 無料枠）が分かれているので、キーごとに1本のワーカーレーンを立て、
+# レーン内は直列・レーン間は並列で回す。レーンごとに専用の RateLimiter を持つので、
+# 全体の所要時間は「一番件数の多いキーの分」に近づく。結果は投入順（シート行順）で返す。
+class _GeminiKeyLanes:
+    def __init__(self, rpm: int, min_interval: float, jitter: float):
+        self.rpm = rpm
+        self.min_interval = min_interval
+        self.jitter = jitter
+
+    def _lane_key(self, source: str) -> str:
+        key = _gemini_key_for_source(source)
+        return gemini_key_id(key) if key else "(no-key)"
+
+    def _new_limiter(self):
+        if not _RateLimiterImpl or GEMINI_SCHEDULER_ENABLED:
+            return None
+        return _RateLimiterImpl(self.rpm, self.min_interval, self.jitter)
+
+    def run(self, tasks: List[tuple]) -> list:
+        """tasks: [(source, fn), ...] → [fn() の結果, ...]（投入順）"""
+        lanes: Dict[str, List[int]] = {}
+        for i, (source, _fn) in enumerate(tasks):
+            lanes.setdefault(self._lane_key(source), []).append(i)
+        results: list = [None] * len(tasks)
+
+        def _run_lane(lane_key: str, indexes: List[int]):
+            _LANE_LOCAL.limiter = self._new_limiter()
+            try:
+                with _timeit("gemini:lane", key=lane_key, tasks=len(indexes)):
+                    for i in indexes:
+                        source, fn = tasks[i]
+                        try:
+                            results[i] = fn()
+                        except Exception as e:
+                            logging.warning(f"[gemini-lane] task failed key={lane_key} source={source}: {e}")
+            finally:
+                _LANE_LOCAL.limiter = None
+
+        if len(lanes) <= 1:
+            for lane_key, indexes in lanes.items():
+                _run_lane(lane_key, indexes)
+            return results
+
+        from concurrent.futures import ThreadPoolExecutor
+        logging.info(f"[gemini-lane] lanes={len(lanes)} tasks={len(tasks)} rpm/lane={self.rpm}")
+        with ThreadPoolExecutor(max_workers=len(lanes), thread_name_prefix="gemini-lane") as ex:
+            for fut in [ex.submit(_run_lane, k, idx) for k, idx in lanes.items()]:
+                fut.result()
+        return results
+
+
+def _generate_ja_for_rows(rows: List[List[str]], args) -> None:
+    """
+    追記予定の行（C=媒体, J=URL, M=原題, N=本文）について見出し3案（E/F/G）と要約（I）を
+    キー別レーンで並列生成し、行順どおりに書き戻す。
+    """
+    if not rows:
+        return
+    lanes = _GeminiKeyLanes(
+        getattr(args, "rpm", int(os.getenv("GEMINI_REQS_PER_MIN", "9"))),
+        getattr(args, "min_interval", float(os.getenv("GEMINI_MIN_INTERVAL_SEC", "2.0"))),
+        getattr(args, "jitter", float(os.getenv("GEMINI_JITTER_SEC", "0.3"))),
+    )
+
+    def _task(row: List[str]):
+        source, url, title, body = row[2], row[9], row[12], row[13]
+        return (
+            _headline_variants_ja(title, source, url, body),
+            _summary_ja(source, title, body, url),
+        )
+
+    with _timeit("gemini:generate", rows=len(rows)):
+        results = lanes.run([(row[2], (lambda r=row: _task(r))) for row in rows])
+    for row, res in zip(rows, results):
+        if not res:
+            continue
+        variants, summary = res
+        row[4], row[5], row[6] = (list(variants) + ["", "", ""])[:3]
+        row[8] = _clip_for_sheet_cell(summary or "")
+
+
 def _is_ayeyarwady(title_raw: str, body_raw: str) -> bool:
     """
     記事「原文」のタイトル/本文に対して Ayeyarwady 判定を行う。
@@ -1577,10 +1897,71 @@ def _deduplicate_items(items: List[Dict]) -> List[Dict]:
             out.append(it); seen.add(key)
     return out
 
+# --- collector 並列実行 ---
+# 既定は 4 並列。COLLECT_MAX_WORKERS=1 で従来どおりの直列実行。
+COLLECT_MAX_WORKERS = int(os.getenv("COLLECT_MAX_WORKERS", "4"))
+# 同一ホスト（同一グループ）に同時に走らせる collector 数の上限
+COLLECT_PER_HOST_LIMIT = int(os.getenv("COLLECT_PER_HOST_LIMIT", "1"))
+
+# collector ラベル → 礼儀制御キー（ホスト / 共有バックエンド）
+# Irrawaddy / GNLM は Bright Data を多用するので "brightdata" も共有キーにする
+_COLLECTOR_HOST_KEYS: Dict[str, tuple] = {
+    "Irrawaddy": ("irrawaddy.com", "brightdata"),
+    "Mizzima (Burmese)": ("mizzima.com",),
+    "BBC Burmese": ("bbc.com",),
+    "Khit Thit Media": ("yktnews.com",),
+    "DVB": ("dvb.no",),
+    "Myanmar Now": ("myanmar-now.org",),
+    "GNLM": ("gnlm.com.mm", "brightdata"),
+    "Popular Myanmar": ("popularmyanmar.com",),
+    "Frontier Myanmar": ("frontiermyanmar.net",),
+    "JETRO": ("jetro.go.jp",),
+    "News Eleven": ("news-eleven.com",),
+}
+
+_HOST_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+def _host_semaphore(key: str) -> threading.BoundedSemaphore:
+    with _HOST_SEMAPHORES_LOCK:
+        sem = _HOST_SEMAPHORES.get(key)
+        if sem is None:
+            sem = threading.BoundedSemaphore(max(1, COLLECT_PER_HOST_LIMIT))
+            _HOST_SEMAPHORES[key] = sem
+        return sem
+
+@contextlib.contextmanager
+def _host_slots(label: str):
+    """collector に対応するホストキーのセマフォを（デッドロック回避のためソート順で）取得する。"""
+    keys = sorted(set(_COLLECTOR_HOST_KEYS.get(label) or (label,)))
+    acquired: List[threading.BoundedSemaphore] = []
+    try:
+        for k in keys:
+            sem = _host_semaphore(k)
+            sem.acquire()
+            acquired.append(sem)
+        yield
+    finally:
+        for sem in reversed(acquired):
+            sem.release()
+
+def _run_collector(label: str, fn, kwargs: dict, target_date_mmt: date) -> List[Dict]:
+    """1 collector を実行し、結果リストを返す（失敗時は空リスト）。"""
+    try:
+        with _host_slots(label):
+            with _timeit(f"collector:{label}", date=target_date_mmt.isoformat(), kwargs=kwargs or None):
+                fetched = list(fn(target_date_mmt, **kwargs) or [])
+                logging.info(f"[collect:{label}] fetched={len(fetched)}")
+                return fetched
+    except Exception as e:
+        logging.exception(f"[warn] collector failed: {fn.__name__}: {e}")
+        return []
+
 def _collect_all_for(
     target_date_mmt: date,
     schedule_cron: str | None = None,
     only_source: str | None = None,
+    max_workers: int | None = None,
 ) -> List[Dict]:
     if not collectors_loaded:
         raise SystemExit("収集関数の読み込み失敗。export_all_articles_to_csv.py を配置してください。")
@@ -1626,16 +2007,29 @@ def _collect_all_for(
         if not plan:
             logging.warning(f"[collect] no collector matched only_source={only_source!r}")
 
-    for label, fn, kwargs in plan:
-        name = label
-        try:
-            with _timeit(f"collector:{name}", date=target_date_mmt.isoformat(), kwargs=kwargs or None):
-                before = len(items)
-                fetched = fn(target_date_mmt, **kwargs)
-                items.extend(fetched)
-                logging.info(f"[collect:{name}] fetched={len(fetched)} total={len(items)}")
-        except Exception as e:
-            logging.exception(f"[warn] collector failed: {fn.__name__}: {e}")
+    # plan の各 collector を並列実行し、結果は plan 順に連結する
+    # （_deduplicate_items が見る順序は直列実行時と同じ）
+    workers = max(1, min(COLLECT_MAX_WORKERS if max_workers is None else max_workers, len(plan) or 1))
+    results: List[List[Dict]] = [[] for _ in plan]
+    if workers == 1:
+        for i, (label, fn, kwargs) in enumerate(plan):
+            results[i] = _run_collector(label, fn, kwargs, target_date_mmt)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        logging.info(f"[collect] parallel workers={workers} per_host={COLLECT_PER_HOST_LIMIT} collectors={len(plan)}")
+        with _timeit("collect:parallel", workers=workers, collectors=len(plan)):
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collector") as ex:
+                futures = [
+                    ex.submit(_run_collector, label, fn, kwargs, target_date_mmt)
+                    for label, fn, kwargs in plan
+                ]
+                for i, fut in enumerate(futures):
+                    results[i] = fut.result()
+
+    for (label, _fn, _kwargs), fetched in zip(plan, results):
+        items.extend(fetched)
+        logging.info(f"[collect:{label}] merged={len(fetched)} total={len(items)}")
+    _log_brightdata_usage()
     dedup_before = len(items)
     items = _deduplicate_items(items)
     if dedup_before != len(items):
@@ -1644,6 +2038,27 @@ def _collect_all_for(
         logging.info(f"[collect] total={len(items)} (no dup)")
     return items
 
+def _log_brightdata_usage() -> None:
+    """この実行での Bright Data（Unlocker / Browser）の利用状況をログに残す。"""
+    try:
+        if brightdata_unlocker_stats is not None:
+            st = brightdata_unlocker_stats()
+            if st:
+                logging.info(
+                    f"[brightdata] unlocker requests={st['requests']} ok={st['ok']} fail={st['fail']} "
+                    f"avg={st['avg_sec']}s p50={st['p50_sec']}s max={st['max_sec']}s "
+                    f"est_cost=${st['est_cost_usd']}"
+                )
+        if brightdata_browser_stats is not None:
+            count, _urls, lat = brightdata_browser_stats(with_latency=True)
+            if count:
+                logging.info(
+                    f"[brightdata] browser calls={count} fails={lat['fails']} "
+                    f"avg={lat['avg_sec']}s p50={lat['p50_sec']}s max={lat['max_sec']}s"
+                )
+    except Exception as e:
+        logging.warning(f"[brightdata] usage log failed: {e}")
+
 # ===== Sheets I/O =====
 # --- Google Sheets のセル上限対策 ---
 # 1セルあたりの最大文字数は 50,000 文字なので、少し余裕を見てクリップする
@@ -1772,6 +2187,7 @@ def cmd_collect_to_sheet(args):
         target,
         getattr(args, "schedule_cron", None),
         getattr(args, "only_source", None),
+        getattr(args, "collect_workers", None),
     )
     if not items:
         logging.warning("[collect] no items to write")
@@ -1831,15 +2247,12 @@ def cmd_collect_to_sheet(args):
         summary = (it.get("summary") or "").strip()
         if body:
             with _BODIES_LOCK:
-                cache = _load_bodies_cache(bundle_dir)
-                cache = _upsert_body_cache_entry(
-                    cache,
+                _body_store(bundle_dir).upsert(
                     url=normalized_url,
                     source=source,
                     title=title,
                     body=body,
                 )
-                _save_bodies_cache(bundle_dir, cache)
         else:
             # なければ堅牢抽出器で1回だけ取得→キャッシュ
             body = _get_body_once(normalized_url, source, out_dir=bundle_dir, title=title, summary=summary)
@@ -1873,6 +2286,17 @@ def cmd_collect_to_sheet(args):
         ])
         existing.add(effective_row_key)
 
+    # 本文ストアは追記ログのみで回したので、最後に bodies.json を1回だけ書き出す
+    with _BODIES_LOCK:
+        try:
+            _body_store(bundle_dir).export()
+        except Exception as e:
+            logging.warning(f"[bodies] export failed: {e}")
+
+    # 見出し訳３案 / 要約を Gemini で埋める場合は、キー別レーンで並列生成（既定は空のまま）
+    if getattr(args, "gemini_ja", False):
+        _generate_ja_for_rows(rows_to_append, args)
+
     _append_rows(rows_to_append)
     print(f"appended {len(rows_to_append)} rows")
 
@@ -1960,6 +2384,8 @@ def cmd_build_bundle_from_sheet(args):
     with _timeit("build-bundle:write", out_dir=out_dir, items=len(summaries)):
         if os.path.isdir(out_dir):
             shutil.rmtree(out_dir)
+        with _BODIES_LOCK:
+            _BODY_STORES.pop(os.path.abspath(out_dir), None)  # 消したディレクトリの索引は破棄
         os.makedirs(out_dir, exist_ok=True)
 
         meta = {
@@ -2106,6 +2532,14 @@ def cmd_build_bundle_from_sheet(args):
     except Exception as e:
         logging.warning(f"[bundle] failed to build business pdf: {e}")
 
+    # PDF 作成中に取り直した本文は bodies.jsonl に追記されているので、bodies.json へ畳んでおく
+    # （送信ワークフローは bodies.json だけをアップロードする）
+    with _BODIES_LOCK:
+        try:
+            _body_store(out_dir).export()
+        except Exception as e:
+            logging.warning(f"[bodies] export failed: {e}")
+
 # ===== CLI =====
 import argparse
 def main():
@@ -2118,10 +2552,17 @@ def main():
     p1.add_argument("--schedule-cron", default=None, help="(GitHub Actions) github.event.schedule の cron 文字列。Irrawaddy の実行枠判定に使用")
     p1.add_argument("--target-offset-days", type=int, default=0, help="収集対象日をMMT基準で相対シフトする。-1で昨日")
     p1.add_argument("--only-source", default=None, help="指定した媒体のみ収集する（例: 'Khit Thit Media'）")
+    p1.add_argument("--collect-workers", type=int, default=None, help="collector の並列数（既定: COLLECT_MAX_WORKERS=4、1で直列）")
     # === Gemini free tier を想定したレート設定（CLI指定 > 環境変数 > 既定）===
     p1.add_argument("--rpm", type=int, default=int(os.getenv("GEMINI_REQS_PER_MIN", "9")))
     p1.add_argument("--min-interval", type=float, default=float(os.getenv("GEMINI_MIN_INTERVAL_SEC", "2.0")))
     p1.add_argument("--jitter", type=float, default=float(os.getenv("GEMINI_JITTER_SEC", "0.3")))
+    p1.add_argument(
+        "--gemini-ja",
+        action="store_true",
+        default=os.getenv("SHEET_GEMINI_JA", "0") == "1",
+        help="見出し訳３案(E/F/G)と要約(I)を Gemini で生成する（媒体別キーごとに並列）",
+    )
     p1.set_defaults(func=cmd_collect_to_sheet)
 
     p2 = sub.add_parser("build-bundle", help="sheetからbundle生成（02:30）")
@@ -2131,7 +2572,7 @@ def main():
     args = p.parse_args()
     # レートリミッタ初期化（collect-to-sheet のときのみ意味がある）
     global _LIMITER
-    if _RateLimiterImpl and args.cmd == "collect-to-sheet":
+    if _RateLimiterImpl and args.cmd == "collect-to-sheet" and not GEMINI_SCHEDULER_ENABLED:
         _LIMITER = cast(_RateLimiterProto, _RateLimiterImpl(
             getattr(args, "rpm", int(os.getenv("GEMINI_REQS_PER_MIN", "9"))),
             getattr(args, "min_interval", float(os.getenv("GEMINI_MIN_INTERVAL_SEC", "2.0"))),
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+# sheet_pipeline は fetch_articles を読み込むので、Gemini クライアント用のダミーキーを入れておく
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+import fetch_articles  # noqa: E402
+import sheet_pipeline  # noqa: E402
+
+
+class BodyStoreTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out_dir = tmp.name
+        # 同一URLの2行（item_id 付き）をスナップショットに置く
+        self.rows = [
+            {"item_id": "a", "url": "https://example.com/x", "body": "first"},
+            {"item_id": "b", "url": "https://example.com/x/", "body": "second"},
+        ]
+        sheet_pipeline._save_bodies_cache(self.out_dir, [dict(r) for r in self.rows])
+
+    def test_matches_legacy_list_helpers(self):
+        store = sheet_pipeline._BodyStore(self.out_dir)
+        legacy = [dict(r) for r in self.rows]
+
+        found = sheet_pipeline._find_body_cache_entry(legacy, url="https://example.com/x")
+        self.assertEqual(store.get(url="https://example.com/x"), found)
+
+        store.upsert(url="https://example.com/x", body_ja="訳")
+        sheet_pipeline._upsert_body_cache_entry(legacy, url="https://example.com/x", body_ja="訳")
+        self.assertEqual(store.entries, legacy)
+        self.assertEqual(store.entries[0]["body_ja"], "訳")
+
+    def test_export_folds_appended_bodies_into_snapshot(self):
+        store = sheet_pipeline._BodyStore(self.out_dir)
+        store.upsert(url="https://example.com/new", body="fetched later")
+        store.export()
+        self.assertFalse(os.path.exists(sheet_pipeline._bodies_log_path(self.out_dir)))
+        urls = [e.get("url") for e in sheet_pipeline._load_bodies_cache(self.out_dir)]
+        self.assertIn("https://example.com/new", urls)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class GeminiKeyLanesTest(unittest.TestCase):
+    def setUp(self):
+        self.lanes = sheet_pipeline._GeminiKeyLanes(9, 2.0, 0.3)
+        keys = {"Mizzima": "AIzaSy-key-one", "DVB": "AIzaSy-key-two"}
+        patcher = mock.patch.object(sheet_pipeline, "_gemini_key_for_source", side_effect=keys.get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lane_key_uses_fetch_articles_key_id(self):
+        self.assertEqual(self.lanes._lane_key("Mizzima"), fetch_articles.gemini_key_id("AIzaSy-key-one"))
+        self.assertNotEqual(self.lanes._lane_key("Mizzima"), self.lanes._lane_key("DVB"))
+        self.assertEqual(self.lanes._lane_key("Unknown"), "(no-key)")
+
+    def test_no_lane_limiter_when_quota_scheduler_paces_calls(self):
+        with mock.patch.object(sheet_pipeline, "GEMINI_SCHEDULER_ENABLED", True):
+            self.assertIsNone(self.lanes._new_limiter())
+        if sheet_pipeline._RateLimiterImpl:
+            with mock.patch.object(sheet_pipeline, "GEMINI_SCHEDULER_ENABLED", False):
+                self.assertIsNotNone(self.lanes._new_limiter())
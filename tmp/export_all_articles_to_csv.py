@@ -1,4 +1,4 @@
-
+﻿
 # -*- coding: utf-8 -*-
 """
 export_all_articles_to_csv.py
@@ -45,6 +45,7 @@ from collections import deque
 import re
 import json
 import hashlib
+import threading
 from contextlib import contextmanager
 import tempfile
 from urllib.parse import urlsplit, urlunsplit, urljoin
@@ -62,7 +63,9 @@ from fetch_articles import (
     deduplicate_by_url,
     fetch_with_retry_irrawaddy,
     fetch_html_via_brightdata_unlocker,
+    fetch_many_via_brightdata_unlocker,
     fetch_html_via_brightdata_browser,
+    fetch_html_via_brightdata_browser_many,
     BD_UNLOCKER_TIMEOUT,
     extract_body_irrawaddy,
     _is_irrawaddy_excluded_url,
@@ -72,6 +75,12 @@ from fetch_articles import (
     fetch_with_retry,
     fetch_with_retry_dvb,
     extract_paragraphs_with_wait,
+    make_soup,
+    fanout_ordered,
+    http_cache_fetch,
+    http_cache_marker_validator,
+    HTTP_CACHE_ARTICLE_VALIDATOR,
+    fetch_router,
 )
 
 # ----------------------------------------------------------------
@@ -157,7 +166,7 @@ def _bbc_extract_body(html: str) -> str:
     BBC Burmese の記事 HTML から本文のみを抜き出す。
     fetch_articles.py 側の BBC ロジックと同じ構造を意識した実装。
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     # 署名・おすすめ記事・ヘッダ／ナビ／フッタなどのノイズを削除
     for node in soup.select(
@@ -323,7 +332,7 @@ def _is_bbc_burmese_date_news_summary_title(title: str) -> bool:
 def _bbc_extract_page_title_from_html(html: str) -> str:
     """RSSタイトルとページ側タイトルがズレた場合の補助判定用。"""
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         og = soup.find("meta", attrs={"property": "og:title"})
         if og and og.get("content"):
             return unicodedata.normalize("NFC", og.get("content", "").strip())
@@ -341,7 +350,7 @@ def _bbc_extract_split_articles_from_html(html: str) -> List[Dict]:
     BBC Burmese の「日付 + သတင်းအနှစ်ချုပ် - ...」ページを、
     先頭 headline + 以降の subheadline 単位で複数記事に分割する。
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     next_data_tag = soup.find("script", id="__NEXT_DATA__")
     if not next_data_tag or not next_data_tag.string:
         return []
@@ -418,7 +427,11 @@ def collect_bbc_all_for_date(target_date_mmt: date) -> List[Dict]:
     rss_url = "https://feeds.bbci.co.uk/burmese/rss.xml"
     session = _make_pooled_session()
     try:
-        res = session.get(rss_url, timeout=10)
+        res = http_cache_fetch(
+            rss_url,
+            lambda h: session.get(rss_url, timeout=10, headers=h),
+            validate=http_cache_marker_validator("<item"),
+        )
         res.raise_for_status()
     except Exception as e:
         print(f"[bbc] RSS取得失敗: {e}")
@@ -563,7 +576,7 @@ def collect_khitthit_all_for_date(target_date_mmt: date, max_pages: int = 15) ->
                 print(f"[khitthit] stop pagination: {url} -> {e}")
                 break
 
-            soup = BeautifulSoup(res.content, "html.parser")
+            soup = make_soup(res.content)
             entry_links = soup.select("p.entry-title.td-module-title a[href]")
             if not entry_links:
                 print(f"[khitthit] no entries: {url}")
@@ -573,25 +586,25 @@ def collect_khitthit_all_for_date(target_date_mmt: date, max_pages: int = 15) ->
                 if href and href not in collected_urls:
                     collected_urls.add(href)
 
-    results: List[Dict] = []
-    for url in collected_urls:
+    # 記事ページ取得は fanout_ordered で並列化（日付判定・抽出ロジックは従来どおり）
+    def _fetch_one(url: str) -> Optional[Dict]:
         try:
-            res = fetch_with_retry(url)
-            soup = BeautifulSoup(res.content, "html.parser")
+            res = fetch_with_retry(url, cache_validate=HTTP_CACHE_ARTICLE_VALIDATOR)
+            soup = make_soup(res.content)
 
             # 発行日時 → MMT
             meta_tag = soup.find("meta", property="article:published_time")
             if not meta_tag or not meta_tag.has_attr("content"):
-                continue
+                return None
             dt = datetime.fromisoformat(meta_tag["content"]).astimezone(MMT)
             if dt.date() != target_date_mmt:
-                continue
+                return None
 
             # タイトル
             h1 = soup.find("h1") or soup.find("title")
             title = (h1.get_text(strip=True) if h1 else "").strip()
             if not title:
-                continue
+                return None
 
             # 本文（#除去）
             _remove_hashtag_links(soup)
@@ -602,18 +615,21 @@ def collect_khitthit_all_for_date(target_date_mmt: date, max_pages: int = 15) ->
                 if p.get_text(strip=True)
             ).strip()
 
-            results.append(
-                {
-                    "source": "Khit Thit Media",
-                    "title": unicodedata.normalize("NFC", title),
-                    "url": url,
-                    "date": target_date_mmt.isoformat(),
-                    "body": unicodedata.normalize("NFC", body_text),
-                }
-            )
+            return {
+                "source": "Khit Thit Media",
+                "title": unicodedata.normalize("NFC", title),
+                "url": url,
+                "date": target_date_mmt.isoformat(),
+                "body": unicodedata.normalize("NFC", body_text),
+            }
         except Exception as e:
             print(f"[khitthit] article fail {url}: {e}")
-            continue
+            return None
+
+    results: List[Dict] = [
+        r for r in fanout_ordered(list(collected_urls), _fetch_one, label="khitthit")
+        if r
+    ]
 
     return results
 
@@ -641,12 +657,18 @@ def collect_dvb_all_for_date(target_date_mmt: date) -> List[Dict]:
         for page_no in (1, 2):
             url = f"{BASE}{path}" if page_no == 1 else f"{BASE}{path}?page=2"
             try:
-                res = fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=sess)
+                res = http_cache_fetch(
+                    url,
+                    lambda h, _u=url: fetch_with_retry_dvb(
+                        _u, retries=4, wait_seconds=2, session=sess, extra_headers=h
+                    ),
+                    validate=http_cache_marker_validator('href="/post/'),
+                )
             except Exception as e:
                 print(f"[dvb] list fetch fail {url}: {e}")
                 continue
 
-            soup = BeautifulSoup(getattr(res, "content", None) or res.text, "html.parser")
+            soup = make_soup(getattr(res, "content", None) or res.text)
 
             blocks = soup.select(
                 "div.md\\:grid.grid-cols-3.gap-4.mt-5, div.grid.grid-cols-3.gap-4.mt-5"
@@ -677,11 +699,17 @@ def collect_dvb_all_for_date(target_date_mmt: date) -> List[Dict]:
                             candidate_urls.append(uabs)
                             seen_urls.add(uabs)
 
-    results: List[Dict] = []
-    for url in candidate_urls:
+    # 記事ページ取得は fanout_ordered で並列化（結果は candidate_urls の順）
+    def _fetch_one(url: str) -> Optional[Dict]:
         try:
-            res = fetch_with_retry_dvb(url, retries=4, wait_seconds=2, session=sess)
-            soup = BeautifulSoup(getattr(res, "content", None) or res.text, "html.parser")
+            res = http_cache_fetch(
+                url,
+                lambda h: fetch_with_retry_dvb(
+                    url, retries=4, wait_seconds=2, session=sess, extra_headers=h
+                ),
+                validate=http_cache_marker_validator("full_content"),
+            )
+            soup = make_soup(getattr(res, "content", None) or res.text)
 
             # タイトル抽出を強化: og:title → h1/.post-title → <title> の順
             title_tag = soup.find("meta", attrs={"property": "og:title"})
@@ -701,20 +729,23 @@ def collect_dvb_all_for_date(target_date_mmt: date) -> List[Dict]:
                 body = "\n".join(parts).strip()
 
             if not title or not body:
-                continue
+                return None
 
-            results.append(
-                {
-                    "url": url,
-                    "title": unicodedata.normalize("NFC", title),
-                    "date": target_date_mmt.isoformat(),
-                    "body": unicodedata.normalize("NFC", body),
-                    "source": "DVB",
-                }
-            )
+            return {
+                "url": url,
+                "title": unicodedata.normalize("NFC", title),
+                "date": target_date_mmt.isoformat(),
+                "body": unicodedata.normalize("NFC", body),
+                "source": "DVB",
+            }
         except Exception as e:
             print(f"[dvb] article fail {url}: {e}")
-            continue
+            return None
+
+    results: List[Dict] = [
+        r for r in fanout_ordered(candidate_urls, _fetch_one, label="dvb")
+        if r
+    ]
 
     if results:
         before = len(results)
@@ -839,7 +870,7 @@ def _mizzima_extract_list_links(html: str, base_url: str = "https://bur.mizzima.
         return []
 
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
     except Exception:
         return []
 
@@ -894,7 +925,7 @@ def _mizzima_html_usable(html: str, *, kind: str) -> bool:
         return False
 
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
     except Exception:
         return False
 
@@ -957,11 +988,15 @@ def _mizzima_fetch_html(
     # 1) direct requests
     sess = direct_session or _make_pooled_session()
     try:
-        res = sess.get(
+        res = http_cache_fetch(
             url,
-            headers=_MIZZIMA_HEADERS,
-            timeout=timeout,
-            allow_redirects=True,
+            lambda h: sess.get(
+                url,
+                headers={**_MIZZIMA_HEADERS, **h},
+                timeout=timeout,
+                allow_redirects=True,
+            ),
+            validate=lambda r: _mizzima_html_usable(_mizzima_response_text(r), kind=kind),
         )
         html = _mizzima_response_text(res)
         status = getattr(res, "status_code", None)
@@ -1276,7 +1311,6 @@ def collect_mizzima_all_for_date(target_date_mmt: date, max_pages: int = 15) ->
     # -----------------------------
     # 2) 記事ページ取得 → 対象日判定 → 本文抽出
     # -----------------------------
-    results: List[Dict] = []
     article_stats = {
         "attempted": 0,
         "fetch_failed": 0,
@@ -1293,93 +1327,118 @@ def collect_mizzima_all_for_date(target_date_mmt: date, max_pages: int = 15) ->
         "accepted": 0,
     }
 
-    for url, require_myanmar_keyword in article_require_keyword.items():
-        article_stats["attempted"] += 1
+    # 記事ページ取得は fanout_ordered で並列化する（結果は候補URLの順）。
+    # curl_cffi の Session はスレッド間で共有しないよう、スレッドごとに作る。
+    stats_lock = threading.Lock()
+    curl_local = threading.local()
+
+    def _bump(key: str) -> None:
+        with stats_lock:
+            article_stats[key] += 1
+
+    def _thread_curl_session():
+        if curl_session is None:
+            return None
+        sess = getattr(curl_local, "session", None)
+        if sess is None:
+            try:
+                sess = CurlSession(impersonate="chrome")
+            except Exception:
+                sess = None
+            curl_local.session = sess
+        return sess
+
+    def _fetch_one(url: str) -> Optional[Dict]:
+        require_myanmar_keyword = article_require_keyword[url]
+        _bump("attempted")
         try:
             html, source = _mizzima_fetch_html(
                 url,
                 kind="article",
                 direct_session=direct_session,
-                curl_session=curl_session,
+                curl_session=_thread_curl_session(),
             )
             if not html:
-                article_stats["fetch_failed"] += 1
+                _bump("fetch_failed")
                 print(f"[mizzima] article skip reason=all_fetch_methods_failed url={url}")
-                continue
+                return None
 
             if source in article_stats:
-                article_stats[source] += 1
+                _bump(source)
 
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html)
 
             published_date = _mizzima_extract_published_date_mmt(soup)
             if published_date is None:
-                article_stats["no_date"] += 1
+                _bump("no_date")
                 print(f"[mizzima] article skip reason=published_date_not_found source={source} url={url}")
-                continue
+                return None
 
             if published_date != target_date_mmt:
-                article_stats["date_mismatch"] += 1
+                _bump("date_mismatch")
                 # 大量ログになり過ぎないよう個別URLは出すが本文等は出さない。
                 print(
                     f"[mizzima] article skip reason=date_mismatch "
                     f"published={published_date.isoformat()} target={target_date_mmt.isoformat()} "
                     f"source={source} url={url}"
                 )
-                continue
+                return None
 
             title_nfc = _mizzima_extract_title(soup)
             if not title_nfc:
-                article_stats["no_title"] += 1
+                _bump("no_title")
                 print(f"[mizzima] article skip reason=title_not_found source={source} url={url}")
-                continue
+                return None
 
             if any(kw in title_nfc for kw in EXCLUDE_TITLE_KEYWORDS):
-                article_stats["excluded_title"] += 1
+                _bump("excluded_title")
                 print(
                     f"[mizzima] article skip reason=excluded_title_keyword "
                     f"source={source} url={url} title={title_nfc!r}"
                 )
-                continue
+                return None
 
             body_nfc = _mizzima_extract_body(soup)
             if not body_nfc:
-                article_stats["no_body"] += 1
+                _bump("no_body")
                 print(
                     f"[mizzima] article skip reason=body_not_found "
                     f"source={source} url={url} title={title_nfc!r}"
                 )
-                continue
+                return None
 
             if require_myanmar_keyword and not _mizzima_has_myanmar_keyword(title_nfc, body_nfc):
-                article_stats["keyword_miss"] += 1
+                _bump("keyword_miss")
                 print(
                     f"[mizzima] article skip reason=no_မြန်မာ_keyword_in_extra_category "
                     f"source={source} url={url} title={title_nfc!r}"
                 )
-                continue
+                return None
 
-            results.append(
-                {
-                    "source": "Mizzima (Burmese)",
-                    "title": title_nfc,
-                    "url": url,
-                    "date": target_date_mmt.isoformat(),
-                    "body": body_nfc,
-                }
-            )
-            article_stats["accepted"] += 1
+            _bump("accepted")
             print(
                 f"[mizzima] article accepted source={source} "
                 f"date={target_date_mmt.isoformat()} body_len={len(body_nfc)} url={url}"
             )
+            return {
+                "source": "Mizzima (Burmese)",
+                "title": title_nfc,
+                "url": url,
+                "date": target_date_mmt.isoformat(),
+                "body": body_nfc,
+            }
 
         except Exception as e:
-            article_stats["fetch_failed"] += 1
+            _bump("fetch_failed")
             print(
                 f"[mizzima] article fail unexpected={type(e).__name__}:{e} url={url}"
             )
-            continue
+            return None
+
+    results = [
+        r for r in fanout_ordered(list(article_require_keyword), _fetch_one, label="mizzima")
+        if r
+    ]
 
     if results:
         before = len(results)
@@ -1573,7 +1632,7 @@ def collect_myanmar_now_mm_all_for_date(target_date_mmt: date, max_pages: int =
                 res = fetch_with_retry(url)
             except Exception:
                 break
-            soup = BeautifulSoup(res.content, "html.parser")
+            soup = make_soup(res.content)
 
             for span in soup.select("span.date.meta-item.tie-icon"):
                 if (span.get_text(strip=True) or "") != today_label:
@@ -1593,8 +1652,6 @@ def collect_myanmar_now_mm_all_for_date(target_date_mmt: date, max_pages: int =
     for base in BASE_CATEGORIES:
         collected |= _collect_article_urls_from_category(base)
 
-    items: List[Dict] = []
-
     def _fetch_text(url: str, timeout: int = 20) -> str:
         try:
             r = sess.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=timeout)
@@ -1644,15 +1701,17 @@ def collect_myanmar_now_mm_all_for_date(target_date_mmt: date, max_pages: int =
             return unicodedata.normalize("NFC", seg)
         except Exception:
             return ""
-    for url in collected:
+
+    # 記事ページ取得は fanout_ordered で並列化（日付判定・jina 補完は従来どおり）
+    def _fetch_one(url: str) -> Optional[Dict]:
         try:
             title = ""
             body = ""
             meta_date_ok = False
             soup = None
             try:
-                res = fetch_with_retry(url)
-                soup = BeautifulSoup(res.content, "html.parser")
+                res = fetch_with_retry(url, cache_validate=HTTP_CACHE_ARTICLE_VALIDATOR)
+                soup = make_soup(res.content)
             except Exception:
                 soup = None
 
@@ -1673,7 +1732,7 @@ def collect_myanmar_now_mm_all_for_date(target_date_mmt: date, max_pages: int =
             if not title:
                 title = _strip_source_suffix(_oembed_title(url) or _title_from_slug(url))
             if not title:
-                continue
+                return None
 
             # 本文
             body = ""
@@ -1719,11 +1778,11 @@ def collect_myanmar_now_mm_all_for_date(target_date_mmt: date, max_pages: int =
                 body = _fetch_text(url)
 
             if not title:
-                continue
+                return None
             if not body:
-                continue
+                return None
 
-            items.append({
+            return {
                 "source": "Myanmar Now",
                 "title": title,
                 "url": url,
@@ -1731,10 +1790,15 @@ def collect_myanmar_now_mm_all_for_date(target_date_mmt: date, max_pages: int =
                 # そうでない場合もカテゴリ抽出が当日なので target_date_mmt を採用
                 "date": (dt_mmt.isoformat() if meta_date_ok else target_date_mmt.isoformat()),
                 "body": body,
-            })
+            }
         except Exception as e:
             print(f"[warn] Myanmar Now article fetch failed: {url} ({e})")
-            continue
+            return None
+
+    items = [
+        r for r in fanout_ordered(list(collected), _fetch_one, label="myanmar-now")
+        if r
+    ]
 
     return items
 
@@ -1799,12 +1863,55 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
     #   key=(url, allow_browser)
     #   value={"html": str, "status": int|None, "source": "direct"|"unlocker"|"browser"|"none"}
     html_fetch_cache: Dict[Tuple[str, bool], Dict[str, object]] = {}
+    # Unlocker をまとめて先取りした結果 url -> (html, 所要秒)
+    unlocker_prefetch: Dict[str, Tuple[str, float]] = {}
+    # 先取りで direct が既に失敗した URL（記事ループでは direct を再試行せず Unlocker へ）
+    direct_failed: set = set()
+    # Browser API をまとめて先取りした結果 url -> (html, 所要秒)
+    browser_prefetch: Dict[str, Tuple[str, float]] = {}
+
+    def _looks_like_cloudflare_block(s: str) -> bool:
+        if not s:
+            return False
+        head = s[:5000].lower()
+        return (
+            "just a moment" in head
+            or "cf-browser-verification" in head
+            or "challenges.cloudflare.com" in head
+            or "attention required" in head
+            or "challenge-platform" in head
+            or "why_captcha" in head
+        )
+
+    def _is_article_url(u: str) -> bool:
+        try:
+            path = requests.utils.urlparse(u).path.lower()
+        except Exception:
+            path = (u or "").lower()
+        return path.endswith(".html") and "/news/" in path
+
+    def _is_usable_article_html(u: str, s: str) -> bool:
+        if not s:
+            return False
+        if _looks_like_cloudflare_block(s):
+            return False
+        if not _is_article_url(u):
+            return True
+        try:
+            soup = make_soup(s)
+            if _article_date_from_meta_mmt(soup) is not None:
+                return True
+            body = extract_body_irrawaddy(soup) or ""
+            return bool(body.strip())
+        except Exception:
+            return False
 
     def _fetch_irrawaddy_html_cached(
         url: str,
         *,
         session=None,
         allow_browser: bool = True,
+        defer_unlocker: bool = False,
     ) -> Tuple[str, Optional[int], str]:
         """
         フェッチ順:
@@ -1812,6 +1919,8 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
           2) Web Unlocker
           3) Browser API（allow_browser=True の場合）
         同一実行中は URL ごとに結果をキャッシュする。
+        defer_unlocker=True のときは direct だけ試し、失敗なら source="deferred" で
+        キャッシュせずに返す（Unlocker は呼び出し側が fetch_many でまとめて叩く）。
         """
         # EXCLUDE_PREFIXES 該当URLは取得不要。
         # direct / Unlocker / Browser API を一切叩かない。
@@ -1827,77 +1936,67 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
                 cached.get("source", "none") or "none",
             )
 
-        def _looks_like_cloudflare_block(s: str) -> bool:
-            if not s:
-                return False
-            head = s[:5000].lower()
-            return (
-                "just a moment" in head
-                or "cf-browser-verification" in head
-                or "challenges.cloudflare.com" in head
-                or "attention required" in head
-                or "challenge-platform" in head
-                or "why_captcha" in head
-            )
-
-        def _is_article_url(u: str) -> bool:
-            try:
-                path = requests.utils.urlparse(u).path.lower()
-            except Exception:
-                path = (u or "").lower()
-            return path.endswith(".html") and "/news/" in path
-
-        def _is_usable_article_html(u: str, s: str) -> bool:
-            if not s:
-                return False
-            if _looks_like_cloudflare_block(s):
-                return False
-            if not _is_article_url(u):
-                return True
-            try:
-                soup = BeautifulSoup(s, "html.parser")
-                if _article_date_from_meta_mmt(soup) is not None:
-                    return True
-                body = extract_body_irrawaddy(soup) or ""
-                return bool(body.strip())
-            except Exception:
-                return False
-
         html = ""
         status = None
         source = "none"
+        router = fetch_router()
 
-        try:
-            res = fetch_with_retry_irrawaddy(url, session=session)
-            status = getattr(res, "status_code", None)
-            content_type = ""
+        # direct が連続で弾かれている（ブレーカー開）間は Unlocker へ直行する
+        if router.is_open(url, "direct"):
+            print(f"[irrawaddy-html] direct skipped (router breaker open) url={url}")
+        elif url in direct_failed:
+            pass  # 先取りで direct 済み（失敗）。二重に叩かない
+        else:
+            t0 = time.time()
+            res = None
             try:
-                content_type = (getattr(res, "headers", {}) or {}).get("Content-Type", "")
-            except Exception:
+                res = http_cache_fetch(
+                    url,
+                    lambda h: fetch_with_retry_irrawaddy(url, session=session, extra_headers=h),
+                    validate=lambda r: _is_usable_article_html(
+                        url, _to_text(getattr(r, "content", None) or getattr(r, "text", "") or "")
+                    ),
+                )
+                status = getattr(res, "status_code", None)
                 content_type = ""
-
-            html = _to_text(getattr(res, "content", None) or getattr(res, "text", "") or "")
-            usable = _is_usable_article_html(url, html)
-            blocked = _looks_like_cloudflare_block(html)
-            if html and usable and status != 403:
-                source = "direct"
-                if "/wp-json/" in url or url.rstrip("/").endswith("/feed"):
-                    print(f"[irrawaddy] meta direct status={status} content_type={content_type} url={url}")
-            else:
-                if html and (_is_article_url(url) or blocked or status == 403):
-                    print(
-                        f"[irrawaddy-html] direct fallback status={status} usable={usable} "
-                        f"cf={blocked} url={url}"
-                    )
+                try:
+                    content_type = (getattr(res, "headers", {}) or {}).get("Content-Type", "")
+                except Exception:
+                    content_type = ""
+
+                html = _to_text(getattr(res, "content", None) or getattr(res, "text", "") or "")
+                usable = _is_usable_article_html(url, html)
+                blocked = _looks_like_cloudflare_block(html)
+                if html and usable and status != 403:
+                    source = "direct"
+                    if "/wp-json/" in url or url.rstrip("/").endswith("/feed"):
+                        print(f"[irrawaddy] meta direct status={status} content_type={content_type} url={url}")
+                else:
+                    if html and (_is_article_url(url) or blocked or status == 403):
+                        print(
+                            f"[irrawaddy-html] direct fallback status={status} usable={usable} "
+                            f"cf={blocked} url={url}"
+                        )
+                    html = ""
+            except Exception as e:
+                print(f"[irrawaddy] direct fetch fail {url}: {e}")
                 html = ""
-        except Exception as e:
-            print(f"[irrawaddy] direct fetch fail {url}: {e}")
-            html = ""
-            status = None
+                status = None
+            if not getattr(res, "from_cache", False):  # キャッシュ命中は実績に数えない
+                router.record(url, "direct", ok=bool(html), latency=time.time() - t0)
+
+        if not html and defer_unlocker:
+            direct_failed.add(url)
+            return "", status, "deferred"
 
         if not html:
+            t0 = time.time()
             try:
-                html = fetch_html_via_brightdata_unlocker(url, timeout=BD_UNLOCKER_TIMEOUT) or ""
+                if url in unlocker_prefetch:
+                    html, elapsed = unlocker_prefetch.pop(url)
+                    t0 = time.time() - elapsed
+                else:
+                    html = fetch_html_via_brightdata_unlocker(url, timeout=BD_UNLOCKER_TIMEOUT) or ""
                 if html and _is_usable_article_html(url, html):
                     source = "unlocker"
                 else:
@@ -1907,10 +2006,16 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
             except Exception as e:
                 print(f"[irrawaddy] unlocker fetch fail {url}: {e}")
                 html = ""
+            router.record(url, "unlocker", ok=bool(html), latency=time.time() - t0)
 
         if not html and allow_browser:
+            t0 = time.time()
             try:
-                html = fetch_html_via_brightdata_browser(url) or ""
+                if url in browser_prefetch:
+                    html, elapsed = browser_prefetch.pop(url)
+                    t0 = time.time() - elapsed
+                else:
+                    html = fetch_html_via_brightdata_browser(url) or ""
                 if html and _is_usable_article_html(url, html):
                     source = "browser"
                 else:
@@ -1919,6 +2024,7 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
                     html = ""
             except Exception as e:
                 print(f"[irrawaddy] browser fetch fail {url}: {e}")
+            router.record(url, "browser", ok=bool(html), latency=time.time() - t0)
 
         html_fetch_cache[cache_key] = {
             "html": html,
@@ -1926,7 +2032,76 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
             "source": source,
         }
         return html, status, source
-    
+
+    def _prefetch_irrawaddy_articles(urls: List[str], *, session=None) -> None:
+        """
+        候補記事HTMLを先にまとめて取得して html_fetch_cache を温める。
+        direct は fanout で並列、direct で取れなかった分は Web Unlocker の
+        fetch_many で1回の並列ウェーブにまとめ、それでも使えない分は Browser API の
+        プールで並列に取っておく（記事ループ側はその結果を使う）。
+        """
+        todo = [
+            u for u in dict.fromkeys(urls)
+            if u and not _is_excluded_url(u) and (u, True) not in html_fetch_cache
+        ]
+        if len(todo) < 2:
+            return
+
+        # requests.Session はスレッド間で共有しないよう、スレッドごとに作る（Cookie は共有セッションから引き継ぐ）
+        session_local = threading.local()
+
+        def _thread_session():
+            if session is None:
+                return None
+            sess_ = getattr(session_local, "session", None)
+            if sess_ is None:
+                sess_ = requests.Session()
+                sess_.headers.update(session.headers)
+                sess_.cookies.update(session.cookies)
+                session_local.session = sess_
+            return sess_
+
+        results = fanout_ordered(
+            todo,
+            lambda u: _fetch_irrawaddy_html_cached(
+                u, session=_thread_session(), allow_browser=True, defer_unlocker=True
+            ),
+            label="irrawaddy-direct",
+        )
+        deferred = [
+            u for u, res in zip(todo, results)
+            if res is None or res[2] == "deferred"
+        ]
+        print(f"[irrawaddy] prefetch direct ok={len(todo) - len(deferred)} deferred={len(deferred)}")
+        if not deferred:
+            return
+
+        # 所要秒は URL ごとの実測（ルーターのドメイン別レイテンシにバッチ全体の時間を入れない）
+        t0 = time.time()
+        fetched_unlocker = fetch_many_via_brightdata_unlocker(
+            deferred, timeout=BD_UNLOCKER_TIMEOUT, with_latency=True
+        )
+        for u, (h, sec) in zip(deferred, fetched_unlocker):
+            unlocker_prefetch[u] = (h or "", sec)
+        print(
+            f"[irrawaddy] prefetch unlocker ok={sum(1 for h, _ in fetched_unlocker if h)}/{len(deferred)} "
+            f"sec={time.time() - t0:.1f}"
+        )
+
+        need_browser = [
+            u for u, (h, _) in zip(deferred, fetched_unlocker) if not _is_usable_article_html(u, h or "")
+        ]
+        if not need_browser:
+            return
+        t0 = time.time()
+        fetched = fetch_html_via_brightdata_browser_many(need_browser)
+        for u, (h, sec) in zip(need_browser, fetched):
+            browser_prefetch[u] = (h or "", sec)
+        print(
+            f"[irrawaddy] prefetch browser ok={sum(1 for h, _ in fetched if h)}/{len(need_browser)} "
+            f"sec={time.time() - t0:.1f}"
+        )
+
     sess = _make_pooled_session()
 
     def _is_excluded_url(href: str) -> bool:
@@ -2337,7 +2512,7 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
                 continue
             if debug:
                 print(f"[irrawaddy][list] fetched: {url} status={status_code} source={source} bytes={len(html)}")
-            soup = BeautifulSoup(html, "html.parser")
+            soup = make_soup(html)
             if debug:
                 title_txt = (soup.title.get_text(strip=True) if soup.title else "")
                 c_hero = len(soup.select('.jnews_category_hero_container'))
@@ -2392,7 +2567,7 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
                 raise Exception(f"home html fetch failed (status={status_home}, source={source_home})")
             if debug:
                 print(f"[irrawaddy][home] fetched: / status={status_home} source={source_home} bytes={len(html_home)}")
-            soup_home = BeautifulSoup(html_home, "html.parser")
+            soup_home = make_soup(html_home)
             home_scope = soup_home.select_one(
                 'div.elementor-element-kuDRpuo[data-id="kuDRpuo"], '
                 "div.elementor-element-kuDRpuo, "
@@ -2465,6 +2640,7 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
             print(f"  - {u}")
 
     # 2) 各候補記事の meta 日付を MMT で厳密確認し、タイトル/本文を抽出
+    _prefetch_irrawaddy_articles(candidate_urls, session=session)
     for url in candidate_urls:
         if _is_excluded_url(url):
             continue
@@ -2485,7 +2661,7 @@ def collect_irrawaddy_all_for_date(target_date_mmt: date, debug: bool = False) -
                     )
                     raise Exception(f"html fetch failed (status={status_code}, source={source})")
 
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html)
                 meta_date = _article_date_from_meta_mmt(soup)
 
                 print(
@@ -2685,16 +2861,21 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
     # --- fetch helpers（先に定義：RSS/GoogleNewsが使う） ---
     def _fetch_text(url: str, timeout: int = 20) -> str:
         try:
-            r = sess.get(
+            r = http_cache_fetch(
                 url,
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/128.0.0.0 Safari/537.36"
-                    )
-                },
-                timeout=timeout,
+                lambda h: sess.get(
+                    url,
+                    headers={
+                        "User-Agent": (
+                            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                            "AppleWebKit/537.36 (KHTML, like Gecko) "
+                            "Chrome/128.0.0.0 Safari/537.36"
+                        ),
+                        **h,
+                    },
+                    timeout=timeout,
+                ),
+                validate=lambda r: bool((r.text or "").strip()),
             )
             if r.status_code == 200 and (r.text or "").strip():
                 return r.text
@@ -2745,7 +2926,7 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
         if not html or _gnlm_looks_like_blocked_page(html):
             return False
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         if kind == "list":
             return bool(soup.select("article.archives-page"))
 
@@ -2766,20 +2947,30 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
             return True
         return any(_gnlm_div_looks_like_paragraph(div) for div in content.find_all("div"))
 
-    def _fetch_gnlm_via_brightdata(url: str, *, kind: str, allow_browser: bool = True) -> tuple[str, str]:
+    def _fetch_gnlm_via_brightdata(
+        url: str,
+        *,
+        kind: str,
+        allow_browser: bool = True,
+        unlocker_html: Optional[str] = None,
+        browser_html: Optional[str] = None,
+    ) -> tuple[str, str]:
         """
         GNLM専用 BrightData fallback。
         curl_cffi → cloudscraper の後に呼ぶ想定で、Irrawaddy と同じ順番で
         Web Unlocker → Browser API を試す。
+        unlocker_html / browser_html を渡した場合は、それぞれ叩かずにその結果を使う（fetch_many の先取り分）。
         戻り値: (html, source) source は unlocker/browser/none。
         """
         # 1) BrightData Web Unlocker
         try:
-            html = (fetch_html_via_brightdata_unlocker(
-                url,
-                timeout=BD_UNLOCKER_TIMEOUT,
-                retry_once=False,
-            ) or "").strip()
+            if unlocker_html is None:
+                unlocker_html = fetch_html_via_brightdata_unlocker(
+                    url,
+                    timeout=BD_UNLOCKER_TIMEOUT,
+                    retry_once=False,
+                )
+            html = (unlocker_html or "").strip()
             if _gnlm_html_usable(html, kind=kind):
                 print(f"[gnlm] brightdata unlocker ok kind={kind} len={len(html)} url={url}")
                 return html, "unlocker"
@@ -2794,7 +2985,9 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
         # 2) BrightData Browser API
         if allow_browser:
             try:
-                html = (fetch_html_via_brightdata_browser(url) or "").strip()
+                if browser_html is None:
+                    browser_html = fetch_html_via_brightdata_browser(url)
+                html = (browser_html or "").strip()
                 if _gnlm_html_usable(html, kind=kind):
                     print(f"[gnlm] brightdata browser ok kind={kind} len={len(html)} url={url}")
                     return html, "browser"
@@ -2905,7 +3098,7 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
         if not _gnlm_html_usable(html, kind="epaper"):
             return [], epaper_url
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
 
         links = []
         for sel in ('a.read-epaper[href]', 'a.download[href]', 'a[href$=".pdf"]'):
@@ -3680,6 +3873,7 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
         if not out:
             return out
 
+        targets = []
         for it in out:
             if (it.get("body") or "").strip():
                 continue
@@ -3692,18 +3886,44 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
             if _gnlm_is_epaper_page_url(url):
                 it["_gnlm_body_source"] = it.get("_gnlm_body_source") or "epaper_page_no_article_body"
                 continue
+            targets.append((it, url))
+
+        if not targets:
+            return out
 
+        # Unlocker は対象URLをまとめて1回の並列ウェーブで取得（Browser API は取れなかった分だけ）
+        prefetched = dict(zip(
+            [u for _, u in targets],
+            fetch_many_via_brightdata_unlocker(
+                [u for _, u in targets],
+                timeout=BD_UNLOCKER_TIMEOUT,
+                retry_once=False,
+            ),
+        ))
+
+        # Unlocker で使えるHTMLが取れなかった分は Browser API のプールで並列に取る
+        need_browser = [
+            u for _, u in targets
+            if not _gnlm_html_usable((prefetched.get(u) or "").strip(), kind="article")
+        ]
+        browser_prefetched = {
+            u: h for u, (h, _sec) in zip(need_browser, fetch_html_via_brightdata_browser_many(need_browser))
+        } if need_browser else {}
+
+        for it, url in targets:
             try:
                 html, bd_source = _fetch_gnlm_via_brightdata(
                     url,
                     kind="article",
                     allow_browser=True,
+                    unlocker_html=prefetched.get(url, ""),
+                    browser_html=browser_prefetched.get(url),
                 )
                 if not html:
                     print(f"[gnlm-bd] no html after pdf fallback url={url}")
                     continue
 
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html)
                 body = _gnlm_extract_body_from_article_soup(soup)
                 if not body:
                     print(
@@ -3930,7 +4150,7 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
                     res = SimpleNamespace(status_code=200, text=bd_html, content=bd_html.encode("utf-8", "ignore"), url=list_url)
                     print(f"[gnlm] list fetch recovered via brightdata source={bd_source} url={list_url}")
 
-            soup = BeautifulSoup(res.text, "html.parser")
+            soup = make_soup(res.text)
             articles = soup.select("article.archives-page")
             if not articles:
                 break
@@ -4003,7 +4223,7 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
                 # PDFより先に、個別記事HTMLをBrightDataで取得する。PDFは最後の手段。
                 bd_html, bd_source = _fetch_gnlm_via_brightdata(url, kind="article", allow_browser=True)
                 if bd_html:
-                    soup = BeautifulSoup(bd_html, "html.parser")
+                    soup = make_soup(bd_html)
                     art_date = _article_date_from_meta_mmt(soup) or target_date_mmt
                     title = _extract_title(soup)
                     if not title:
@@ -4037,7 +4257,7 @@ def collect_gnlm_all_for_date(target_date_mmt: date, max_pages: int = 3) -> List
                     })
                 continue
 
-        soup = BeautifulSoup(res.text, "html.parser")
+        soup = make_soup(res.text)
 
         art_date = _article_date_from_meta_mmt(soup) or target_date_mmt
 
@@ -4134,7 +4354,11 @@ def collect_popular_all_for_date(
 
     session = _make_pooled_session()
     try:
-        res = session.get(rss_url, timeout=15)
+        res = http_cache_fetch(
+            rss_url,
+            lambda h: session.get(rss_url, timeout=15, headers=h),
+            validate=http_cache_marker_validator("<item"),
+        )
         res.raise_for_status()
     except Exception as e:
         print(f"[popular] RSS取得失敗: {e}")
@@ -4181,7 +4405,7 @@ def collect_popular_all_for_date(
             continue
 
         html = getattr(res, "content", None) or getattr(res, "text", "")
-        article = BeautifulSoup(html, "html.parser")
+        article = make_soup(html)
 
         # --- タイトル抽出: og:title → h1.entry-title → <title> ---
         title = ""
@@ -4354,7 +4578,7 @@ def collect_frontier_all_for_date(
         if kind == "json":
             return html.lstrip().startswith("[") or html.lstrip().startswith("{")
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         if kind == "list":
             if soup.select('a[href*="frontiermyanmar.net/en/"]'):
                 return True
@@ -4690,7 +4914,7 @@ def collect_frontier_all_for_date(
                 urls.append(cu)
 
         try:
-            soup = BeautifulSoup(payload or "", "html.parser")
+            soup = make_soup(payload or "")
             for a in soup.select("a[href]"):
                 if _anchor_in_excluded_frontier_section(a):
                     continue
@@ -4890,7 +5114,7 @@ def collect_frontier_all_for_date(
 
     def _clean_html_text(s: str) -> str:
         try:
-            txt = BeautifulSoup(s or "", "html.parser").get_text(" ", strip=True)
+            txt = make_soup(s or "").get_text(" ", strip=True)
         except Exception:
             txt = s or ""
         txt = re.sub(r"\s+", " ", txt).strip()
@@ -5187,7 +5411,7 @@ def collect_frontier_all_for_date(
                 if debug:
                     print(f"[frontier] list-candidate article fetch failed url={u}")
                 continue
-            article = BeautifulSoup(html, "html.parser")
+            article = make_soup(html)
             if _frontier_article_is_excluded(article, u):
                 if debug:
                     print(f"[frontier] list-candidate excluded podcast url={u}")
@@ -5283,7 +5507,7 @@ def collect_frontier_all_for_date(
 
         if html:
             try:
-                article = BeautifulSoup(html, "html.parser")
+                article = make_soup(html)
                 if _frontier_article_is_excluded(article, url):
                     if debug:
                         print(f"[frontier] skip excluded podcast article origin={item.get('origin')} url={url}")
@@ -5475,7 +5699,7 @@ def collect_jetro_biznews_mm_all_for_date(
     try:
         r = sess.get(LIST_URL, timeout=15)
         r.raise_for_status()
-        soup = BeautifulSoup(r.content, "html.parser")
+        soup = make_soup(r.content)
         for a in soup.select(f"ul#recordList{block_id}-{tag_id} li.record a[href]"):
             add_candidate(a.get("href") or "")
     except Exception as e:
@@ -5518,7 +5742,7 @@ def collect_jetro_biznews_mm_all_for_date(
             ar = sess.get(url, timeout=20)
             if ar.status_code != 200:
                 continue
-            soup = BeautifulSoup(ar.content, "html.parser")
+            soup = make_soup(ar.content)
 
             pub = _jetro_publicize_date_from_article_html(soup)
             if not pub or pub != target_date_mmt:
@@ -5703,7 +5927,7 @@ def collect_news_eleven_all_for_date(target_date_mmt: date) -> List[Dict]:
         print(f"[news-eleven] list fail {list_url} source={list_source}")
         return []
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     # 「Most Recent」セクションのみ対象
     recent_scope = soup.select_one("section.pane-recent-news")
@@ -5741,7 +5965,7 @@ def collect_news_eleven_all_for_date(target_date_mmt: date) -> List[Dict]:
                 print(f"[news-eleven] article fail {url} source={article_source}")
                 continue
 
-            article_soup = BeautifulSoup(article_html, "html.parser")
+            article_soup = make_soup(article_html)
 
             article_date = _extract_news_eleven_date_mmt(article_soup)
             if article_date != target_date_mmt: